@@ -0,0 +1,15 @@
+"""Shared environment loading for the examples."""
+
+from functools import cache
+
+
+@cache
+def ensure_env() -> None:
+    """Load ``.env`` into the environment once per process.
+
+    Examples imported together (tests, notebooks) share the first parse instead of re-reading
+    the file. Variables already set in the environment are not overridden.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
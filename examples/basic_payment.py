@@ -1,49 +1,56 @@
 import asyncio
+import atexit
+import logging
+import os
 import time
-from pprint import pprint
 
-from dotenv import load_dotenv
+from _env import ensure_env
 
 from payos import APIError, AsyncPayOS, PayOS
 from payos.types import CreatePaymentLinkRequest
 
 # Assume that credentials have been set in environment
 # If not, you must provide them when init client
-load_dotenv()
+ensure_env()
 
+# Responses are only formatted when the level is enabled; set LOGLEVEL=WARNING to silence them
+logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO"))
+log = logging.getLogger("payos.examples")
 
-def sync_main() -> None:
-    client = PayOS()
-    payment_data = CreatePaymentLinkRequest(
+# Reuse one client (and its connection pool) for every call in this module.
+# Transient failures (408, 429, 5xx, timeouts) are retried by the SDK with exponential
+# backoff and jitter, honoring Retry-After; raise max_retries for flaky networks.
+client = PayOS(max_retries=5)
+atexit.register(client.close)
+
+
+def build_payment_data() -> CreatePaymentLinkRequest:
+    return CreatePaymentLinkRequest(
         order_code=int(time.time()),
         amount=2000,
         description="Thanh toan",
         cancel_url="https://your-url.com/cancel",
         return_url="https://your-url.com/success",
     )
+
+
+def sync_main() -> None:
+    payment_data = build_payment_data()
     try:
         response = client.payment_requests.create(payment_data=payment_data)
-        pprint(response)
+        log.info("Payment link created: %s", response)
     except APIError as e:
-        pprint(e.error_code)
-        pprint(e.error_desc)
-        pprint(e.status_code)
+        log.error("API error %s: %s (%s)", e.status_code, e.error_code, e.error_desc)
 
 
 async def async_main() -> None:
-    client = AsyncPayOS()
-    payment_data = CreatePaymentLinkRequest(
-        order_code=int(time.time()),
-        amount=2000,
-        description="Thanh toan",
-        cancel_url="https://your-url.com/cancel",
-        return_url="https://your-url.com/success",
-    )
-    try:
-        response = await client.payment_requests.create(payment_data=payment_data)
-        pprint(response)
-    except APIError as e:
-        pprint(e)
+    payment_data = build_payment_data()
+    async with AsyncPayOS(max_retries=5) as async_client:
+        try:
+            response = await async_client.payment_requests.create(payment_data=payment_data)
+            log.info("Payment link created: %s", response)
+        except APIError as e:
+            log.error("API error: %s", e)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,17 @@
+import atexit
 import time
 
-from dotenv import load_dotenv
+from _env import ensure_env
 
 from payos import APIError, PayOS
 from payos.types import CreatePaymentLinkRequest, InvoiceRequest, ItemData
 
 # Assume that credentials have been set in environment
 # If not, you must provide them when init client
-load_dotenv()
+ensure_env()
+
+client = PayOS()
+atexit.register(client.close)
 
 
 def sync_main() -> None:
@@ -16,8 +20,9 @@ def sync_main() -> None:
     This shows how to create professional invoices with multiple items and tax calculations
     The invoice only created if the payment gateway is connected to an invoice integration
     """
-    client = PayOS()
-    order_code = int(time.time())
+    # Read the clock once so order_code and expired_at agree on the same second
+    now = int(time.time())
+    order_code = now
 
     try:
         print("Creating payment link with detailed invoice...")
@@ -70,7 +75,7 @@ def sync_main() -> None:
             items=items,
             # Invoice configuration
             invoice=invoice,
-            expired_at=int(time.time()) + 60 * 60,  # Expired in 1 hour
+            expired_at=now + 60 * 60,  # Expired in 1 hour
         )
 
         payment_link = client.payment_requests.create(payment_data=payment_data)
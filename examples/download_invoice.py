@@ -1,45 +1,69 @@
+import asyncio
 import os
-from dotenv import load_dotenv
-from payos import PayOS, APIError
 
-load_dotenv()
+from _env import ensure_env
 
-client = PayOS()
+from payos import APIError, AsyncPayOS
 
+ensure_env()
 
-def download_invoice(payment_link_id: str, invoice_id: str):
-    try:
-        file_response = client.payment_requests.invoices.download(invoice_id, payment_link_id)
-        download_dir = "./examples/downloads"
-        os.makedirs(download_dir, exist_ok=True)
-        if file_response.filename:
-            filepath = file_response.save_to_directory(download_dir)
-        else:
-            filepath = os.path.join(download_dir, f"invoice_{invoice_id}.pdf")
-            file_response.save_to_file(filepath)
-        print(f"Download to: {filepath}")
-        print(f"Size: {file_response.size:,} bytes")
-    except APIError as e:
-        print(f"API error: {e}")
-    except Exception as e:
-        print(f"Unexpected error: {e}")
+DOWNLOAD_DIR = "./examples/downloads"
+# Cap in-flight downloads to stay clear of rate limits
+MAX_CONCURRENT_DOWNLOADS = 8
 
 
-def main() -> None:
+def cached_invoice_path(invoice_id: str) -> str:
+    return os.path.join(DOWNLOAD_DIR, f"invoice_{invoice_id}.pdf")
+
+
+async def download_invoice(
+    client: AsyncPayOS, semaphore: asyncio.Semaphore, payment_link_id: str, invoice_id: str
+):
+    # Issued invoices never change, so a non-empty local copy can be reused as-is
+    filepath = cached_invoice_path(invoice_id)
+    if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
+        print(f"Cached: {filepath}")
+        return
+
+    async with semaphore:
+        try:
+            # stream_download only puts the file in place once it is complete, so an
+            # interrupted download is never mistaken for a cached invoice
+            await client.payment_requests.invoices.stream_download(
+                invoice_id, payment_link_id, filepath
+            )
+            print(f"Download to: {filepath}")
+            print(f"Size: {os.path.getsize(filepath):,} bytes")
+        except APIError as e:
+            print(f"API error: {e}")
+        except Exception as e:
+            print(f"Unexpected error: {e}")
+
+
+async def main() -> None:
     payment_link_id = "b9253e3efd8a4196b521fe3eb0808478"
-    try:
-        invoices_info = client.payment_requests.invoices.get(payment_link_id)
-        print(f"Retrieve {len(invoices_info.invoices)} invoices")
-        for invoice in invoices_info.invoices:
-            print(f"Invoice ID: {invoice.invoice_id}")
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+    async with AsyncPayOS() as client:
+        try:
+            invoices_info = await client.payment_requests.invoices.get(payment_link_id)
+            print(f"Retrieve {len(invoices_info.invoices)} invoices")
+            for invoice in invoices_info.invoices:
+                print(f"Invoice ID: {invoice.invoice_id}")
 
-            if invoice.code_of_tax:
-                download_invoice(payment_link_id, invoice.invoice_id)
-    except APIError as e:
-        print(f"API error: {e}")
-    except Exception as e:
-        print(f"Unexpected error: {e}")
+            # Download all taxed invoices concurrently over the shared connection pool
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+            await asyncio.gather(
+                *(
+                    download_invoice(client, semaphore, payment_link_id, invoice.invoice_id)
+                    for invoice in invoices_info.invoices
+                    if invoice.code_of_tax
+                )
+            )
+        except APIError as e:
+            print(f"API error: {e}")
+        except Exception as e:
+            print(f"Unexpected error: {e}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,17 +1,20 @@
+import atexit
 import time
 
-from dotenv import load_dotenv
+from _env import ensure_env
 
 from payos import NotFoundError, PayOS
 from payos.types import CreatePaymentLinkRequest
 
 # Assume that credentials have been set in environment
 # If not, you must provide them when init client
-load_dotenv()
+ensure_env()
+
+client = PayOS(max_retries=5)
+atexit.register(client.close)
 
 
 def main() -> None:
-    client = PayOS()
     order_code = int(time.time())
 
     try:
@@ -1,13 +1,131 @@
+import asyncio
+import atexit
+import logging
 import os
+import sys
 import time
-from pprint import pprint
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional
 
-from dotenv import load_dotenv
+import httpx
+from _env import ensure_env
+from pydantic import TypeAdapter
 
-from payos import APIError, PayOS
+from payos import APIError, AsyncPayOS, ConnectionError, ConnectionTimeoutError, PayOS
 from payos.types import GetPayoutListParams, PayoutBatchItem, PayoutBatchRequest
 
-load_dotenv()
+ensure_env()
+
+logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO"))
+log = logging.getLogger("payos.examples")
+
+# Payout client with its own credentials and its own bounded connection pool (a bulkhead), so a
+# payout spike cannot exhaust the connections used by the payment request client of the app
+payout_client = PayOS(
+    client_id=os.getenv("PAYOS_PAYOUT_CLIENT_ID"),
+    api_key=os.getenv("PAYOS_PAYOUT_API_KEY"),
+    checksum_key=os.getenv("PAYOS_PAYOUT_CHECKSUM_KEY"),
+    max_retries=5,
+    http_limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+)
+atexit.register(payout_client.close)
+
+# Validate the whole batch in one call instead of constructing each item separately
+payout_items_adapter = TypeAdapter(list[PayoutBatchItem])
+
+
+def build_payout_items(reference_id: str, count: int) -> list[PayoutBatchItem]:
+    return payout_items_adapter.validate_python(
+        [
+            {
+                "reference_id": f"{reference_id}_{index}",
+                "amount": 2000,
+                "description": "batch payout",
+                "to_bin": "970422",
+                "to_account_number": "0123456789",
+            }
+            for index in range(count)
+        ]
+    )
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit for its endpoint is open."""
+
+
+class CircuitBreaker:
+    """Minimal closed/open/half-open circuit breaker, tracked per endpoint.
+
+    After ``fail_threshold`` consecutive transient failures the circuit opens and calls
+    fail fast (or return the fallback) until ``reset_timeout`` seconds have passed, then a
+    single trial call is let through to decide whether to close it again.
+    """
+
+    def __init__(self, fail_threshold: int = 5, reset_timeout: float = 10.0) -> None:
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+
+    def call(
+        self, endpoint: str, func: Callable[[], Any], fallback: Optional[Callable[[], Any]] = None
+    ) -> Any:
+        if self._is_open(endpoint):
+            if fallback is not None:
+                return fallback()
+            raise CircuitOpenError(f"Circuit open for {endpoint}")
+
+        try:
+            result = func()
+        except Exception as error:
+            self._record_failure(endpoint, error)
+            raise
+
+        self._record_success(endpoint)
+        return result
+
+    async def acall(
+        self,
+        endpoint: str,
+        func: Callable[[], Awaitable[Any]],
+        fallback: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """Async counterpart of ``call`` for coroutine functions."""
+        if self._is_open(endpoint):
+            if fallback is not None:
+                return fallback()
+            raise CircuitOpenError(f"Circuit open for {endpoint}")
+
+        try:
+            result = await func()
+        except Exception as error:
+            self._record_failure(endpoint, error)
+            raise
+
+        self._record_success(endpoint)
+        return result
+
+    def _is_open(self, endpoint: str) -> bool:
+        opened_at = self._opened_at.get(endpoint)
+        return opened_at is not None and time.monotonic() - opened_at < self.reset_timeout
+
+    def _record_failure(self, endpoint: str, error: Exception) -> None:
+        # Only server-side and transport failures count, client errors (4xx) do not
+        if isinstance(error, (ConnectionError, ConnectionTimeoutError)) or (
+            isinstance(error, APIError) and (error.status_code or 0) >= 500
+        ):
+            failures = self._failures.get(endpoint, 0) + 1
+            self._failures[endpoint] = failures
+            # A failed trial call after the reset timeout opens the circuit again right away
+            if endpoint in self._opened_at or failures >= self.fail_threshold:
+                self._opened_at[endpoint] = time.monotonic()
+
+    def _record_success(self, endpoint: str) -> None:
+        self._failures.pop(endpoint, None)
+        self._opened_at.pop(endpoint, None)
+
+
+breaker = CircuitBreaker(fail_threshold=5, reset_timeout=10.0)
 
 
 def sync_main() -> None:
@@ -15,41 +133,12 @@ def sync_main() -> None:
     Example demonstrating payout operations (synchronous).
     Note: Payout credentials are different from payment request credentials.
     """
-    # Initialize PayOS client with payout credentials
-    client = PayOS(
-        client_id=os.getenv("PAYOS_PAYOUT_CLIENT_ID"),
-        api_key=os.getenv("PAYOS_PAYOUT_API_KEY"),
-        checksum_key=os.getenv("PAYOS_PAYOUT_CHECKSUM_KEY"),
-    )
-
     try:
         print("Creating a batch payout...")
         reference_id = f"payout_{int(time.time())}"
 
         # Create payout batch items
-        payout_items = [
-            PayoutBatchItem(
-                reference_id=f"{reference_id}_0",
-                amount=2000,
-                description="batch payout",
-                to_bin="970422",
-                to_account_number="0123456789",
-            ),
-            PayoutBatchItem(
-                reference_id=f"{reference_id}_1",
-                amount=2000,
-                description="batch payout",
-                to_bin="970422",
-                to_account_number="0123456789",
-            ),
-            PayoutBatchItem(
-                reference_id=f"{reference_id}_2",
-                amount=2000,
-                description="batch payout",
-                to_bin="970422",
-                to_account_number="0123456789",
-            ),
-        ]
+        payout_items = build_payout_items(reference_id, 3)
 
         # Create batch payout request
         payout_batch_request = PayoutBatchRequest(
@@ -60,30 +149,44 @@ def sync_main() -> None:
         )
 
         # Create the batch payout
-        payout_batch = client.payouts.batch.create(payout_batch_request)
-        print("Payout detail:")
-        pprint(payout_batch)
+        payout_batch = breaker.call(
+            "payouts.batch.create", lambda: payout_client.payouts.batch.create(payout_batch_request)
+        )
+        log.info("Payout detail: %s", payout_batch)
 
         print("\nFetching recent payouts...")
         # List recent payouts
-        payouts_page = client.payouts.list(params=GetPayoutListParams(limit=10, offset=20))
-        payouts = []
-        for payout in payouts_page.to_list():
-            payouts.append(payout.model_dump_camel_case())
+        payouts = breaker.call(
+            "payouts.list",
+            lambda: [
+                payout.model_dump_camel_case()
+                for payout in payout_client.payouts.list(
+                    params=GetPayoutListParams(limit=10, offset=20)
+                ).to_list()
+            ],
+            fallback=list,
+        )
 
         if len(payouts) == 0:
             print("No payouts found")
         else:
-            print("Payouts retrieved:")
-            pprint(payouts)
+            log.info("Payouts retrieved: %s", payouts)
 
         print("\nFetching payout account balance...")
         # Get account balance
-        account_info = client.payouts_account.balance()
+        account_info = breaker.call(
+            "payouts_account.balance",
+            payout_client.payouts_account.balance,
+            fallback=lambda: None,
+        )
 
-        print("Account Information:")
-        pprint(account_info)
+        if account_info is None:
+            print("Account balance temporarily unavailable")
+        else:
+            log.info("Account information: %s", account_info)
 
+    except CircuitOpenError as error:
+        print(f"Service degraded, skipping call: {error}")
     except APIError as error:
         print(f"API Error: {error}")
         print(f"Status Code: {error.status_code}")
@@ -93,5 +196,68 @@ def sync_main() -> None:
         print(f"Unexpected error: {error}")
 
 
+async def async_main() -> None:
+    """
+    Example demonstrating payout operations (asynchronous).
+    The batch, list and balance calls do not depend on each other, so they run concurrently.
+    """
+    reference_id = f"payout_async_{int(time.time())}"
+    payout_batch_request = PayoutBatchRequest(
+        reference_id=reference_id,
+        category=["salary"],
+        validate_destination=True,
+        payouts=build_payout_items(reference_id, 3),
+    )
+
+    async with AsyncPayOS(
+        client_id=os.getenv("PAYOS_PAYOUT_CLIENT_ID"),
+        api_key=os.getenv("PAYOS_PAYOUT_API_KEY"),
+        checksum_key=os.getenv("PAYOS_PAYOUT_CHECKSUM_KEY"),
+        max_retries=5,
+        http_limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    ) as async_client:
+
+        async def list_payouts() -> list[Any]:
+            payouts_page = await async_client.payouts.list(
+                params=GetPayoutListParams(limit=10, offset=20)
+            )
+            return await payouts_page.to_list()
+
+        # Calls go through the circuit breaker just like in the sync example
+        results = await asyncio.gather(
+            breaker.acall(
+                "payouts.batch.create",
+                lambda: async_client.payouts.batch.create(payout_batch_request),
+            ),
+            breaker.acall("payouts.list", list_payouts, fallback=list),
+            breaker.acall(
+                "payouts_account.balance",
+                async_client.payouts_account.balance,
+                fallback=lambda: None,
+            ),
+            return_exceptions=True,
+        )
+        payout_batch, payouts, account_info = results
+
+    for label, result in (
+        ("Payout detail", payout_batch),
+        ("Payouts retrieved", payouts),
+        ("Account Information", account_info),
+    ):
+        if isinstance(result, CircuitOpenError):
+            print(f"{label}: service degraded, skipped: {result}")
+        elif isinstance(result, APIError):
+            print(f"{label}: API Error {result.status_code} {result.error_code}")
+        elif isinstance(result, Exception):
+            print(f"{label}: unexpected error: {result}")
+        else:
+            log.info("%s: %s", label, result)
+
+
 if __name__ == "__main__":
-    sync_main()
+    # Each run submits a real payout batch, so only one variant runs: pass --async for the
+    # asynchronous one
+    if "--async" in sys.argv[1:]:
+        asyncio.run(async_main())
+    else:
+        sync_main()
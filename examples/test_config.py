@@ -1,13 +1,21 @@
+import atexit
 import os
-import httpx
 from time import time
-from dotenv import load_dotenv
+
+import httpx
+from _env import ensure_env
 
 from payos import PayOS
 
-load_dotenv()
+ensure_env()
 
-client = PayOS()
+# Raise the pool limits when many callers share this client concurrently
+client = PayOS(
+    http_limits=httpx.Limits(
+        max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0
+    )
+)
+atexit.register(client.close)
 
 response = client.post(
     "/v2/payment-requests",
@@ -1,11 +1,11 @@
+import atexit
 import os
 
-from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from _env import ensure_env
 
 from payos import PayOS, WebhookError
 
-load_dotenv()
+ensure_env()
 
 # To verify webhooks locally you need a public HTTPS endpoint. Use a tunneling tool like ngrok:
 # 1. Install ngrok.
@@ -19,26 +19,59 @@ load_dotenv()
 # Notes:
 # - Ensure PAYOS_CLIENT_ID, PAYOS_API_KEY and PAYOS_CHECKSUM_KEY are set in your .env.
 # - When reloading dev server, restart ngrok only if the public URL changes.
+# - `python examples/webhooks_handling.py` serves the app with waitress (threaded) when it is
+#   installed. Other production servers work too, e.g.
+#       gunicorn -w 4 -k gthread --threads 8 --chdir examples 'webhooks_handling:create_app()'
 
-app = Flask(__name__)
-client = PayOS(
-    client_id=os.getenv("PAYOS_CLIENT_ID"),
-    api_key=os.getenv("PAYOS_API_KEY"),
-    checksum_key=os.getenv("PAYOS_CHECKSUM_KEY"),
-)
+# payOS webhook payloads are a few KB; refuse anything far larger before reading it
+MAX_WEBHOOK_BODY_SIZE = 64 * 1024
+READ_CHUNK_SIZE = 8 * 1024
 
 
-@app.route("/webhooks", methods=["POST"])
-def webhooks():
-    data = request.get_data()
+def create_app():
+    # Flask is imported here so importing this module (e.g. to reuse the constants) stays cheap
+    from flask import Flask, abort, jsonify, request
 
-    try:
-        webhook_data = client.webhooks.verify(data)
-    except WebhookError as e:
-        return jsonify({"error": str(e)}), 400
+    app = Flask(__name__)
+    app.config["MAX_CONTENT_LENGTH"] = MAX_WEBHOOK_BODY_SIZE
+    client = PayOS(
+        client_id=os.getenv("PAYOS_CLIENT_ID"),
+        api_key=os.getenv("PAYOS_API_KEY"),
+        checksum_key=os.getenv("PAYOS_CHECKSUM_KEY"),
+    )
+    atexit.register(client.close)
+
+    def read_body() -> bytes:
+        # The signature covers the parsed, key-sorted data fields rather than the raw bytes, so
+        # the body is still needed in full; read it in chunks so oversized payloads stop early.
+        body = bytearray()
+        while chunk := request.stream.read(READ_CHUNK_SIZE):
+            body += chunk
+            if len(body) > MAX_WEBHOOK_BODY_SIZE:
+                abort(413)
+        return bytes(body)
+
+    @app.route("/webhooks", methods=["POST"])
+    def webhooks():
+        data = read_body()
 
-    return jsonify({"error": None, "data": webhook_data.model_dump_camel_case()})
+        try:
+            webhook_data = client.webhooks.verify(data)
+        except WebhookError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return jsonify({"error": None, "data": webhook_data.model_dump_camel_case()})
+
+    return app
 
 
 if __name__ == "__main__":
-    app.run(port=int(os.getenv("PORT", 5000)), debug=True)
+    app = create_app()
+    port = int(os.getenv("PORT", 5000))
+    try:
+        from waitress import serve
+    except ImportError:
+        # Werkzeug dev server; threaded so a slow webhook does not block the next one
+        app.run(port=port, debug=True, threaded=True)
+    else:
+        serve(app, port=port, threads=8)
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
-import re
 import sys
 from pathlib import Path
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
 
 def extract_version() -> str:
     pyproject_path = Path("pyproject.toml")
@@ -10,15 +14,15 @@ def extract_version() -> str:
     if not pyproject_path.exists():
         raise FileNotFoundError("pyproject.toml not found")
 
-    content = pyproject_path.read_text()
+    with pyproject_path.open("rb") as f:
+        pyproject = tomllib.load(f)
 
-    # Match version = "x.y.z" pattern
-    version_match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
+    version = pyproject.get("project", {}).get("version")
 
-    if not version_match:
+    if not version:
         raise ValueError("Could not find version in pyproject.toml")
 
-    return version_match.group(1)
+    return str(version)
 
 
 def update_version_file(version: str) -> None:
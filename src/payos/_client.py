@@ -1,10 +1,12 @@
 """Synchronous payOS client."""
 
+import contextlib
 import email.utils
 import json
 import logging
 import random
 import time
+import uuid
 import warnings
 from functools import cached_property
 from types import TracebackType
@@ -17,6 +19,7 @@ from ._core import (
     FileDownloadResponse,
     FinalRequestOptions,
 )
+from ._core._cache import DEFAULT_RESPONSE_CACHE_TTL, ResponseCache
 from ._core.exceptions import (
     APIError,
     ConnectionError,
@@ -24,12 +27,14 @@ from ._core.exceptions import (
     InvalidSignatureError,
     PayOSError,
 )
-from ._core.request_options import RequestOptions
+from ._core.request_options import RequestOptions, download_filepath
 from ._crypto import CryptoProvider
 from ._version import __version__
 from .utils import (
     cast_to as cast_response_to,
     get_env_var,
+    json_dumps,
+    json_loads,
     request_to_dict,
     response_to_dict,
     validate_positive_number,
@@ -68,6 +73,7 @@ log.addFilter(SensitiveHeadersFilter())
 DEFAULT_BASE_URL = "https://api-merchant.payos.vn"
 DEFAULT_TIMEOUT = 60.0
 DEFAULT_MAX_RETRIES = 2
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 class PayOS:
@@ -88,6 +94,11 @@ class PayOS:
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
         http_client: Optional[httpx.Client] = None,
+        http_limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        response_cache: bool = False,
+        response_cache_ttl: Optional[float] = DEFAULT_RESPONSE_CACHE_TTL,
+        crypto: Optional[CryptoProvider] = None,
     ) -> None:
         """Initialize payOS client.
 
@@ -100,6 +111,18 @@ class PayOS:
             timeout: Request timeout in seconds. Defaults to 60.
             max_retries: Maximum number of retries. Defaults to 2.
             http_client: Custom httpx.Client instance.
+            http_limits: Connection pool limits for the default httpx.Client. Ignored when
+                http_client is provided.
+            http2: Negotiate HTTP/2 in the default httpx.Client, so concurrent requests (e.g. page
+                prefetching) are multiplexed over one connection. Requires the ``h2`` package
+                (``pip install "payos[http2]"``). Ignored when http_client is provided.
+            response_cache: Cache the page responses of paginated list calls, including the
+                first page, so revisiting a page does not repeat the request. Any non-GET request to an
+                overlapping path clears the affected entries. Defaults to False.
+            response_cache_ttl: Seconds a cached response is reused before it is requested
+                again, or None to keep it until it is evicted. Defaults to 60.
+            crypto: Crypto provider used for signatures and idempotency keys. Defaults to a new
+                CryptoProvider.
         """
         # Required credentials
         if client_id is None:
@@ -140,11 +163,29 @@ class PayOS:
             validate_positive_number("timeout", self.timeout)
 
         # Set up crypto provider
-        self.crypto = CryptoProvider()
+        self.crypto = crypto if crypto is not None else CryptoProvider()
 
         # Set up HTTP client
-        self._http_client = http_client or httpx.Client()
         self._own_http_client = http_client is None
+        if http_client is None:
+            http_client_kwargs: dict[str, Any] = {}
+            if http_limits is not None:
+                http_client_kwargs["limits"] = http_limits
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError as exc:
+                    raise PayOSError(
+                        "http2=True requires the h2 package; "
+                        'install it with `pip install "payos[http2]"`.'
+                    ) from exc
+                http_client_kwargs["http2"] = True
+            http_client = httpx.Client(**http_client_kwargs)
+        self._http_client = http_client
+
+        self._response_cache: Optional[ResponseCache] = (
+            ResponseCache(ttl=response_cache_ttl) if response_cache else None
+        )
 
     @property
     def user_agent(self) -> str:
@@ -223,10 +264,10 @@ class PayOS:
             pass
 
         if isinstance(body, dict):
-            return json.dumps(body)
+            return json_dumps(body)
 
         try:
-            return json.dumps(body)
+            return json_dumps(body)
         except TypeError:
             return str(body)
 
@@ -246,9 +287,14 @@ class PayOS:
             timeout=self.timeout if not options.timeout else options.timeout,
         )
 
-    def _should_retry(self, response: httpx.Response, retry_count: int) -> bool:
+    def _should_retry(
+        self, response: httpx.Response, retry_count: int, max_retries: Optional[int] = None
+    ) -> bool:
         """Determine if request should be retried."""
-        if retry_count >= self.max_retries:
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        if retry_count >= max_retries:
             return False
 
         if response.status_code in [408, 429] or response.status_code >= 500:
@@ -379,6 +425,8 @@ class PayOS:
     ) -> ResponseT:
         """Make HTTP request with retry logic."""
         max_retries = options.max_retries if options.max_retries is not None else self.max_retries
+        if self._response_cache is not None and options.method.upper() != "GET":
+            self._response_cache.invalidate(options.path or "", options.url)
         request = self._build_request(options=options)
         log.debug("Request options: %s", request_to_dict(request))
 
@@ -386,7 +434,7 @@ class PayOS:
             response = self._http_client.send(request=request)
 
             if not response.is_success:
-                should_retry = self._should_retry(response, retry_count)
+                should_retry = self._should_retry(response, retry_count, max_retries)
 
                 error_data = None
                 try:
@@ -410,7 +458,7 @@ class PayOS:
             log.debug("HTTP Response: %s", response_to_dict(response=response))
 
             try:
-                response_json = response.json()
+                response_json = json_loads(response.content)
             except Exception:
                 raise APIError(
                     f"Invalid JSON response: {response.text[:200]}",
@@ -522,21 +570,7 @@ class PayOS:
                     pass
                 raise APIError.from_response(response, error_data=error_data)
 
-            filename = None
-            content_disposition = response.headers.get("content-disposition")
-            if content_disposition:
-                import re
-
-                match = re.search(r'filename="([^"]+)"', content_disposition)
-                if match:
-                    filename = match.group(1)
-
-            if not filename:
-                from urllib.parse import urlparse
-
-                parsed_url = urlparse(str(request.url))
-                filename = parsed_url.path.split("/")[-1] if parsed_url.path else None
-
+            filename = self._get_download_filename(request, response)
             content_size = len(response.content)
             return FileDownloadResponse(
                 data=response.content,
@@ -555,6 +589,87 @@ class PayOS:
         except Exception:
             raise
 
+    def stream_download(
+        self,
+        path: str,
+        destination: str,
+        *,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        **kwargs: Unpack[RequestOptions],
+    ) -> str:
+        """Stream a file from the API directly to disk.
+
+        If ``destination`` is an existing directory, the file is saved inside it using the
+        filename from the response, otherwise ``destination`` is used as the file path.
+        Returns the path of the written file.
+        """
+        import os
+
+        options = FinalRequestOptions(method="GET", path=path, **kwargs)
+        request = self._build_request(options)
+
+        try:
+            response = self._http_client.send(request=request, stream=True)
+            try:
+                if not response.is_success:
+                    response.read()
+                    error_data = None
+                    try:
+                        error_json = response.json()
+                        error_data = error_json
+                    except Exception:
+                        pass
+                    raise APIError.from_response(response, error_data=error_data)
+
+                filepath = destination
+                if os.path.isdir(destination):
+                    filepath = download_filepath(
+                        destination, self._get_download_filename(request, response)
+                    )
+
+                directory = os.path.dirname(filepath)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+
+                # Write next to the destination and move into place once complete, so a failed
+                # download never leaves a truncated file at ``filepath``
+                partial_path = f"{filepath}.{uuid.uuid4().hex}.part"
+                try:
+                    with open(partial_path, "xb") as f:
+                        for chunk in response.iter_bytes(chunk_size):
+                            f.write(chunk)
+                    os.replace(partial_path, filepath)
+                except BaseException:
+                    with contextlib.suppress(OSError):
+                        os.unlink(partial_path)
+                    raise
+                return filepath
+            finally:
+                response.close()
+
+        except httpx.TimeoutException:
+            raise ConnectionTimeoutError("Download request timed out") from None
+
+        except httpx.ConnectError:
+            raise ConnectionError("Failed to connect for download") from None
+
+    def _get_download_filename(
+        self, request: httpx.Request, response: httpx.Response
+    ) -> Optional[str]:
+        """Resolve download filename from Content-Disposition header or request URL."""
+        content_disposition = response.headers.get("content-disposition")
+        if content_disposition:
+            import re
+
+            match = re.search(r'filename="([^"]+)"', content_disposition)
+            if match:
+                return match.group(1)
+
+        from urllib.parse import urlparse
+
+        parsed_url = urlparse(str(request.url))
+        return parsed_url.path.split("/")[-1] if parsed_url.path else None
+
     @cached_property
     def payment_requests(self) -> PaymentRequests:
         return PaymentRequests(self)
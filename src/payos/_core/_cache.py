@@ -0,0 +1,136 @@
+"""In-memory response cache for idempotent requests."""
+
+import json
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Optional
+
+from .request_options import FinalRequestOptions
+
+try:
+    from xxhash import xxh3_64_intdigest
+
+    def _digest(fingerprint: str) -> int:
+        return xxh3_64_intdigest(fingerprint.encode("utf-8"))
+
+except ImportError:  # pragma: no cover - depends on the installed extras
+
+    def _digest(fingerprint: str) -> int:
+        return hash(fingerprint)
+
+
+DEFAULT_RESPONSE_CACHE_SIZE = 128
+
+# Seconds a cached response is served before it is requested again
+DEFAULT_RESPONSE_CACHE_TTL = 60.0
+
+CacheKey = tuple[int, Any]
+
+# (base URL override or "", path) a request is sent to
+RequestTarget = tuple[str, str]
+
+
+def _request_target(options: FinalRequestOptions) -> RequestTarget:
+    # ``url`` only replaces the client's base URL; the path is still joined onto it
+    return options.url or "", options.path or ""
+
+
+def _fingerprint(options: FinalRequestOptions) -> str:
+    """Canonical request description that ignores query parameter order."""
+    url, path = _request_target(options)
+    query = json.dumps(options.query or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{options.method.upper()}|{url}|{path}|{query}"
+
+
+def _is_path_prefix(prefix: str, path: str) -> bool:
+    return path == prefix or path.startswith(prefix + "/")
+
+
+def _paths_overlap(cached_path: str, changed_path: str) -> bool:
+    cached_path = cached_path.rstrip("/")
+    changed_path = changed_path.rstrip("/")
+    return _is_path_prefix(cached_path, changed_path) or _is_path_prefix(changed_path, cached_path)
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of parsed GET responses.
+
+    Entries are keyed by a 64-bit digest of the method, base URL override, path and canonical
+    query string (xxh3 when ``xxhash`` is installed) together with the type the response was
+    cast to. The full fingerprint is stored next to each value and compared on lookup, so a
+    digest collision is a miss rather than a wrong response. Entries expire ``ttl`` seconds
+    after they are stored, and any non-GET request evicts the entries sent to the same base URL
+    whose path overlaps the one being changed.
+
+    Args:
+        maxsize: Maximum number of cached responses.
+        ttl: Seconds an entry stays valid. None keeps entries until they are evicted.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_RESPONSE_CACHE_SIZE,
+        ttl: Optional[float] = DEFAULT_RESPONSE_CACHE_TTL,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (target, fingerprint, value, expiry deadline or None)
+        self._entries: OrderedDict[CacheKey, tuple[RequestTarget, str, Any, Optional[float]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, options: FinalRequestOptions, cast_to: Any) -> Optional[Any]:
+        """Return the cached response for a GET request, or None on a miss."""
+        if options.method.upper() != "GET":
+            return None
+        fingerprint = _fingerprint(options)
+        key = (_digest(fingerprint), cast_to)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != fingerprint:
+                return None
+            if entry[3] is not None and monotonic() >= entry[3]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def set(self, options: FinalRequestOptions, cast_to: Any, value: Any) -> None:
+        """Store the response of a GET request."""
+        if options.method.upper() != "GET" or value is None:
+            return
+        fingerprint = _fingerprint(options)
+        key = (_digest(fingerprint), cast_to)
+        expires_at = monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (_request_target(options), fingerprint, value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str, url: Optional[str] = None) -> None:
+        """Drop entries for ``path`` and any path nested in or containing it.
+
+        Args:
+            path: Path of the request that changes server state.
+            url: Base URL override of that request. Only entries requested with the same
+                override are dropped.
+        """
+        url = url or ""
+        with self._lock:
+            for key in [
+                key
+                for key, (target, *_) in self._entries.items()
+                if target[0] == url and _paths_overlap(target[1], path)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -1,16 +1,15 @@
 """Pagination support for payOS API."""
 
-# mypy: disable-error-code=redundant-cast
-
-from collections.abc import AsyncIterator, Iterator
-from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, cast
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar
 
 from .models import PayOSBaseModel
 from .request_options import (
     FinalRequestOptions,
-    HTTPMethod,
-    SignatureRequestType,
-    SignatureResponseType,
 )
 
 if TYPE_CHECKING:
@@ -20,6 +19,40 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 ResponseT = TypeVar("ResponseT")
 
+# Number of page requests kept in flight while iterating over all pages with prefetch enabled
+DEFAULT_PREFETCH_DEPTH = 1
+
+# Number of page requests AsyncPage.to_list runs concurrently when the total is known
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def request_page(client: "PayOS", options: FinalRequestOptions, cast_to: Any) -> Any:
+    """Request a page, going through the client's response cache when it has one."""
+    cache = getattr(client, "_response_cache", None)
+    if cache is not None:
+        cached = cache.get(options, cast_to)
+        if cached is not None:
+            return cached
+    response = client.request(options, cast_to=cast_to)
+    if cache is not None:
+        cache.set(options, cast_to, response)
+    return response
+
+
+async def async_request_page(
+    client: "AsyncPayOS", options: FinalRequestOptions, cast_to: Any
+) -> Any:
+    """Async counterpart of ``request_page``."""
+    cache = getattr(client, "_response_cache", None)
+    if cache is not None:
+        cached = cache.get(options, cast_to)
+        if cached is not None:
+            return cached
+    response = await client.request(options, cast_to=cast_to)
+    if cache is not None:
+        cache.set(options, cast_to, response)
+    return response
+
 
 class PaginationParams(PayOSBaseModel):
     """Parameters for paginated requests."""
@@ -37,10 +70,42 @@ class Pagination(PayOSBaseModel):
     count: int
     has_more: bool
 
+    @property
+    def step(self) -> int:
+        """Offset distance between consecutive pages."""
+        return self.limit if self.limit > 0 else max(self.count, 1)
+
+    def plan_offsets(self, n: int, *, start: Optional[int] = None) -> list[int]:
+        """
+        Offsets of up to ``n`` pages following this one, bounded by ``total``.
+
+        Args:
+            n: Maximum number of offsets to return.
+            start: First offset to plan from. Defaults to the page right after this one.
+        """
+        if n <= 0 or not self.has_more:
+            return []
+        if start is None:
+            start = self.offset + self.count
+            if start >= self.total:
+                # total is missing or stale, but the server still reports more data
+                return [start]
+        return list(range(start, self.total, self.step)[:n])
+
 
 class Page(Generic[T]):
     """Base class for paginated responses."""
 
+    __slots__ = (
+        "_client",
+        "cast_to",
+        "_data",
+        "_pagination",
+        "_options",
+        "_has_next",
+        "_has_previous",
+    )
+
     def __init__(
         self,
         client: "PayOS",
@@ -54,6 +119,9 @@ class Page(Generic[T]):
         self._data = data
         self._pagination = pagination
         self._options = options
+        # Resolved once; iteration consults these at every page boundary
+        self._has_next = bool(pagination.has_more)
+        self._has_previous = pagination.offset > 0
 
     @property
     def data(self) -> list[T]:
@@ -67,64 +135,44 @@ class Page(Generic[T]):
 
     def has_next_page(self) -> bool:
         """Check if there are more pages available."""
-        return self._pagination.has_more
+        return self._has_next
 
     def has_previous_page(self) -> bool:
         """Check if there are previous pages available."""
-        return self._pagination.offset > 0
+        return self._has_previous
 
     def get_next_page(self) -> "Page[T]":
         """Get the next page of results."""
         if not self.has_next_page():
             raise ValueError("No more pages available")
 
-        next_offset = self._pagination.offset + self._pagination.count
-        next_options = FinalRequestOptions(
-            method=cast(HTTPMethod, self._options.method),
-            path=self._options.path,
-            query={
-                **(self._options.query or {}),
-                "offset": next_offset,
-                "limit": self._pagination.limit,
-            },
-            headers=self._options.headers,
-            body=self._options.body,
-            timeout=self._options.timeout,
-            max_retries=self._options.max_retries,
-            signature_request=cast(Optional[SignatureRequestType], self._options.signature_request),
-            signature_response=cast(
-                Optional[SignatureResponseType], self._options.signature_response
-            ),
-        )
-
-        response = self._client.request(next_options, cast_to=self.cast_to)
+        next_options = self._next_page_options()
+        response = self._request_page(next_options)
         return self._create_page_instance(self._client, self.cast_to, response, next_options)
 
+    def _request_page(self, options: FinalRequestOptions) -> Any:
+        """Request a page, going through the client's response cache when it has one."""
+        return request_page(self._client, options, self.cast_to)
+
+    def _next_page_options(self) -> FinalRequestOptions:
+        """Build the request options for the page following this one."""
+        return self._options_for_offset(self._pagination.offset + self._pagination.count)
+
+    def _options_for_offset(self, offset: int) -> FinalRequestOptions:
+        """Build the request options for the page starting at ``offset``."""
+        return self._options.with_updated_query(offset=offset, limit=self._pagination.limit)
+
     def get_previous_page(self) -> "Page[T]":
         """Get the previous page of results."""
         if not self.has_previous_page():
             raise ValueError("No previous pages available")
 
         prev_offset = max(0, self._pagination.offset - self._pagination.limit)
-        prev_options = FinalRequestOptions(
-            method=cast(HTTPMethod, self._options.method),
-            path=self._options.path,
-            query={
-                **(self._options.query or {}),
-                "offset": prev_offset,
-                "limit": self._pagination.limit,
-            },
-            headers=self._options.headers,
-            body=self._options.body,
-            timeout=self._options.timeout,
-            max_retries=self._options.max_retries,
-            signature_request=cast(Optional[SignatureRequestType], self._options.signature_request),
-            signature_response=cast(
-                Optional[SignatureResponseType], self._options.signature_response
-            ),
+        prev_options = self._options.with_updated_query(
+            offset=prev_offset, limit=self._pagination.limit
         )
 
-        response = self._client.request(prev_options, cast_to=self.cast_to)
+        response = self._request_page(prev_options)
         return self._create_page_instance(self._client, self.cast_to, response, prev_options)
 
     def _create_page_instance(
@@ -156,21 +204,96 @@ class Page(Generic[T]):
 
         return Page(client, cast_to, items, pagination, options)
 
-    def iter_all(self) -> Iterator[T]:
-        """Iterate over all items across all pages."""
-        current_page = self
-
-        while True:
-            yield from current_page.data
-
-            if not current_page.has_next_page():
-                break
+    def iter_all(
+        self, *, prefetch: bool = False, prefetch_depth: int = DEFAULT_PREFETCH_DEPTH
+    ) -> Iterator[T]:
+        """
+        Iterate over all items across all pages.
+
+        Args:
+            prefetch: Request upcoming pages in background threads while the items of the
+                current page are being consumed, hiding the round trip at each page boundary.
+                Off by default: stopping early then leaves requests that were never needed.
+            prefetch_depth: Maximum number of page requests kept in flight when prefetching.
+                Pages past the first one ahead are only planned when ``total`` is known.
+        """
+        pages = self._iter_pages(prefetch, prefetch_depth)
+        try:
+            yield from chain.from_iterable(page.data for page in pages)
+        finally:
+            pages.close()
+
+    def _iter_pages(self, prefetch: bool, prefetch_depth: int) -> Generator["Page[T]", None, None]:
+        """Yield this page and every following one, prefetching as configured."""
+        if not prefetch or prefetch_depth < 1:
+            current_page = self
+            while True:
+                yield current_page
+
+                if not current_page.has_next_page():
+                    break
 
-            current_page = current_page.get_next_page()
+                current_page = current_page.get_next_page()
+            return
 
-    def to_list(self) -> list[T]:
-        """Collect all items from all pages into a list."""
-        return list(self.iter_all())
+        executor = ThreadPoolExecutor(
+            max_workers=prefetch_depth, thread_name_prefix="payos-page-prefetch"
+        )
+        pending: deque[tuple[FinalRequestOptions, Future[Any]]] = deque()
+        anchor: Page[T] = self
+        next_start: Optional[int] = None
+
+        def refill() -> None:
+            nonlocal next_start
+            free = prefetch_depth - len(pending)
+            for offset in anchor._pagination.plan_offsets(free, start=next_start):
+                options = anchor._options_for_offset(offset)
+                pending.append((options, executor.submit(self._request_page, options)))
+                next_start = offset + anchor._pagination.step
+
+        try:
+            refill()
+            yield self
+
+            while pending:
+                options, future = pending.popleft()
+                page = self._create_page_instance(
+                    self._client, self.cast_to, future.result(), options
+                )
+                if not page.has_next_page():
+                    while pending:
+                        pending.popleft()[1].cancel()
+                else:
+                    refill()
+                    if not pending:
+                        # Planned offsets ran out (e.g. total grew); continue from this page
+                        anchor, next_start = page, None
+                        refill()
+
+                yield page
+        finally:
+            # Drop requests that have not started and wait for the ones already in flight, so
+            # none of them outlives the iterator
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def to_list(
+        self, *, prefetch: bool = False, prefetch_depth: int = DEFAULT_PREFETCH_DEPTH
+    ) -> list[T]:
+        """
+        Collect all items from all pages into a list.
+
+        Args:
+            prefetch: Request upcoming pages in background threads, as in ``iter_all``.
+            prefetch_depth: Maximum number of page requests kept in flight when prefetching.
+        """
+        items: list[T] = []
+        pages = self._iter_pages(prefetch, prefetch_depth)
+        try:
+            for page in pages:
+                items.extend(page.data)
+        finally:
+            pages.close()
+        return items
 
     def __iter__(self) -> Iterator[T]:
         """Make Page directly iterable."""
@@ -180,6 +303,16 @@ class Page(Generic[T]):
 class AsyncPage(Generic[T]):
     """Base class for async paginated responses."""
 
+    __slots__ = (
+        "_client",
+        "cast_to",
+        "_data",
+        "_pagination",
+        "_options",
+        "_has_next",
+        "_has_previous",
+    )
+
     def __init__(
         self,
         client: "AsyncPayOS",
@@ -193,6 +326,9 @@ class AsyncPage(Generic[T]):
         self._data = data
         self._pagination = pagination
         self._options = options
+        # Resolved once; iteration consults these at every page boundary
+        self._has_next = bool(pagination.has_more)
+        self._has_previous = pagination.offset > 0
 
     @property
     def data(self) -> list[T]:
@@ -206,64 +342,44 @@ class AsyncPage(Generic[T]):
 
     def has_next_page(self) -> bool:
         """Check if there are more pages available."""
-        return self._pagination.has_more
+        return self._has_next
 
     def has_previous_page(self) -> bool:
         """Check if there are previous pages available."""
-        return self._pagination.offset > 0
+        return self._has_previous
 
     async def get_next_page(self) -> "AsyncPage[T]":
         """Get the next page of results."""
         if not self.has_next_page():
             raise ValueError("No more pages available")
 
-        next_offset = self._pagination.offset + self._pagination.count
-        next_options = FinalRequestOptions(
-            method=cast(HTTPMethod, self._options.method),
-            path=self._options.path,
-            query={
-                **(self._options.query or {}),
-                "offset": next_offset,
-                "limit": self._pagination.limit,
-            },
-            headers=self._options.headers,
-            body=self._options.body,
-            timeout=self._options.timeout,
-            max_retries=self._options.max_retries,
-            signature_request=cast(Optional[SignatureRequestType], self._options.signature_request),
-            signature_response=cast(
-                Optional[SignatureResponseType], self._options.signature_response
-            ),
-        )
-
-        response = await self._client.request(next_options, cast_to=self.cast_to)
+        next_options = self._next_page_options()
+        response = await self._request_page(next_options)
         return self._create_page_instance(self._client, self.cast_to, response, next_options)
 
+    async def _request_page(self, options: FinalRequestOptions) -> Any:
+        """Request a page, going through the client's response cache when it has one."""
+        return await async_request_page(self._client, options, self.cast_to)
+
+    def _next_page_options(self) -> FinalRequestOptions:
+        """Build the request options for the page following this one."""
+        return self._options_for_offset(self._pagination.offset + self._pagination.count)
+
+    def _options_for_offset(self, offset: int) -> FinalRequestOptions:
+        """Build the request options for the page starting at ``offset``."""
+        return self._options.with_updated_query(offset=offset, limit=self._pagination.limit)
+
     async def get_previous_page(self) -> "AsyncPage[T]":
         """Get the previous page of results."""
         if not self.has_previous_page():
             raise ValueError("No previous pages available")
 
         prev_offset = max(0, self._pagination.offset - self._pagination.limit)
-        prev_options = FinalRequestOptions(
-            method=cast(HTTPMethod, self._options.method),
-            path=self._options.path,
-            query={
-                **(self._options.query or {}),
-                "offset": prev_offset,
-                "limit": self._pagination.limit,
-            },
-            headers=self._options.headers,
-            body=self._options.body,
-            timeout=self._options.timeout,
-            max_retries=self._options.max_retries,
-            signature_request=cast(Optional[SignatureRequestType], self._options.signature_request),
-            signature_response=cast(
-                Optional[SignatureResponseType], self._options.signature_response
-            ),
+        prev_options = self._options.with_updated_query(
+            offset=prev_offset, limit=self._pagination.limit
         )
 
-        response = await self._client.request(prev_options, cast_to=self.cast_to)
+        response = await self._request_page(prev_options)
         return self._create_page_instance(self._client, self.cast_to, response, prev_options)
 
     def _create_page_instance(
@@ -295,24 +411,126 @@ class AsyncPage(Generic[T]):
 
         return AsyncPage(client, cast_to, items, pagination, options)
 
-    async def iter_all(self) -> AsyncIterator[T]:
-        """Async iterate over all items across all pages."""
-        current_page = self
-
-        while True:
-            for item in current_page.data:
-                yield item
-
-            if not current_page.has_next_page():
-                break
-
-            current_page = await current_page.get_next_page()
+    async def iter_all(
+        self, *, prefetch: bool = False, prefetch_depth: int = DEFAULT_PREFETCH_DEPTH
+    ) -> AsyncIterator[T]:
+        """
+        Async iterate over all items across all pages.
+
+        Args:
+            prefetch: Request upcoming pages in background tasks while the items of the current
+                page are being consumed, hiding the round trip at each page boundary.
+                Off by default: stopping early then leaves requests that were never needed.
+            prefetch_depth: Maximum number of page requests kept in flight when prefetching.
+                Pages past the first one ahead are only planned when ``total`` is known.
+        """
+        pages = self._iter_pages(prefetch, prefetch_depth)
+        try:
+            async for page in pages:
+                for item in page.data:
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def _iter_pages(
+        self, prefetch: bool, prefetch_depth: int
+    ) -> AsyncGenerator["AsyncPage[T]", None]:
+        """Yield this page and every following one, prefetching as configured."""
+        if not prefetch or prefetch_depth < 1:
+            current_page = self
+            while True:
+                yield current_page
+
+                if not current_page.has_next_page():
+                    break
 
-    async def to_list(self) -> list[T]:
-        """Collect all items from all pages into a list."""
-        items = []
-        async for item in self.iter_all():
-            items.append(item)
+                current_page = await current_page.get_next_page()
+            return
+
+        pending: deque[tuple[FinalRequestOptions, asyncio.Future[Any]]] = deque()
+        anchor: AsyncPage[T] = self
+        next_start: Optional[int] = None
+
+        def refill() -> None:
+            nonlocal next_start
+            free = prefetch_depth - len(pending)
+            for offset in anchor._pagination.plan_offsets(free, start=next_start):
+                options = anchor._options_for_offset(offset)
+                pending.append((options, asyncio.ensure_future(self._request_page(options))))
+                next_start = offset + anchor._pagination.step
+
+        try:
+            refill()
+            yield self
+
+            while pending:
+                options, future = pending.popleft()
+                page = self._create_page_instance(self._client, self.cast_to, await future, options)
+                if not page.has_next_page():
+                    while pending:
+                        pending.popleft()[1].cancel()
+                else:
+                    refill()
+                    if not pending:
+                        # Planned offsets ran out (e.g. total grew); continue from this page
+                        anchor, next_start = page, None
+                        refill()
+
+                yield page
+        finally:
+            # Consumer stopped early (aclose/cancellation) or a request failed: cancel what is
+            # still in flight and wait for it to unwind, so no request outlives the iterator
+            for _, future in pending:
+                future.cancel()
+            await asyncio.gather(*(future for _, future in pending), return_exceptions=True)
+
+    async def to_list(self, *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list[T]:
+        """
+        Collect all items from all pages into a list.
+
+        When ``total`` is known, the remaining pages are requested concurrently.
+
+        Args:
+            max_concurrency: Maximum number of page requests in flight at once.
+        """
+        items: list[T] = list(self._data)
+        last_page: AsyncPage[T] = self
+
+        pagination = self._pagination
+        if pagination.has_more and pagination.offset + pagination.count < pagination.total:
+            semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+            async def fetch(options: FinalRequestOptions) -> Any:
+                async with semaphore:
+                    return await self._request_page(options)
+
+            all_options = [
+                self._options_for_offset(offset)
+                for offset in pagination.plan_offsets(pagination.total)
+            ]
+            tasks = [asyncio.ensure_future(fetch(options)) for options in all_options]
+            try:
+                responses = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            for options, response in zip(all_options, responses):
+                last_page = self._create_page_instance(
+                    self._client, self.cast_to, response, options
+                )
+                items.extend(last_page.data)
+
+        if last_page.has_next_page():
+            # total is unknown or grew while paging; walk the rest page by page
+            pages = last_page._iter_pages(False, DEFAULT_PREFETCH_DEPTH)
+            try:
+                await pages.__anext__()  # last_page itself, already collected
+                async for page in pages:
+                    items.extend(page.data)
+            finally:
+                await pages.aclose()
         return items
 
     def __aiter__(self) -> AsyncIterator[T]:
@@ -1,5 +1,6 @@
 """Core request options and types."""
 
+import os
 from typing import Any, Literal, Optional, TypedDict, TypeVar
 
 import httpx
@@ -28,6 +29,19 @@ class RequestOptions(TypedDict, total=False):
 class FinalRequestOptions:
     """Options for making HTTP requests."""
 
+    __slots__ = (
+        "method",
+        "path",
+        "url",
+        "query",
+        "headers",
+        "body",
+        "timeout",
+        "max_retries",
+        "signature_request",
+        "signature_response",
+    )
+
     def __init__(
         self,
         *,
@@ -46,6 +60,21 @@ class FinalRequestOptions:
         self.signature_request = opts.get("signature_request")
         self.signature_response = opts.get("signature_response")
 
+    def with_updated_query(self, **updates: Any) -> "FinalRequestOptions":
+        """Return a copy of these options with ``updates`` merged into the query."""
+        options = FinalRequestOptions.__new__(FinalRequestOptions)
+        options.method = self.method
+        options.path = self.path
+        options.url = self.url
+        options.query = (self.query or {}) | updates
+        options.headers = self.headers
+        options.body = self.body
+        options.timeout = self.timeout
+        options.max_retries = self.max_retries
+        options.signature_request = self.signature_request
+        options.signature_response = self.signature_response
+        return options
+
 
 class APIResponse:
     """Wrapper for API responses."""
@@ -71,6 +100,18 @@ class APIResponse:
         return self.code == "00"
 
 
+def download_filepath(directory: str, filename: Optional[str]) -> str:
+    """Path inside ``directory`` for a download named ``filename``.
+
+    The name usually comes from the server's Content-Disposition header, so only its last path
+    component is used; a name like ``../../x`` cannot escape ``directory``.
+    """
+    name = os.path.basename(filename or "")
+    if name in ("", ".", ".."):
+        raise ValueError("No filename available for download")
+    return os.path.join(directory, name)
+
+
 class FileDownloadResponse:
     """Response for file downloads."""
 
@@ -91,8 +132,6 @@ class FileDownloadResponse:
 
     def save_to_file(self, filepath: str) -> None:
         """Save the downloaded content to a file."""
-        import os
-
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
@@ -101,12 +140,7 @@ class FileDownloadResponse:
 
     def save_to_directory(self, directory: str) -> str:
         """Save the downloaded content to a directory using the original filename."""
-        import os
-
-        if not self.filename:
-            raise ValueError("No filename available for download")
-
-        filepath = os.path.join(directory, self.filename)
+        filepath = download_filepath(directory, self.filename)
         self.save_to_file(filepath)
         return filepath
 
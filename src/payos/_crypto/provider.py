@@ -3,12 +3,67 @@
 import hashlib
 import hmac
 import json
-import uuid
-from typing import Any, Optional, Union
+import os
+import threading
+from collections import deque
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
 from urllib.parse import quote
 
 from .._core.models import PayOSBaseModel
 
+# Compact JSON encoder built once; json.dumps would construct a new encoder for every call
+# made with non-default options
+_compact_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# HMAC digest constructors by algorithm name; hashlib's are backed by OpenSSL, which uses the
+# CPU's SHA extensions where available
+_HASH_IMPL: dict[str, Callable[..., Any]] = {
+    "sha256": hashlib.sha256,
+    "sha1": hashlib.sha1,
+    "sha512": hashlib.sha512,
+    "md5": hashlib.md5,
+}
+
+try:
+    from blake3 import blake3
+
+    _HASH_IMPL["blake3"] = blake3
+except ImportError:  # pragma: no cover - depends on the installed extras
+    pass
+
+
+# UUIDs are generated in batches so one os.urandom call covers many idempotency keys
+_UUID_POOL_SIZE = 64
+_uuid_pool: deque[str] = deque()
+_uuid_pool_lock = threading.Lock()
+
+
+def _reset_uuid_pool_after_fork() -> None:
+    """Give a forked child its own lock and an empty pool.
+
+    The child must never hand out keys already generated for its parent, and the lock may have
+    been held by a parent thread at the moment of the fork.
+    """
+    global _uuid_pool_lock
+    _uuid_pool_lock = threading.Lock()
+    _uuid_pool.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool_after_fork)
+
+
+def _refill_uuid_pool() -> None:
+    """Generate a batch of random (version 4) UUID strings into the pool."""
+    raw = bytearray(os.urandom(16 * _UUID_POOL_SIZE))
+    for start in range(0, len(raw), 16):
+        raw[start + 6] = (raw[start + 6] & 0x0F) | 0x40  # version 4
+        raw[start + 8] = (raw[start + 8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = raw[start : start + 16].hex()
+        _uuid_pool.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+
 
 def _convert_value_to_string(value: Any) -> str:
     """Convert a value to string with proper JSON boolean handling."""
@@ -35,6 +90,27 @@ def _convert_to_camel_case_dict(obj: Any) -> dict[str, Any]:
         raise ValueError(f"Unsupported object type for signature generation: {type(obj)}")
 
 
+@lru_cache(maxsize=32)
+def _hmac_template(
+    key: Union[str, bytes], digestmod: Callable[..., Any] = hashlib.sha256
+) -> "hmac.HMAC":
+    """Return a keyed HMAC object to ``copy()`` instead of re-keying per call.
+
+    A str key is UTF-8 encoded here, so it is encoded once per cached key rather than per call.
+    """
+    key_bytes = key if isinstance(key, bytes) else key.encode("utf-8")
+    return hmac.new(key_bytes, digestmod=digestmod)
+
+
+def _hmac_hexdigest(
+    key: Union[str, bytes], message: str, digestmod: Callable[..., Any] = hashlib.sha256
+) -> str:
+    """HMAC ``message`` with a copy of the cached template for ``key``."""
+    mac = _hmac_template(key, digestmod).copy()
+    mac.update(message.encode("utf-8"))
+    return mac.hexdigest()
+
+
 def sort_object_by_key(obj: dict[str, Any]) -> dict[str, Any]:
     """Sort object keys in ascending order."""
     return {key: obj[key] for key in sorted(obj.keys())}
@@ -77,37 +153,52 @@ def deep_sort_object(obj: Any, sort_arrays: bool = False) -> Any:
         return obj
 
 
+def _query_string_value(value: Any) -> str:
+    """Stringify a value for convert_object_to_query_string."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        # Sort nested objects in arrays and stringify
+        return _compact_json(
+            [sort_object_by_key(item) if isinstance(item, dict) else item for item in value]
+        )
+    if value in ("undefined", "null"):
+        return ""
+    return _convert_value_to_string(value)
+
+
 def convert_object_to_query_string(obj: dict[str, Any]) -> str:
     """Convert object to query string format."""
-    parts = []
-
-    for key in sorted(obj.keys()):
-        value = obj[key]
-
-        # Skip undefined values
-        if value is None:
-            value = ""
-        elif isinstance(value, list):
-            # Sort nested objects in arrays and stringify
-            sorted_list = [
-                sort_object_by_key(item) if isinstance(item, dict) else item for item in value
-            ]
-            value = json.dumps(sorted_list, separators=(",", ":"), ensure_ascii=False)
-        elif value in [None, "undefined", "null"]:
-            value = ""
-        else:
-            value = _convert_value_to_string(value)
+    return "&".join(f"{key}={_query_string_value(obj[key])}" for key in sorted(obj))
+
+
+def _signature_value(value: Any) -> str:
+    """Stringify a value for CryptoProvider.create_signature."""
+    if isinstance(value, (list, dict)):
+        return _compact_json(value)
+    if value is None:
+        return ""
+    return _convert_value_to_string(value)
 
-        parts.append(f"{key}={value}")
 
-    return "&".join(parts)
+def _signature_query_string(data: dict[str, Any], encode_uri: bool, sort_arrays: bool) -> str:
+    """Canonical query string signed by CryptoProvider.create_signature."""
+    sorted_data = deep_sort_object(data, sort_arrays)
+
+    # deep_sort_object already returns the keys in sorted order
+    if encode_uri:
+        return "&".join(
+            f"{quote(str(key))}={quote(_signature_value(value))}"
+            for key, value in sorted_data.items()
+        )
+    return "&".join(f"{key}={_signature_value(value)}" for key, value in sorted_data.items())
 
 
 class CryptoProvider:
     """Crypto provider for signature generation and validation."""
 
     def create_signature_from_object(
-        self, data: Union[dict[str, Any], Any], key: str
+        self, data: Union[dict[str, Any], Any], key: Union[str, bytes]
     ) -> Optional[str]:
         """Create HMAC signature from object data."""
         if data is None or not key:
@@ -117,15 +208,13 @@ class CryptoProvider:
         if not isinstance(data, dict):
             data = _convert_to_camel_case_dict(data)
 
-        sorted_data = sort_object_by_key(data)
-        query_string = convert_object_to_query_string(sorted_data)
+        # convert_object_to_query_string already walks the keys in sorted order
+        query_string = convert_object_to_query_string(data)
 
-        return hmac.new(
-            key.encode("utf-8"), query_string.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
+        return _hmac_hexdigest(key, query_string)
 
     def create_signature_of_payment_request(
-        self, data: Union[dict[str, Any], Any], key: str
+        self, data: Union[dict[str, Any], Any], key: Union[str, bytes]
     ) -> Optional[str]:
         """Create signature for payment request using specific fields."""
         if data is None or not key:
@@ -144,66 +233,79 @@ class CryptoProvider:
 
         data_string = "&".join(values)
 
-        return hmac.new(
-            key.encode("utf-8"), data_string.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
+        return _hmac_hexdigest(key, data_string)
 
     def create_signature(
         self,
-        secret_key: str,
+        secret_key: Union[str, bytes],
         json_data: Union[dict[str, Any], Any],
         *,
         encode_uri: bool = True,
         sort_arrays: bool = False,
         algorithm: str = "sha256",
     ) -> str:
-        """Create HMAC signature from JSON data with query string format."""
+        """
+        Create HMAC signature from JSON data with query string format.
+
+        ``algorithm`` is one of ``sha256`` (default), ``sha1``, ``sha512`` or ``md5``, plus
+        ``blake3`` when the optional ``blake3`` package is installed. Anything else raises
+        ValueError.
+        """
+        return self.create_signatures(
+            secret_key,
+            json_data,
+            encode_uri=encode_uri,
+            sort_arrays=sort_arrays,
+            algorithms=(algorithm,),
+        )[algorithm]
+
+    def create_signatures(
+        self,
+        secret_key: Union[str, bytes],
+        json_data: Union[dict[str, Any], Any],
+        *,
+        encode_uri: bool = True,
+        sort_arrays: bool = False,
+        algorithms: Sequence[str] = ("sha256",),
+    ) -> dict[str, str]:
+        """
+        Create HMAC signatures of the same data with several algorithms.
+
+        The data is canonicalized once and then signed with each algorithm, which is cheaper
+        than calling create_signature per algorithm, e.g. when verifying against candidate
+        algorithms during a rotation.
+
+        Args:
+            secret_key: HMAC key, as text or already encoded bytes.
+            json_data: Dict or Pydantic model to sign.
+            encode_uri: Percent-encode keys and values in the query string.
+            sort_arrays: Sort array elements before signing.
+            algorithms: Algorithm names accepted by create_signature.
+
+        Returns:
+            Hex signatures keyed by algorithm name.
+        """
+        hash_funcs = {}
+        for algorithm in algorithms:
+            hash_func = _HASH_IMPL.get(algorithm)
+            if hash_func is None:
+                raise ValueError(f"Unsupported algorithm: {algorithm}")
+            hash_funcs[algorithm] = hash_func
+
         # Convert Pydantic models to camelCase dict
         if not isinstance(json_data, dict):
             json_data = _convert_to_camel_case_dict(json_data)
 
-        sorted_data = deep_sort_object(json_data, sort_arrays)
-
-        query_parts = []
-        for key in sorted(sorted_data.keys()):
-            value = sorted_data[key]
-
-            # Handle different value types
-            if isinstance(value, list):
-                value = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
-            elif isinstance(value, dict):
-                value = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
-            elif value is None:
-                value = ""
-            else:
-                value = _convert_value_to_string(value)
-
-            # Conditionally URL encode based on options
-            if encode_uri:
-                encoded_key = quote(str(key))
-                encoded_value = quote(value)
-                query_parts.append(f"{encoded_key}={encoded_value}")
-            else:
-                query_parts.append(f"{key}={value}")
-
-        query_string = "&".join(query_parts)
-
-        # Create HMAC signature
-        if algorithm == "sha256":
-            hash_func = hashlib.sha256
-        elif algorithm == "sha1":
-            hash_func = hashlib.sha1
-        elif algorithm == "sha512":
-            hash_func = hashlib.sha512
-        elif algorithm == "md5":
-            hash_func = hashlib.md5
-        else:
-            raise ValueError(f"Unsupported algorithm: {algorithm}")
+        query_string = _signature_query_string(json_data, encode_uri, sort_arrays)
 
-        return hmac.new(
-            secret_key.encode("utf-8"), query_string.encode("utf-8"), hash_func
-        ).hexdigest()
+        return {
+            algorithm: _hmac_hexdigest(secret_key, query_string, hash_func)
+            for algorithm, hash_func in hash_funcs.items()
+        }
 
     def create_uuid4(self) -> str:
         """Generate a random UUID4 string."""
-        return str(uuid.uuid4())
+        with _uuid_pool_lock:
+            if not _uuid_pool:
+                _refill_uuid_pool()
+            return _uuid_pool.popleft()
@@ -4,6 +4,7 @@ from functools import cached_property
 from typing import Any, Optional, Union
 
 from ...._core import AsyncPage, Page
+from ...._core.pagination import async_request_page, request_page
 from ...._core.request_options import FinalRequestOptions
 from ....types.v1 import (
     EstimateCredit,
@@ -72,14 +73,6 @@ class Payouts(BaseResource):
         **kwargs: Any,
     ) -> Page[Payout]:
         """List payouts with optional filtering."""
-        response = self._client.get(
-            "/v1/payouts",
-            query=dict(params.model_dump_camel_case()) if params else None,
-            headers=extra_headers,
-            cast_to=PayoutListResponse,
-            signature_response="header",
-            **kwargs,
-        )
         request_options = FinalRequestOptions(
             method="GET",
             path="/v1/payouts",
@@ -88,6 +81,8 @@ class Payouts(BaseResource):
             signature_response="header",
             **kwargs,
         )
+        # The first page goes through the response cache like every other page
+        response = request_page(self._client, request_options, PayoutListResponse)
         return Page(
             self._client, PayoutListResponse, response.payouts, response.pagination, request_options
         )
@@ -170,13 +165,6 @@ class AsyncPayouts(AsyncBaseResource):
         **kwargs: Any,
     ) -> AsyncPage[Payout]:
         """List payouts with optional filtering."""
-        response = await self._client.get(
-            "/v1/payouts",
-            query=dict(params.model_dump_camel_case()) if params else None,
-            headers=extra_headers,
-            cast_to=PayoutListResponse,
-            **kwargs,
-        )
         request_options = FinalRequestOptions(
             method="GET",
             path="/v1/payouts",
@@ -185,6 +173,8 @@ class AsyncPayouts(AsyncBaseResource):
             signature_response="header",
             **kwargs,
         )
+        # The first page goes through the response cache like every other page
+        response = await async_request_page(self._client, request_options, PayoutListResponse)
         return AsyncPage(
             self._client, PayoutListResponse, response.payouts, response.pagination, request_options
         )
@@ -49,6 +49,25 @@ class Invoices(BaseResource):
         )
         return response
 
+    def stream_download(
+        self,
+        invoice_id: str,
+        id: Union[str, int],
+        destination: str,
+        *,
+        extra_headers: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Download an invoice in PDF format, streaming it directly to disk.
+        """
+        return self._client.stream_download(
+            f"/v2/payment-requests/{id}/invoices/{invoice_id}/download",
+            destination,
+            headers=extra_headers,
+            **kwargs,
+        )
+
 
 class AsyncInvoices(AsyncBaseResource):
     """Asynchronous invoices resource."""
@@ -89,3 +108,22 @@ class AsyncInvoices(AsyncBaseResource):
             **kwargs,
         )
         return response
+
+    async def stream_download(
+        self,
+        invoice_id: str,
+        id: Union[str, int],
+        destination: str,
+        *,
+        extra_headers: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Download an invoice in PDF format, streaming it directly to disk.
+        """
+        return await self._client.stream_download(
+            f"/v2/payment-requests/{id}/invoices/{invoice_id}/download",
+            destination,
+            headers=extra_headers,
+            **kwargs,
+        )
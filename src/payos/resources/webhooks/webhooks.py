@@ -1,5 +1,6 @@
 """payOS webhooks resource."""
 
+import hmac
 from typing import Any, Union
 
 from pydantic import ValidationError
@@ -49,8 +50,7 @@ class Webhooks(BaseResource):
             webhook = payload
         else:
             if isinstance(payload, (bytes, bytearray)):
-                payload_str = payload.decode("utf-8")
-                payload_obj = safe_json_parse(payload_str)
+                payload_obj = safe_json_parse(payload)
                 if not payload_obj:
                     raise WebhookError("Invalid JSON")
             elif isinstance(payload, str):
@@ -84,7 +84,10 @@ class Webhooks(BaseResource):
             data_dict, self._client.checksum_key
         )
 
-        if not signed_signature or signed_signature != signature:
+        # compare_digest only accepts ASCII str, so compare the encoded bytes
+        if not signed_signature or not hmac.compare_digest(
+            signed_signature.encode("utf-8"), signature.encode("utf-8")
+        ):
             raise WebhookError("Data not integrity")
 
         return data
@@ -124,8 +127,7 @@ class AsyncWebhooks(AsyncBaseResource):
             webhook = payload
         else:
             if isinstance(payload, (bytes, bytearray)):
-                payload_str = payload.decode("utf-8")
-                payload_obj = safe_json_parse(payload_str)
+                payload_obj = safe_json_parse(payload)
                 if not payload_obj:
                     raise WebhookError("Invalid JSON")
             elif isinstance(payload, str):
@@ -159,7 +161,10 @@ class AsyncWebhooks(AsyncBaseResource):
             data_dict, self._client.checksum_key
         )
 
-        if not signed_signature or signed_signature != signature:
+        # compare_digest only accepts ASCII str, so compare the encoded bytes
+        if not signed_signature or not hmac.compare_digest(
+            signed_signature.encode("utf-8"), signature.encode("utf-8")
+        ):
             raise WebhookError("Data not integrity")
 
         return data
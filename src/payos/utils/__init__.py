@@ -9,7 +9,14 @@ from ._compat import (
 )
 from .casting import cast_to
 from .env import get_env_var
-from .json_utils import build_query_string, request_to_dict, response_to_dict, safe_json_parse
+from .json_utils import (
+    build_query_string,
+    json_dumps,
+    json_loads,
+    request_to_dict,
+    response_to_dict,
+    safe_json_parse,
+)
 from .logs import (
     logger,
     setup_logging,
@@ -21,6 +28,8 @@ __all__ = [
     "setup_logging",
     "get_env_var",
     "safe_json_parse",
+    "json_dumps",
+    "json_loads",
     "build_query_string",
     "request_to_dict",
     "response_to_dict",
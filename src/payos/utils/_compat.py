@@ -22,31 +22,33 @@ def _sort_obj_data_by_key(obj: dict[str, Any]) -> dict[str, Any]:
     return dict(sorted(obj.items()))
 
 
+def _query_value_to_str(value: Any) -> str:
+    """Internal: Convert a single query string value to its signed string form."""
+    if isinstance(value, (int, float, bool)):
+        return str(value)
+    elif value in [None, "null", "NULL"]:
+        return ""
+    elif isinstance(value, list):
+        return json.dumps(
+            [dict(sorted(item.items())) for item in value], separators=(",", ":")
+        ).replace("None", "null")
+    else:
+        return str(value)
+
+
 def _convert_obj_to_query_str(obj: dict[str, Any]) -> str:
     """Internal: Convert dictionary to URL query string format (no deprecation warning)."""
-    query_string = []
+    return "&".join(f"{key}={_query_value_to_str(value)}" for key, value in obj.items())
 
-    for key, value in obj.items():
-        value_as_string = ""
-        if isinstance(value, (int, float, bool)):
-            value_as_string = str(value)
-        elif value in [None, "null", "NULL"]:
-            value_as_string = ""
-        elif isinstance(value, list):
-            value_as_string = json.dumps(
-                [dict(sorted(item.items())) for item in value], separators=(",", ":")
-            ).replace("None", "null")
-        else:
-            value_as_string = str(value)
-        query_string.append(f"{key}={value_as_string}")
 
-    return "&".join(query_string)
+def _convert_obj_to_sorted_query_str(obj: dict[str, Any]) -> str:
+    """Internal: Sort dictionary by keys and convert to query string in a single pass."""
+    return "&".join(f"{key}={_query_value_to_str(value)}" for key, value in sorted(obj.items()))
 
 
 def _create_signature_from_obj(data: dict[str, Any], key: str) -> str:
     """Internal: Create HMAC-SHA256 signature from dictionary (no deprecation warning)."""
-    sorted_data_by_key = _sort_obj_data_by_key(data)
-    data_query_str = _convert_obj_to_query_str(sorted_data_by_key)
+    data_query_str = _convert_obj_to_sorted_query_str(data)
     return hmac.new(
         key.encode("utf-8"), msg=data_query_str.encode("utf-8"), digestmod=hashlib.sha256
     ).hexdigest()
@@ -1,13 +1,39 @@
 import json
-from typing import Any, Optional, cast
+from typing import Any, Optional, Union, cast
 
 from httpx import Request, Response
 
+try:
+    import orjson
 
-def safe_json_parse(text: str) -> Optional[dict[str, Any]]:
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the installed extras
+    HAS_ORJSON = False
+
+
+def json_dumps(obj: Any) -> Union[str, bytes]:
+    """Serialize to JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        try:
+            encoded: bytes = orjson.dumps(obj)
+            return encoded
+        except TypeError:
+            # orjson rejects non-str keys and oversized ints; let the stdlib try
+            pass
+    return json.dumps(obj)
+
+
+def json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def safe_json_parse(text: Union[str, bytes, bytearray]) -> Optional[dict[str, Any]]:
     """Safely parse JSON text, returning None if invalid."""
     try:
-        raw = json.loads(text)
+        raw = json_loads(text)
         return cast(dict[str, Any], raw)
     except (json.JSONDecodeError, ValueError):
         return None
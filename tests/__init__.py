@@ -0,0 +1 @@
+"""payOS tests package."""
@@ -0,0 +1,128 @@
+"""Tests for the response cache."""
+
+from payos._core import _cache
+from payos._core._cache import ResponseCache
+from payos._core.request_options import FinalRequestOptions
+
+
+def get_options(path: str = "/v1/payouts", **query) -> FinalRequestOptions:
+    return FinalRequestOptions(method="GET", path=path, query=query)
+
+
+class TestResponseCache:
+    """Test ResponseCache."""
+
+    def test_get_returns_stored_response(self):
+        """Test a stored GET response is returned for the same request."""
+        cache = ResponseCache()
+        cache.set(get_options(offset=0, limit=2), dict, {"items": [1, 2]})
+
+        assert cache.get(get_options(offset=0, limit=2), dict) == {"items": [1, 2]}
+        assert cache.get(get_options(offset=2, limit=2), dict) is None
+
+    def test_query_order_does_not_matter(self):
+        """Test the key is built from a canonical query string."""
+        cache = ResponseCache()
+        cache.set(get_options(offset=0, limit=2), dict, {"items": []})
+
+        assert cache.get(get_options(limit=2, offset=0), dict) == {"items": []}
+
+    def test_non_get_requests_are_not_cached(self):
+        """Test only GET responses are stored."""
+        cache = ResponseCache()
+        options = FinalRequestOptions(method="POST", path="/v1/payouts")
+        cache.set(options, dict, {"id": "1"})
+
+        assert len(cache) == 0
+        assert cache.get(options, dict) is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the cache stays within maxsize by evicting the oldest entry."""
+        cache = ResponseCache(maxsize=2)
+        cache.set(get_options(offset=0), dict, {"page": 0})
+        cache.set(get_options(offset=2), dict, {"page": 1})
+        cache.get(get_options(offset=0), dict)
+        cache.set(get_options(offset=4), dict, {"page": 2})
+
+        assert len(cache) == 2
+        assert cache.get(get_options(offset=0), dict) == {"page": 0}
+        assert cache.get(get_options(offset=2), dict) is None
+
+    def test_invalidate_drops_overlapping_paths(self):
+        """Test invalidation removes the collection and nested paths only."""
+        cache = ResponseCache()
+        cache.set(get_options("/v1/payouts"), dict, {"items": []})
+        cache.set(get_options("/v1/payouts/abc"), dict, {"id": "abc"})
+        cache.set(get_options("/v1/payouts-account/balance"), dict, {"balance": 1})
+
+        cache.invalidate("/v1/payouts/batch")
+
+        assert cache.get(get_options("/v1/payouts"), dict) is None
+        assert cache.get(get_options("/v1/payouts/abc"), dict) == {"id": "abc"}
+        assert cache.get(get_options("/v1/payouts-account/balance"), dict) == {"balance": 1}
+
+        cache.invalidate("/v1/payouts")
+
+        assert cache.get(get_options("/v1/payouts/abc"), dict) is None
+        assert cache.get(get_options("/v1/payouts-account/balance"), dict) == {"balance": 1}
+
+    def test_base_url_override_is_keyed_with_the_path(self):
+        """Test requests sharing a base URL override stay distinct by path and evict by URL."""
+        other_url = "https://other.payos.vn"
+        cache = ResponseCache()
+        cache.set(
+            FinalRequestOptions(method="GET", url=other_url, path="/v1/payouts"), dict, {"a": 1}
+        )
+        cache.set(
+            FinalRequestOptions(method="GET", url=other_url, path="/v1/other"), dict, {"b": 2}
+        )
+        cache.set(get_options("/v1/payouts"), dict, {"c": 3})
+
+        assert len(cache) == 3
+        assert cache.get(
+            FinalRequestOptions(method="GET", url=other_url, path="/v1/payouts"), dict
+        ) == {"a": 1}
+
+        cache.invalidate("/v1/payouts/batch", other_url)
+
+        assert (
+            cache.get(FinalRequestOptions(method="GET", url=other_url, path="/v1/payouts"), dict)
+            is None
+        )
+        assert cache.get(
+            FinalRequestOptions(method="GET", url=other_url, path="/v1/other"), dict
+        ) == {"b": 2}
+        assert cache.get(get_options("/v1/payouts"), dict) == {"c": 3}
+
+    def test_digest_collision_is_a_miss(self, monkeypatch):
+        """Test a request whose digest collides with a cached one is not served its response."""
+        monkeypatch.setattr(_cache, "_digest", lambda fingerprint: 0)
+        cache = ResponseCache()
+        cache.set(get_options(offset=0), dict, {"page": 0})
+
+        assert cache.get(get_options(offset=2), dict) is None
+        assert cache.get(get_options(offset=0), dict) == {"page": 0}
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Test an entry is a miss once its ttl has passed, and dropped from the cache."""
+        now = [100.0]
+        monkeypatch.setattr(_cache, "monotonic", lambda: now[0])
+        cache = ResponseCache(ttl=30)
+        cache.set(get_options(offset=0), dict, {"page": 0})
+
+        now[0] += 29
+        assert cache.get(get_options(offset=0), dict) == {"page": 0}
+
+        now[0] += 1
+        assert cache.get(get_options(offset=0), dict) is None
+        assert len(cache) == 0
+
+    def test_entries_without_ttl_do_not_expire(self, monkeypatch):
+        """Test ttl=None keeps entries until they are evicted."""
+        now = [100.0]
+        monkeypatch.setattr(_cache, "monotonic", lambda: now[0])
+        cache = ResponseCache(ttl=None)
+        cache.set(get_options(offset=0), dict, {"page": 0})
+
+        now[0] += 10**6
+        assert cache.get(get_options(offset=0), dict) == {"page": 0}
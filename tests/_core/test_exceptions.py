@@ -17,6 +17,12 @@ from payos import (
 )
 
 
+@pytest.fixture(scope="module")
+def http_request() -> httpx.Request:
+    """Shared request attached to the responses built in this module."""
+    return httpx.Request("GET", "http://test")
+
+
 class TestPayOSError:
     """Test PayOSError base exception."""
 
@@ -40,9 +46,9 @@ class TestPayOSError:
 class TestAPIError:
     """Test APIError and its factory method."""
 
-    def test_api_error_creation_with_all_fields(self):
+    def test_api_error_creation_with_all_fields(self, http_request: httpx.Request):
         """Test creating APIError with all fields."""
-        response = httpx.Response(400, request=httpx.Request("GET", "http://test"))
+        response = httpx.Response(400, request=http_request)
         error = APIError(
             "Error message",
             status_code=400,
@@ -57,13 +63,13 @@ class TestAPIError:
         assert error.error_desc == "Bad request description"
         assert error.response == response
 
-    def test_api_error_message_contains_code_and_desc(self):
+    def test_api_error_message_contains_code_and_desc(self, http_request: httpx.Request):
         """Test that error message contains code and desc when present."""
         error_data = {"code": "X", "desc": "desc"}
         response = httpx.Response(
             400,
             json=error_data,
-            request=httpx.Request("GET", "http://test"),
+            request=http_request,
         )
 
         error = APIError.from_response(response, error_data=error_data, message="API Error")
@@ -73,96 +79,36 @@ class TestAPIError:
         assert error.error_code == "X"
         assert error.error_desc == "desc"
 
-    def test_from_response_returns_bad_request_error_for_400(self):
-        """Test that from_response returns BadRequestError for 400 status."""
-        response = httpx.Response(
-            400,
-            json={"code": "c", "desc": "d"},
-            request=httpx.Request("GET", "http://test"),
-        )
-        error = APIError.from_response(response, error_data={"code": "c", "desc": "d"})
-
-        assert isinstance(error, BadRequestError)
-        assert error.status_code == 400
-
-    def test_from_response_returns_unauthorized_error_for_401(self):
-        """Test that from_response returns UnauthorizedError for 401 status."""
-        response = httpx.Response(
-            401,
-            json={"code": "c", "desc": "d"},
-            request=httpx.Request("GET", "http://test"),
-        )
-        error = APIError.from_response(response, error_data={"code": "c", "desc": "d"})
-
-        assert isinstance(error, UnauthorizedError)
-        assert error.status_code == 401
-
-    def test_from_response_returns_forbidden_error_for_403(self):
-        """Test that from_response returns ForbiddenError for 403 status."""
-        response = httpx.Response(
-            403,
-            json={"code": "c", "desc": "d"},
-            request=httpx.Request("GET", "http://test"),
-        )
-        error = APIError.from_response(response, error_data={"code": "c", "desc": "d"})
-
-        assert isinstance(error, ForbiddenError)
-        assert error.status_code == 403
-
-    def test_from_response_returns_not_found_error_for_404(self):
-        """Test that from_response returns NotFoundError for 404 status."""
-        response = httpx.Response(
-            404,
-            json={"code": "c", "desc": "d"},
-            request=httpx.Request("GET", "http://test"),
-        )
-        error = APIError.from_response(response, error_data={"code": "c", "desc": "d"})
-
-        assert isinstance(error, NotFoundError)
-        assert error.status_code == 404
-
-    def test_from_response_returns_too_many_requests_error_for_429(self):
-        """Test that from_response returns TooManyRequestsError for 429 status."""
-        response = httpx.Response(
-            429,
-            json={"code": "c", "desc": "d"},
-            request=httpx.Request("GET", "http://test"),
-        )
-        error = APIError.from_response(response, error_data={"code": "c", "desc": "d"})
-
-        assert isinstance(error, TooManyRequestsError)
-        assert error.status_code == 429
-
-    def test_from_response_returns_internal_server_error_for_500(self):
-        """Test that from_response returns InternalServerError for 500 status."""
-        response = httpx.Response(
-            500,
-            json={"code": "c", "desc": "d"},
-            request=httpx.Request("GET", "http://test"),
-        )
-        error = APIError.from_response(response, error_data={"code": "c", "desc": "d"})
-
-        assert isinstance(error, InternalServerError)
-        assert error.status_code == 500
-
-    def test_from_response_returns_internal_server_error_for_503(self):
-        """Test that from_response returns InternalServerError for 5xx status."""
+    @pytest.mark.parametrize(
+        ("status_code", "error_class"),
+        [
+            (400, BadRequestError),
+            (401, UnauthorizedError),
+            (403, ForbiddenError),
+            (404, NotFoundError),
+            (429, TooManyRequestsError),
+            (500, InternalServerError),
+            (503, InternalServerError),
+        ],
+    )
+    def test_from_response_returns_error_class_for_status(
+        self, http_request: httpx.Request, status_code: int, error_class: type[APIError]
+    ):
+        """Test that from_response maps each handled status code to its error class."""
         response = httpx.Response(
-            503,
-            json={"code": "c", "desc": "d"},
-            request=httpx.Request("GET", "http://test"),
+            status_code, json={"code": "c", "desc": "d"}, request=http_request
         )
         error = APIError.from_response(response, error_data={"code": "c", "desc": "d"})
 
-        assert isinstance(error, InternalServerError)
-        assert error.status_code == 503
+        assert isinstance(error, error_class)
+        assert error.status_code == status_code
 
-    def test_from_response_uses_error_desc_as_default_message(self):
+    def test_from_response_uses_error_desc_as_default_message(self, http_request: httpx.Request):
         """Test that from_response uses error_desc as default message when message not provided."""
         response = httpx.Response(
             400,
             json={"code": "ERR", "desc": "Description from API"},
-            request=httpx.Request("GET", "http://test"),
+            request=http_request,
         )
         error = APIError.from_response(
             response, error_data={"code": "ERR", "desc": "Description from API"}
@@ -170,19 +116,21 @@ class TestAPIError:
 
         assert str(error) == "Description from API"
 
-    def test_from_response_uses_http_status_fallback_message(self):
+    def test_from_response_uses_http_status_fallback_message(self, http_request: httpx.Request):
         """Test that from_response uses HTTP status as fallback message."""
-        response = httpx.Response(400, request=httpx.Request("GET", "http://test"))
+        response = httpx.Response(400, request=http_request)
         error = APIError.from_response(response)
 
         assert str(error) == "HTTP 400 error"
 
-    def test_from_response_returns_generic_api_error_for_other_status(self):
+    def test_from_response_returns_generic_api_error_for_other_status(
+        self, http_request: httpx.Request
+    ):
         """Test that from_response returns generic APIError for unhandled status codes."""
         response = httpx.Response(
             418,  # I'm a teapot
             json={"code": "c", "desc": "d"},
-            request=httpx.Request("GET", "http://test"),
+            request=http_request,
         )
         error = APIError.from_response(response, error_data={"code": "c", "desc": "d"})
 
@@ -195,41 +143,22 @@ class TestAPIError:
 class TestSpecificErrors:
     """Test specific error subclasses."""
 
-    def test_bad_request_error(self):
-        """Test BadRequestError."""
-        error = BadRequestError("Bad request", status_code=400)
-        assert isinstance(error, APIError)
-        assert error.status_code == 400
-
-    def test_unauthorized_error(self):
-        """Test UnauthorizedError."""
-        error = UnauthorizedError("Unauthorized", status_code=401)
-        assert isinstance(error, APIError)
-        assert error.status_code == 401
-
-    def test_forbidden_error(self):
-        """Test ForbiddenError."""
-        error = ForbiddenError("Forbidden", status_code=403)
-        assert isinstance(error, APIError)
-        assert error.status_code == 403
-
-    def test_not_found_error(self):
-        """Test NotFoundError."""
-        error = NotFoundError("Not found", status_code=404)
-        assert isinstance(error, APIError)
-        assert error.status_code == 404
-
-    def test_too_many_requests_error(self):
-        """Test TooManyRequestsError."""
-        error = TooManyRequestsError("Too many requests", status_code=429)
-        assert isinstance(error, APIError)
-        assert error.status_code == 429
-
-    def test_internal_server_error(self):
-        """Test InternalServerError."""
-        error = InternalServerError("Server error", status_code=500)
+    @pytest.mark.parametrize(
+        ("error_class", "status_code"),
+        [
+            (BadRequestError, 400),
+            (UnauthorizedError, 401),
+            (ForbiddenError, 403),
+            (NotFoundError, 404),
+            (TooManyRequestsError, 429),
+            (InternalServerError, 500),
+        ],
+    )
+    def test_api_error_subclass(self, error_class: type[APIError], status_code: int):
+        """Test that each HTTP error subclass is an APIError carrying its status code."""
+        error = error_class("Error", status_code=status_code)
         assert isinstance(error, APIError)
-        assert error.status_code == 500
+        assert error.status_code == status_code
 
     def test_connection_error(self):
         """Test ConnectionError."""
@@ -1,5 +1,9 @@
 """Tests for pagination."""
 
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -7,14 +11,84 @@ import pytest
 from payos import AsyncPayOS, PayOS
 from payos._core.pagination import AsyncPage, Page, Pagination
 from payos._core.request_options import FinalRequestOptions
+from payos.types import GetPayoutListParams
+
+
+def paged_response(offset: int, limit: int = 2, total: int = 8) -> dict:
+    """Build a dict page response holding the integers ``offset..offset+limit``."""
+    items = list(range(offset, min(offset + limit, total)))
+    return {
+        "items": items,
+        "pagination": {
+            "limit": limit,
+            "offset": offset,
+            "total": total,
+            "count": len(items),
+            "hasMore": offset + len(items) < total,
+        },
+    }
+
+
+class TestPaginationPlanOffsets:
+    """Test Pagination.plan_offsets."""
+
+    def test_plans_following_offsets_bounded_by_total(self):
+        """Test offsets step by limit and stop at total."""
+        pagination = Pagination(limit=2, offset=0, total=7, count=2, has_more=True)
+
+        assert pagination.plan_offsets(3) == [2, 4, 6]
+        assert pagination.plan_offsets(10) == [2, 4, 6]
+        assert pagination.plan_offsets(2, start=6) == [6]
+
+    def test_plans_nothing_on_last_page(self):
+        """Test no offsets are planned when there are no more pages."""
+        pagination = Pagination(limit=2, offset=6, total=8, count=2, has_more=False)
+
+        assert pagination.plan_offsets(3) == []
+
+    def test_steps_by_count_when_limit_is_zero(self):
+        """Test pages are assumed to be ``count`` items apart when the limit is not reported."""
+        pagination = Pagination(limit=0, offset=0, total=9, count=3, has_more=True)
+
+        assert pagination.step == 3
+        assert pagination.plan_offsets(5) == [3, 6]
+
+    def test_plans_single_page_when_total_is_unknown(self):
+        """Test only the next page is planned when total does not cover it."""
+        pagination = Pagination(limit=2, offset=0, total=0, count=2, has_more=True)
+
+        assert pagination.plan_offsets(3) == [2]
+
+
+@pytest.fixture(scope="module")
+def shared_sync_client():
+    """One sync client reused by every pagination test in this module."""
+    client = PayOS(client_id="c", api_key="k", checksum_key="s")
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="module")
+def shared_async_client():
+    """One async client reused by every pagination test in this module."""
+    return AsyncPayOS(client_id="c", api_key="k", checksum_key="s")
+
+
+def restore_request(client) -> None:
+    """Drop a ``request`` mock assigned on the instance so the class method is used again."""
+    vars(client).pop("request", None)
 
 
 class TestSyncPagination:
     """Test synchronous pagination."""
 
-    def test_constructs_empty_page_when_no_data(self):
+    @pytest.fixture
+    def client(self, shared_sync_client):
+        yield shared_sync_client
+        restore_request(shared_sync_client)
+
+    def test_constructs_empty_page_when_no_data(self, client):
         """Test constructing empty page when no items."""
-        client = PayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test")
 
         # Create page with empty data
@@ -26,9 +100,17 @@ class TestSyncPagination:
         assert page.pagination.total == 0
         assert not page.has_next_page()
 
-    def test_has_next_page_logic(self):
+    def test_page_and_options_use_slots(self, client):
+        """Test per-page objects carry no instance __dict__."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+        pagination = Pagination(limit=10, offset=0, total=0, count=0, has_more=False)
+        page = Page(client=client, cast_to=dict, data=[], pagination=pagination, options=options)
+
+        assert not hasattr(page, "__dict__")
+        assert not hasattr(options, "__dict__")
+
+    def test_has_next_page_logic(self, client):
         """Test hasNextPage returns correct value based on pagination data."""
-        client = PayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test", query={"offset": 0})
 
         # Page with more data available
@@ -55,9 +137,8 @@ class TestSyncPagination:
 
         assert page_no_more.has_next_page() is False
 
-    def test_has_previous_page_logic(self):
+    def test_has_previous_page_logic(self, client):
         """Test hasPreviousPage returns correct value based on offset."""
-        client = PayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test", query={"offset": 0})
 
         # First page (offset=0)
@@ -84,9 +165,8 @@ class TestSyncPagination:
 
         assert page_second.has_previous_page() is True
 
-    def test_get_next_page_calls_client_request(self):
+    def test_get_next_page_calls_client_request(self, client):
         """Test getNextPage calls client.request with updated offset."""
-        client = PayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test", query={"offset": 0})
 
         # First page
@@ -116,9 +196,8 @@ class TestSyncPagination:
         assert next_page.pagination.offset == 2
         assert not next_page.has_next_page()
 
-    def test_get_next_page_raises_error_when_no_more_pages(self):
+    def test_get_next_page_raises_error_when_no_more_pages(self, client):
         """Test getNextPage raises ValueError when no more pages available."""
-        client = PayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test")
 
         # Last page
@@ -134,9 +213,8 @@ class TestSyncPagination:
         with pytest.raises(ValueError, match="No more pages available"):
             page.get_next_page()
 
-    def test_get_previous_page_calls_client_request(self):
+    def test_get_previous_page_calls_client_request(self, client):
         """Test getPreviousPage calls client.request with updated offset."""
-        client = PayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test", query={"offset": 2})
 
         # Second page
@@ -165,9 +243,8 @@ class TestSyncPagination:
         assert prev_page.data == ["a", "b"]
         assert prev_page.pagination.offset == 0
 
-    def test_get_previous_page_raises_error_when_no_previous_pages(self):
+    def test_get_previous_page_raises_error_when_no_previous_pages(self, client):
         """Test getPreviousPage raises ValueError when at first page."""
-        client = PayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test", query={"offset": 0})
 
         # First page
@@ -183,9 +260,8 @@ class TestSyncPagination:
         with pytest.raises(ValueError, match="No previous pages available"):
             page.get_previous_page()
 
-    def test_iter_all_collects_all_items_via_paging(self):
+    def test_iter_all_collects_all_items_via_paging(self, client):
         """Test iterating over all pages collects all items."""
-        client = PayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test")
 
         # First page
@@ -211,9 +287,8 @@ class TestSyncPagination:
 
         assert collected == ["a", "b", "c", "d"]
 
-    def test_to_list_collects_all_items(self):
+    def test_to_list_collects_all_items(self, client):
         """Test to_list method collects all items from all pages."""
-        client = PayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test")
 
         # First page
@@ -239,9 +314,8 @@ class TestSyncPagination:
 
         assert result == ["a", "b", "c", "d"]
 
-    def test_page_is_directly_iterable(self):
+    def test_page_is_directly_iterable(self, client):
         """Test that Page is directly iterable using for loop."""
-        client = PayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test")
 
         # First page
@@ -269,14 +343,218 @@ class TestSyncPagination:
 
         assert collected == ["a", "b", "c", "d"]
 
+    def test_iter_all_prefetches_next_page_while_consuming_current(self, client):
+        """Test the next page is requested before the current page has been consumed."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+
+        pagination1 = Pagination(limit=2, offset=0, total=4, count=2, has_more=True)
+        page1 = Page(
+            client=client, cast_to=dict, data=["a", "b"], pagination=pagination1, options=options
+        )
+
+        page2_data = {
+            "items": ["c", "d"],
+            "pagination": {"limit": 2, "offset": 2, "total": 4, "count": 2, "hasMore": False},
+        }
+        requested = threading.Event()
+
+        def mock_request(*args, **kwargs):
+            requested.set()
+            return page2_data
+
+        client.request = mock_request
+
+        iterator = page1.iter_all(prefetch=True)
+        assert next(iterator) == "a"
+        assert requested.wait(timeout=1)
+        assert list(iterator) == ["b", "c", "d"]
+
+    def test_iter_all_without_prefetch_requests_lazily(self, client):
+        """Test prefetch=False only requests the next page once the current one is consumed."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+
+        pagination1 = Pagination(limit=2, offset=0, total=4, count=2, has_more=True)
+        page1 = Page(
+            client=client, cast_to=dict, data=["a", "b"], pagination=pagination1, options=options
+        )
+
+        page2_data = {
+            "items": ["c", "d"],
+            "pagination": {"limit": 2, "offset": 2, "total": 4, "count": 2, "hasMore": False},
+        }
+        mock_request = Mock(return_value=page2_data)
+        client.request = mock_request
+
+        iterator = page1.iter_all(prefetch=False)
+        assert [next(iterator), next(iterator)] == ["a", "b"]
+        mock_request.assert_not_called()
+        assert list(iterator) == ["c", "d"]
+        mock_request.assert_called_once()
+
+    def test_iteration_stopped_early_requests_nothing_more(self, client):
+        """Test plain iteration is lazy, so breaking out early sends no page requests."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+        first = paged_response(0)
+        page1 = Page(
+            client=client,
+            cast_to=dict,
+            data=first["items"],
+            pagination=Pagination.model_validate(first["pagination"]),
+            options=options,
+        )
+        mock_request = Mock(side_effect=lambda request_options, cast_to: paged_response(2))
+        client.request = mock_request
+
+        for _ in page1:
+            break
+
+        mock_request.assert_not_called()
+
+    def test_iter_all_prefetch_follows_planned_offsets_without_limit(self, client):
+        """Test prefetching steps through pages by ``count`` when the limit is zero."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+
+        def response(offset: int) -> dict:
+            items = list(range(offset, offset + 3))
+            return {
+                "items": items,
+                "pagination": {
+                    "limit": 0,
+                    "offset": offset,
+                    "total": 9,
+                    "count": 3,
+                    "hasMore": offset + 3 < 9,
+                },
+            }
+
+        first = response(0)
+        page1 = Page(
+            client=client,
+            cast_to=dict,
+            data=first["items"],
+            pagination=Pagination.model_validate(first["pagination"]),
+            options=options,
+        )
+        requested_offsets = []
+
+        def mock_request(request_options, cast_to):
+            requested_offsets.append(request_options.query["offset"])
+            return response(request_options.query["offset"])
+
+        client.request = mock_request
+
+        assert list(page1.iter_all(prefetch=True)) == list(range(9))
+        assert requested_offsets == [3, 6]
+
+    def test_iter_all_waits_for_prefetch_when_closed_early(self, client):
+        """Test closing the iterator early waits for the request already in flight."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+
+        pagination1 = Pagination(limit=2, offset=0, total=4, count=2, has_more=True)
+        page1 = Page(
+            client=client, cast_to=dict, data=["a", "b"], pagination=pagination1, options=options
+        )
+        started = threading.Event()
+        finished = threading.Event()
+
+        def mock_request(*args, **kwargs):
+            started.set()
+            time.sleep(0.05)
+            finished.set()
+            return paged_response(2, total=4)
+
+        client.request = mock_request
+
+        iterator = page1.iter_all(prefetch=True)
+        assert next(iterator) == "a"
+        assert started.wait(timeout=1)
+        iterator.close()
+
+        assert finished.is_set()
+
+    def test_iter_all_keeps_prefetch_depth_requests_in_flight(self, client):
+        """Test deep prefetch requests several upcoming pages and yields them in order."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+        first = paged_response(0)
+        page1 = Page(
+            client=client,
+            cast_to=dict,
+            data=first["items"],
+            pagination=Pagination.model_validate(first["pagination"]),
+            options=options,
+        )
+        requested_offsets = []
+        # Each request only returns once all three are in flight at the same time
+        all_in_flight = threading.Barrier(3, timeout=1)
+
+        def mock_request(request_options, cast_to):
+            requested_offsets.append(request_options.query["offset"])
+            all_in_flight.wait()
+            return paged_response(request_options.query["offset"])
+
+        client.request = mock_request
+
+        result = list(page1.iter_all(prefetch=True, prefetch_depth=3))
+
+        assert result == list(range(8))
+        assert sorted(requested_offsets) == [2, 4, 6]
+
+    def test_response_cache_skips_request_for_revisited_page(self):
+        """Test navigating back to a fetched page reuses the cached response."""
+        client = PayOS(client_id="c", api_key="k", checksum_key="s", response_cache=True)
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+        first = paged_response(0)
+        page1 = Page(
+            client=client,
+            cast_to=dict,
+            data=first["items"],
+            pagination=Pagination.model_validate(first["pagination"]),
+            options=options,
+        )
+        mock_request = Mock(side_effect=lambda opts, cast_to: paged_response(opts.query["offset"]))
+        client.request = mock_request
+
+        page2 = page1.get_next_page()
+        page3 = page2.get_next_page()
+        back_to_page2 = page3.get_previous_page()
+        again_page3 = back_to_page2.get_next_page()
+
+        assert back_to_page2.data == page2.data
+        assert again_page3.data == page3.data
+        assert mock_request.call_count == 2
+
+    def test_response_cache_covers_first_page_of_list(self):
+        """Test returning to the first page of a list call reuses its cached response."""
+        client = PayOS(client_id="c", api_key="k", checksum_key="s", response_cache=True)
+
+        def mock_request(request_options, cast_to):
+            response = paged_response(request_options.query["offset"])
+            return SimpleNamespace(
+                payouts=response["items"],
+                pagination=Pagination.model_validate(response["pagination"]),
+            )
+
+        mock = Mock(side_effect=mock_request)
+        client.request = mock
+
+        page1 = client.payouts.list(GetPayoutListParams(limit=2, offset=0))
+        back_to_page1 = page1.get_next_page().get_previous_page()
+
+        assert back_to_page1.data == page1.data
+        assert mock.call_count == 2
+
 
 class TestAsyncPagination:
     """Test asynchronous pagination."""
 
+    @pytest.fixture
+    def client(self, shared_async_client):
+        yield shared_async_client
+        restore_request(shared_async_client)
+
     @pytest.mark.asyncio
-    async def test_constructs_empty_page_when_no_data(self):
+    async def test_constructs_empty_page_when_no_data(self, client):
         """Test constructing empty async page when no items."""
-        client = AsyncPayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test")
 
         # Create page with empty data
@@ -290,9 +568,8 @@ class TestAsyncPagination:
         assert not page.has_next_page()
 
     @pytest.mark.asyncio
-    async def test_has_next_page_and_has_previous_page_logic(self):
+    async def test_has_next_page_and_has_previous_page_logic(self, client):
         """Test async page has_next_page and has_previous_page logic."""
-        client = AsyncPayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test", query={"offset": 0})
 
         # First page
@@ -309,9 +586,8 @@ class TestAsyncPagination:
         assert page.has_previous_page() is False
 
     @pytest.mark.asyncio
-    async def test_get_next_page_calls_client_request(self):
+    async def test_get_next_page_calls_client_request(self, client):
         """Test async getNextPage calls client.request with updated offset."""
-        client = AsyncPayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test", query={"offset": 0})
 
         # First page
@@ -343,9 +619,8 @@ class TestAsyncPagination:
         assert not next_page.has_next_page()
 
     @pytest.mark.asyncio
-    async def test_get_next_page_raises_error_when_no_more_pages(self):
+    async def test_get_next_page_raises_error_when_no_more_pages(self, client):
         """Test async getNextPage raises ValueError when no more pages available."""
-        client = AsyncPayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test")
 
         # Last page
@@ -362,9 +637,8 @@ class TestAsyncPagination:
             await page.get_next_page()
 
     @pytest.mark.asyncio
-    async def test_get_previous_page_calls_client_request(self):
+    async def test_get_previous_page_calls_client_request(self, client):
         """Test async getPreviousPage calls client.request with updated offset."""
-        client = AsyncPayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test", query={"offset": 2})
 
         # Second page
@@ -395,9 +669,8 @@ class TestAsyncPagination:
         assert prev_page.pagination.offset == 0
 
     @pytest.mark.asyncio
-    async def test_async_iteration_collects_all_items(self):
+    async def test_async_iteration_collects_all_items(self, client):
         """Test async iteration over all pages collects all items."""
-        client = AsyncPayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test")
 
         # First page
@@ -429,9 +702,8 @@ class TestAsyncPagination:
         assert collected == ["a", "b", "c", "d"]
 
     @pytest.mark.asyncio
-    async def test_to_list_collects_all_items(self):
+    async def test_to_list_collects_all_items(self, client):
         """Test async to_list method collects all items from all pages."""
-        client = AsyncPayOS(client_id="c", api_key="k", checksum_key="s")
         options = FinalRequestOptions(method="GET", path="/v1/test")
 
         # First page
@@ -459,3 +731,170 @@ class TestAsyncPagination:
         result = await page1.to_list()
 
         assert result == ["a", "b", "c", "d"]
+
+    async def test_to_list_requests_remaining_pages_concurrently(self, client):
+        """Test to_list issues every remaining page request at once when total is known."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+        first = paged_response(0)
+        page1 = AsyncPage(
+            client=client,
+            cast_to=dict,
+            data=first["items"],
+            pagination=Pagination.model_validate(first["pagination"]),
+            options=options,
+        )
+        in_flight = 0
+        all_started = asyncio.Event()
+        requested_offsets = []
+
+        async def mock_request(options, cast_to):
+            nonlocal in_flight
+            requested_offsets.append(options.query["offset"])
+            in_flight += 1
+            if in_flight == 3:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return paged_response(options.query["offset"])
+
+        client.request = mock_request
+
+        result = await page1.to_list()
+
+        assert result == list(range(8))
+        assert sorted(requested_offsets) == [2, 4, 6]
+
+    async def test_to_list_bounds_concurrency(self, client):
+        """Test to_list never has more than max_concurrency requests in flight."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+        first = paged_response(0)
+        page1 = AsyncPage(
+            client=client,
+            cast_to=dict,
+            data=first["items"],
+            pagination=Pagination.model_validate(first["pagination"]),
+            options=options,
+        )
+        in_flight = 0
+        peak = 0
+
+        async def mock_request(options, cast_to):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return paged_response(options.query["offset"])
+
+        client.request = mock_request
+
+        result = await page1.to_list(max_concurrency=2)
+
+        assert result == list(range(8))
+        assert peak == 2
+
+    async def test_to_list_walks_pages_when_total_is_unknown(self, client):
+        """Test to_list falls back to paging sequentially without a usable total."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+        page1 = AsyncPage(
+            client=client,
+            cast_to=dict,
+            data=["a", "b"],
+            pagination=Pagination(limit=2, offset=0, total=0, count=2, has_more=True),
+            options=options,
+        )
+        responses = {
+            2: {
+                "items": ["c", "d"],
+                "pagination": {"limit": 2, "offset": 2, "total": 0, "count": 2, "hasMore": True},
+            },
+            4: {
+                "items": ["e"],
+                "pagination": {"limit": 2, "offset": 4, "total": 0, "count": 1, "hasMore": False},
+            },
+        }
+
+        async def mock_request(options, cast_to):
+            return responses[options.query["offset"]]
+
+        client.request = mock_request
+
+        assert await page1.to_list() == ["a", "b", "c", "d", "e"]
+
+    async def test_iter_all_prefetches_next_page_while_consuming_current(self, client):
+        """Test the next page is requested before the current page has been consumed."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+
+        pagination1 = Pagination(limit=2, offset=0, total=4, count=2, has_more=True)
+        page1 = AsyncPage(
+            client=client, cast_to=dict, data=["a", "b"], pagination=pagination1, options=options
+        )
+
+        page2_data = {
+            "items": ["c", "d"],
+            "pagination": {"limit": 2, "offset": 2, "total": 4, "count": 2, "hasMore": False},
+        }
+        calls = []
+
+        async def mock_request(*args, **kwargs):
+            calls.append(args)
+            return page2_data
+
+        client.request = mock_request
+
+        iterator = page1.iter_all(prefetch=True)
+        assert await iterator.__anext__() == "a"
+        await asyncio.sleep(0)
+        assert len(calls) == 1
+        assert [item async for item in iterator] == ["b", "c", "d"]
+
+    async def test_iter_all_cancels_prefetch_when_closed_early(self, client):
+        """Test closing the iterator early cancels the in-flight next page request."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+
+        pagination1 = Pagination(limit=2, offset=0, total=4, count=2, has_more=True)
+        page1 = AsyncPage(
+            client=client, cast_to=dict, data=["a", "b"], pagination=pagination1, options=options
+        )
+        cancelled = asyncio.Event()
+
+        async def mock_request(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        client.request = mock_request
+
+        iterator = page1.iter_all(prefetch=True)
+        assert await iterator.__anext__() == "a"
+        await asyncio.sleep(0)
+        await iterator.aclose()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    async def test_iter_all_keeps_prefetch_depth_requests_in_flight(self, client):
+        """Test deep prefetch requests several upcoming pages and yields them in order."""
+        options = FinalRequestOptions(method="GET", path="/v1/test")
+        first = paged_response(0)
+        page1 = AsyncPage(
+            client=client,
+            cast_to=dict,
+            data=first["items"],
+            pagination=Pagination.model_validate(first["pagination"]),
+            options=options,
+        )
+        requested_offsets = []
+
+        async def mock_request(request_options, cast_to):
+            requested_offsets.append(request_options.query["offset"])
+            # Later pages answer first; items must still come out in order
+            await asyncio.sleep(0.01 * (8 - request_options.query["offset"]))
+            return paged_response(request_options.query["offset"])
+
+        client.request = mock_request
+
+        result = [item async for item in page1.iter_all(prefetch=True, prefetch_depth=3)]
+
+        assert result == list(range(8))
+        assert sorted(requested_offsets) == [2, 4, 6]
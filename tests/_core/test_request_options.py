@@ -0,0 +1,37 @@
+"""Tests for request options."""
+
+from payos._core.request_options import FinalRequestOptions
+
+
+class TestFinalRequestOptions:
+    """Test FinalRequestOptions."""
+
+    def test_with_updated_query_merges_into_copy(self):
+        """Test updates are merged into a new query dict and other options are carried over."""
+        options = FinalRequestOptions(
+            method="GET",
+            path="/v1/payouts",
+            query={"status": "SUCCEEDED", "offset": 0},
+            headers={"x-idempotency-key": "key"},
+            timeout=5,
+            max_retries=1,
+            signature_response="header",
+        )
+
+        updated = options.with_updated_query(offset=10, limit=10)
+
+        assert updated is not options
+        assert updated.query == {"status": "SUCCEEDED", "offset": 10, "limit": 10}
+        assert options.query == {"status": "SUCCEEDED", "offset": 0}
+        assert updated.method == "GET"
+        assert updated.path == "/v1/payouts"
+        assert updated.headers == {"x-idempotency-key": "key"}
+        assert updated.timeout == 5
+        assert updated.max_retries == 1
+        assert updated.signature_response == "header"
+
+    def test_with_updated_query_without_existing_query(self):
+        """Test updating options that had no query."""
+        options = FinalRequestOptions(method="GET", path="/v1/payouts")
+
+        assert options.with_updated_query(offset=0).query == {"offset": 0}
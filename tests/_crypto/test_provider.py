@@ -1,73 +1,61 @@
 """Tests for crypto provider."""
 
-import json
+import hashlib
+import hmac
 import os
 import re
-from pathlib import Path
+from uuid import UUID
 
 import pytest
 
+from payos._crypto import provider
 from payos._crypto.provider import CryptoProvider
 
 # Test constants
 CHECKSUM_KEY = "test_checksum_key"
 
-# Load test cases from JSON file
-TEST_CASES_PATH = Path(__file__).parent / "testCases.json"
-with open(TEST_CASES_PATH, "r", encoding="utf-8") as f:
-    ALL_TEST_CASES = json.load(f)
+# UUID v4 format: xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx where y is 8, 9, a, or b
+UUID_V4_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$", re.IGNORECASE
+)
 
-# Filter test cases by type
-BODY_TEST_CASES = [tc for tc in ALL_TEST_CASES if tc["type"] == "body"]
-CREATE_PAYMENT_LINK_TEST_CASES = [
-    tc for tc in ALL_TEST_CASES if tc["type"] == "create-payment-link"
-]
-HEADER_TEST_CASES = [tc for tc in ALL_TEST_CASES if tc["type"] == "header"]
+
+def test_every_signature_test_case_type_is_exercised(signature_test_cases):
+    """Test no case type in testCases.json is left without a parametrized test."""
+    assert set(signature_test_cases) <= {"body", "create-payment-link", "header"}
+    assert all(signature_test_cases.values())
 
 
 class TestCreateSignatureFromObject:
     """Test create_signature_from_object method with 'body' type test cases."""
 
-    @pytest.mark.parametrize(
-        "test_case",
-        BODY_TEST_CASES,
-        ids=lambda tc: tc["caseName"],
-    )
-    def test_body_signature(self, test_case):
+    def test_body_signature(self, body_test_case):
         """Test signature generation from object data."""
         crypto = CryptoProvider()
-        result = crypto.create_signature_from_object(test_case["payload"], CHECKSUM_KEY)
-        assert result == test_case["expect"]
+        result = crypto.create_signature_from_object(body_test_case["payload"], CHECKSUM_KEY)
+        assert result == body_test_case["expect"]
 
 
 class TestCreateSignatureOfPaymentRequest:
     """Test create_signature_of_payment_request method with 'create-payment-link' type test cases."""
 
-    @pytest.mark.parametrize(
-        "test_case",
-        CREATE_PAYMENT_LINK_TEST_CASES,
-        ids=lambda tc: tc["caseName"],
-    )
-    def test_payment_request_signature(self, test_case):
+    def test_payment_request_signature(self, create_payment_link_test_case):
         """Test signature generation for payment requests."""
         crypto = CryptoProvider()
-        result = crypto.create_signature_of_payment_request(test_case["payload"], CHECKSUM_KEY)
-        assert result == test_case["expect"]
+        result = crypto.create_signature_of_payment_request(
+            create_payment_link_test_case["payload"], CHECKSUM_KEY
+        )
+        assert result == create_payment_link_test_case["expect"]
 
 
 class TestCreateSignature:
     """Test create_signature method with 'header' type test cases."""
 
-    @pytest.mark.parametrize(
-        "test_case",
-        HEADER_TEST_CASES,
-        ids=lambda tc: tc["caseName"],
-    )
-    def test_header_signature(self, test_case):
+    def test_header_signature(self, header_test_case):
         """Test signature generation with default options."""
         crypto = CryptoProvider()
-        result = crypto.create_signature(CHECKSUM_KEY, test_case["payload"])
-        assert result == test_case["expect"]
+        result = crypto.create_signature(CHECKSUM_KEY, header_test_case["payload"])
+        assert result == header_test_case["expect"]
 
 
 class TestEdgeCases:
@@ -93,6 +81,31 @@ class TestEdgeCases:
         result = crypto.create_signature_from_object(None, CHECKSUM_KEY)
         assert result is None
 
+    def test_create_signature_from_object_reuses_key_across_calls(self):
+        """Test that repeated signing with a cached key is stable and key-specific."""
+        crypto = CryptoProvider()
+        data = {"amount": 1000, "orderCode": 123}
+
+        first = crypto.create_signature_from_object(data, CHECKSUM_KEY)
+        second = crypto.create_signature_from_object(data, CHECKSUM_KEY)
+        other_key = crypto.create_signature_from_object(data, "other_checksum_key")
+
+        assert first == second
+        assert first != other_key
+
+    def test_pre_encoded_key_matches_str_key(self):
+        """Test a checksum key passed as bytes signs exactly like its str form."""
+        crypto = CryptoProvider()
+        data = {"amount": 1000, "orderCode": 123}
+        key_bytes = CHECKSUM_KEY.encode("utf-8")
+
+        assert crypto.create_signature_from_object(
+            data, key_bytes
+        ) == crypto.create_signature_from_object(data, CHECKSUM_KEY)
+        assert crypto.create_signature(key_bytes, data) == crypto.create_signature(
+            CHECKSUM_KEY, data
+        )
+
     def test_create_signature_of_payment_request_returns_none_with_empty_key(self):
         """Test that create_signature_of_payment_request returns None when key is empty."""
         crypto = CryptoProvider()
@@ -137,12 +150,7 @@ class TestEdgeCases:
         crypto = CryptoProvider()
         uuid = crypto.create_uuid4()
 
-        # UUID v4 format: xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx
-        # where y is 8, 9, a, or b
-        uuid_v4_regex = re.compile(
-            r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$", re.IGNORECASE
-        )
-        assert uuid_v4_regex.match(uuid), f"Generated UUID '{uuid}' does not match UUID v4 format"
+        assert UUID_V4_RE.match(uuid), f"Generated UUID '{uuid}' does not match UUID v4 format"
 
     def test_create_uuid4_produces_unique_values(self):
         """Test that create_uuid4 produces unique values."""
@@ -152,6 +160,31 @@ class TestEdgeCases:
 
         assert uuid1 != uuid2, "Two consecutive UUID generations should produce different values"
 
+    def test_create_uuid4_across_pool_refills(self):
+        """Test values stay valid and unique across several batch refills."""
+        crypto = CryptoProvider()
+        uuids = [crypto.create_uuid4() for _ in range(200)]
+
+        assert len(set(uuids)) == len(uuids)
+        assert all(UUID_V4_RE.match(value) for value in uuids)
+        assert all(UUID(value).version == 4 for value in uuids)
+
+    def test_reset_uuid_pool_after_fork(self):
+        """Test the fork hook empties the pool and replaces a lock held at fork time."""
+        crypto = CryptoProvider()
+        crypto.create_uuid4()
+        held_lock = provider._uuid_pool_lock
+        held_lock.acquire()
+        try:
+            provider._reset_uuid_pool_after_fork()
+
+            assert not provider._uuid_pool
+            assert provider._uuid_pool_lock is not held_lock
+            assert not provider._uuid_pool_lock.locked()
+            assert UUID_V4_RE.match(crypto.create_uuid4())
+        finally:
+            held_lock.release()
+
     def test_create_signature_with_different_algorithms(self):
         """Test create_signature supports different hash algorithms."""
         crypto = CryptoProvider()
@@ -177,6 +210,50 @@ class TestEdgeCases:
         assert md5_sig is not None
         assert len(md5_sig) == 32  # MD5 produces 32 hex characters
 
+    def test_create_signatures_matches_create_signature_per_algorithm(self):
+        """Test create_signatures signs once per algorithm with the same canonical payload."""
+        crypto = CryptoProvider()
+        data = {"b": [2, 1], "a": "x y", "c": None}
+        algorithms = ("sha256", "sha512", "sha1", "md5")
+
+        result = crypto.create_signatures(CHECKSUM_KEY, data, algorithms=algorithms)
+
+        assert result == {
+            algorithm: crypto.create_signature(CHECKSUM_KEY, data, algorithm=algorithm)
+            for algorithm in algorithms
+        }
+
+    def test_create_signatures_rejects_unsupported_algorithm(self):
+        """Test create_signatures raises ValueError for any unknown algorithm."""
+        crypto = CryptoProvider()
+
+        with pytest.raises(ValueError, match="Unsupported algorithm: sha3"):
+            crypto.create_signatures(CHECKSUM_KEY, {"a": 1}, algorithms=("sha256", "sha3"))
+
+    def test_create_signature_matches_fresh_hmac_for_each_algorithm(self):
+        """Test cached HMAC templates produce the same digest as a freshly keyed HMAC."""
+        crypto = CryptoProvider()
+        data = {"field": "value"}
+
+        for algorithm in ["sha256", "sha512", "sha1", "md5", "sha256"]:
+            expected = hmac.new(
+                CHECKSUM_KEY.encode("utf-8"),
+                b"field=value",
+                getattr(hashlib, algorithm),
+            ).hexdigest()
+            assert crypto.create_signature(CHECKSUM_KEY, data, algorithm=algorithm) == expected
+
+    def test_create_signature_with_blake3(self):
+        """Test create_signature supports blake3 when the optional package is installed."""
+        blake3 = pytest.importorskip("blake3")
+        crypto = CryptoProvider()
+
+        expected = hmac.new(CHECKSUM_KEY.encode("utf-8"), b"field=value", blake3.blake3).hexdigest()
+        result = crypto.create_signature(CHECKSUM_KEY, {"field": "value"}, algorithm="blake3")
+
+        assert result == expected
+        assert len(result) == 64
+
     def test_create_signature_with_unsupported_algorithm_raises_error(self):
         """Test that create_signature raises ValueError for unsupported algorithms."""
         crypto = CryptoProvider()
@@ -1,18 +1,96 @@
-"""Shared pytest fixtures for payOS tests."""
+"""Shared pytest fixtures and helpers for payOS tests."""
+
+import asyncio
+import inspect
+from collections.abc import Sequence
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Union
+from unittest.mock import MagicMock
 
 import pytest
-from unittest.mock import Mock
 
+from payos import AsyncPayOS, PayOS
+from payos._crypto.provider import CryptoProvider
+from payos.utils import json_dumps, json_loads
 
-@pytest.fixture
-def test_credentials():
-    """Standard test credentials for creating clients."""
-    return {
+SIGNATURE_TEST_CASES_PATH = Path(__file__).parent / "_crypto" / "testCases.json"
+
+# Test argument name -> ``type`` of the signature test cases it is parametrized with
+SIGNATURE_TEST_CASE_ARGS = {
+    "body_test_case": "body",
+    "create_payment_link_test_case": "create-payment-link",
+    "header_test_case": "header",
+}
+
+
+@cache
+def load_signature_test_cases() -> dict[str, list[dict[str, Any]]]:
+    """Parse testCases.json once and group the cases by type in a single pass."""
+    cases_by_type: dict[str, list[dict[str, Any]]] = {}
+    for test_case in json_loads(SIGNATURE_TEST_CASES_PATH.read_bytes()):
+        cases_by_type.setdefault(test_case["type"], []).append(test_case)
+    return cases_by_type
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize signature tests with the shared test cases of their type."""
+    for argname, case_type in SIGNATURE_TEST_CASE_ARGS.items():
+        if argname in metafunc.fixturenames:
+            metafunc.parametrize(
+                argname,
+                load_signature_test_cases().get(case_type, []),
+                ids=lambda tc: tc["caseName"],
+            )
+
+
+@pytest.fixture(scope="session")
+def signature_test_cases() -> dict[str, list[dict[str, Any]]]:
+    """All signature test cases from testCases.json, grouped by type."""
+    return load_signature_test_cases()
+
+
+TEST_CREDENTIALS = MappingProxyType(
+    {
         "client_id": "test-client-id",
         "api_key": "test-api-key",
         "checksum_key": "test-checksum-key",
         "base_url": "https://api-test.payos.vn",
     }
+)
+
+
+@pytest.fixture(scope="session")
+def test_credentials():
+    """Standard test credentials for creating clients; read-only, spread them with ``**``."""
+    return TEST_CREDENTIALS
+
+
+# Success envelope of API responses, signed with the stub signature; only ``data`` varies, so it
+# is read-only
+ENVELOPE = MappingProxyType({"code": "00", "desc": "success", "signature": "mock-signature"})
+
+
+def encode_json(value: Any) -> bytes:
+    """``value`` serialized with ``json_dumps``, as bytes whichever JSON backend is active."""
+    body = json_dumps(value)
+    return body if isinstance(body, bytes) else body.encode("utf-8")
+
+
+def success_json(data: Any) -> dict[str, Any]:
+    """Signed success response around ``data``."""
+    return {**ENVELOPE, "data": data}
+
+
+def success_body(data: Any) -> bytes:
+    """Encoded signed success response around ``data``."""
+    return encode_json(success_json(data))
+
+
+async def resolve(result: Any) -> Any:
+    """Await ``result`` if it came from the async client."""
+    return await result if inspect.isawaitable(result) else result
 
 
 @pytest.fixture
@@ -21,23 +99,84 @@ def mock_signature():
     return "mock-signature"
 
 
+def make_mock_crypto(signature: str) -> MagicMock:
+    """Build a crypto provider mock whose attributes are checked against CryptoProvider."""
+    mock = MagicMock(spec=CryptoProvider)
+    mock.create_signature_of_payment_request.return_value = signature
+    mock.create_signature_from_object.return_value = signature
+    mock.create_signature.return_value = signature
+    mock.create_uuid4.return_value = "generated-uuid"
+    return mock
+
+
+class StubCryptoProvider(CryptoProvider):
+    """CryptoProvider that returns fixed values.
+
+    Cheaper than a MagicMock for tests that neither configure nor inspect crypto calls.
+    """
+
+    def __init__(self, signature: str) -> None:
+        self.signature = signature
+
+    def create_signature_from_object(self, data: Any, key: Union[str, bytes]) -> str:
+        return self.signature
+
+    def create_signature_of_payment_request(self, data: Any, key: Union[str, bytes]) -> str:
+        return self.signature
+
+    def create_signatures(
+        self,
+        secret_key: Union[str, bytes],
+        json_data: Any,
+        *,
+        encode_uri: bool = True,
+        sort_arrays: bool = False,
+        algorithms: Sequence[str] = ("sha256",),
+    ) -> dict[str, str]:
+        return dict.fromkeys(algorithms, self.signature)
+
+    def create_uuid4(self) -> str:
+        return "generated-uuid"
+
+
+@pytest.fixture(scope="session")
+def stub_crypto():
+    """Fixed-value crypto provider shared by the whole session."""
+    return StubCryptoProvider("mock-signature")
+
+
 @pytest.fixture
 def mock_crypto_sync(mock_signature):
     """Mock crypto provider for sync client."""
-    mock = Mock()
-    mock.create_signature_of_payment_request.return_value = mock_signature
-    mock.create_signature_from_object.return_value = mock_signature
-    mock.create_signature.return_value = mock_signature
-    mock.create_uuid4.return_value = "generated-uuid"
-    return mock
+    return make_mock_crypto(mock_signature)
 
 
 @pytest.fixture
 def mock_crypto_async(mock_signature):
-    """Mock crypto provider for async client."""
-    mock = Mock()
-    mock.create_signature_of_payment_request.return_value = mock_signature
-    mock.create_signature_from_object.return_value = mock_signature
-    mock.create_signature.return_value = mock_signature
-    mock.create_uuid4.return_value = "generated-uuid"
-    return mock
+    """Mock crypto provider for async client.
+
+    CryptoProvider is synchronous in both clients, so this is a spec'd MagicMock as well.
+    """
+    return make_mock_crypto(mock_signature)
+
+
+@pytest.fixture(scope="session")
+def payos_client():
+    """Sync client built once with the standard test credentials."""
+    client = PayOS(**TEST_CREDENTIALS)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def async_payos_client():
+    """Async client built once with the standard test credentials."""
+    client = AsyncPayOS(**TEST_CREDENTIALS)
+    yield client
+    asyncio.run(client.aclose())
+
+
+@pytest.fixture(params=["payos_client", "async_payos_client"], ids=["sync", "async"])
+def client(request: pytest.FixtureRequest):
+    """Each shared client in turn; async results still have to be awaited."""
+    return request.getfixturevalue(request.param)
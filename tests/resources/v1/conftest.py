@@ -0,0 +1,103 @@
+"""Shared fixtures for v1 resource tests.
+
+The clients here are served by an ``httpx.MockTransport`` that answers from a ``(method, path)``
+route table, so the payouts tests skip pytest-httpx's per-request matching. Their crypto
+provider mock is passed to the constructor once and reset before every test. Modules that need
+request matching or callbacks (batch payouts) define their own clients and keep using
+``httpx_mock``.
+"""
+
+import asyncio
+from collections.abc import Mapping
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from payos import AsyncPayOS, PayOS
+from payos._crypto.provider import CryptoProvider
+
+# Response headers are shared by every route; read-only since httpx copies them per response
+JSON_HEADERS = MappingProxyType({"content-type": "application/json"})
+SIGNED_JSON_HEADERS = MappingProxyType({**JSON_HEADERS, "x-signature": "mock-signature"})
+
+
+class MockRoutes:
+    """Canned API responses keyed by ``(method, path)``."""
+
+    def __init__(self) -> None:
+        self._routes: dict[tuple[str, str], tuple[bytes, Mapping[str, str]]] = {}
+        self._requested: set[tuple[str, str]] = set()
+
+    def add(self, method: str, path: str, content: bytes, *, signed: bool = True) -> None:
+        """Answer ``method path`` with the pre-encoded JSON body ``content``.
+
+        Args:
+            method: HTTP method of the route.
+            path: URL path of the route, without the query string.
+            content: Encoded response body, passed to the transport as-is.
+            signed: Whether to send an ``x-signature`` header.
+        """
+        self._routes[(method, path)] = (content, SIGNED_JSON_HEADERS if signed else JSON_HEADERS)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        route = (request.method, request.url.path)
+        if route not in self._routes:
+            raise AssertionError(f"No mock response for {request.method} {request.url}")
+        self._requested.add(route)
+        content, headers = self._routes[route]
+        return httpx.Response(200, content=content, headers=headers)
+
+    def reset(self) -> None:
+        """Check every route was requested, then drop them all."""
+        unrequested = self._routes.keys() - self._requested
+        self._routes.clear()
+        self._requested.clear()
+        assert not unrequested, f"Mock routes were not requested: {sorted(unrequested)}"
+
+
+@pytest.fixture(scope="session")
+def route_table():
+    """Route table behind the shared v1 clients."""
+    return MockRoutes()
+
+
+@pytest.fixture
+def mock_routes(route_table):
+    """The route table, emptied after the test."""
+    yield route_table
+    route_table.reset()
+
+
+@pytest.fixture(scope="session")
+def session_crypto():
+    """Crypto provider mock injected into the shared v1 clients."""
+    return MagicMock(spec=CryptoProvider)
+
+
+@pytest.fixture(autouse=True)
+def mock_crypto(session_crypto, mock_signature):
+    """The shared crypto mock with its calls and return values reset for the current test."""
+    session_crypto.reset_mock(return_value=True)
+    session_crypto.create_signature_of_payment_request.return_value = mock_signature
+    session_crypto.create_signature_from_object.return_value = mock_signature
+    session_crypto.create_signature.return_value = mock_signature
+    session_crypto.create_uuid4.return_value = "generated-uuid"
+    return session_crypto
+
+
+@pytest.fixture(scope="session")
+def payos_client(test_credentials, route_table, session_crypto):
+    """Sync client whose requests are answered by the route table."""
+    http_client = httpx.Client(transport=httpx.MockTransport(route_table.handle))
+    yield PayOS(**test_credentials, http_client=http_client, crypto=session_crypto)
+    http_client.close()
+
+
+@pytest.fixture(scope="session")
+def async_payos_client(test_credentials, route_table, session_crypto):
+    """Async client whose requests are answered by the route table."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(route_table.handle))
+    yield AsyncPayOS(**test_credentials, http_client=http_client, crypto=session_crypto)
+    asyncio.run(http_client.aclose())
@@ -0,0 +1,226 @@
+"""Shared fixtures for batch payout tests.
+
+Request models are trusted test data, built once per session with ``model_construct``. Response
+payloads are written as the API's camelCase JSON, so no models are built for the mock side.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from payos import AsyncPayOS, PayOS
+from payos._crypto.provider import CryptoProvider
+from payos.types.v1 import PayoutBatchItem, PayoutBatchRequest
+
+
+@pytest.fixture(scope="session")
+def batch_crypto():
+    """Crypto provider mock injected into the shared batch clients."""
+    mock = MagicMock(spec=CryptoProvider)
+    mock.create_signature.return_value = "mock-signature"
+    mock.create_uuid4.return_value = "generated-uuid"
+    return mock
+
+
+@pytest.fixture(scope="session")
+def payos_client(test_credentials, batch_crypto):
+    """Sync client shared by every batch test."""
+    client = PayOS(**test_credentials, crypto=batch_crypto)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def async_payos_client(test_credentials, batch_crypto):
+    """Async client shared by every batch test."""
+    client = AsyncPayOS(**test_credentials, crypto=batch_crypto)
+    yield client
+    asyncio.run(client.aclose())
+
+
+BASE_BATCH_ITEM = PayoutBatchItem.model_construct(
+    reference_id="ref-1",
+    amount=2000,
+    description="batch payout",
+    to_bin="970422",
+    to_account_number="0123456789",
+)
+
+
+def batch_item(**update):
+    """Copy of BASE_BATCH_ITEM with ``update`` applied."""
+    return BASE_BATCH_ITEM.model_copy(update=update)
+
+
+# First item of the multi-item batches; requests are never mutated, so they share the instance
+FIRST_BATCH_ITEM = batch_item(description="batch payout 1")
+
+
+@pytest.fixture(scope="session")
+def single_item_batch_request():
+    """Batch request with a single payout item."""
+    return PayoutBatchRequest.model_construct(
+        reference_id="batch-ref-1",
+        category=["salary"],
+        validate_destination=True,
+        payouts=[BASE_BATCH_ITEM],
+    )
+
+
+@pytest.fixture(scope="session")
+def multi_item_batch_request(single_item_batch_request):
+    """Batch request with three payout items."""
+    return single_item_batch_request.model_copy(
+        update={
+            "reference_id": "batch-ref-multi",
+            "category": ["salary", "bonus"],
+            "payouts": [
+                FIRST_BATCH_ITEM,
+                batch_item(
+                    reference_id="ref-2",
+                    amount=3000,
+                    description="batch payout 2",
+                    to_account_number="9876543210",
+                ),
+                batch_item(
+                    reference_id="ref-3",
+                    amount=1500,
+                    description="batch payout 3",
+                    to_account_number="1122334455",
+                ),
+            ],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def partial_completed_batch_request(single_item_batch_request):
+    """Batch request whose second payout item fails."""
+    return single_item_batch_request.model_copy(
+        update={
+            "reference_id": "batch-ref-partial",
+            "payouts": [
+                FIRST_BATCH_ITEM,
+                batch_item(
+                    reference_id="ref-2",
+                    amount=3000,
+                    description="batch payout 2",
+                    to_account_number="9999999999",
+                ),
+            ],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def single_item_response_data():
+    """``data`` of the API response for single_item_batch_request."""
+    return {
+        "id": "batch-id",
+        "referenceId": "batch-ref-1",
+        "transactions": [
+            {
+                "id": "txn-id",
+                "referenceId": "ref-1",
+                "amount": 2000,
+                "description": "batch payout",
+                "toBin": "970422",
+                "toAccountNumber": "0123456789",
+                "toAccountName": "NGUYEN VAN A",
+                "reference": "FT-REFERENCE",
+                "transactionDatetime": "2025-12-12T09:00:00+07:00",
+                "state": "SUCCEEDED",
+            }
+        ],
+        "category": ["salary"],
+        "approvalState": "COMPLETED",
+        "createdAt": "2025-12-12T09:00:00+07:00",
+    }
+
+
+@pytest.fixture(scope="session")
+def multi_item_response_data():
+    """``data`` of the API response for multi_item_batch_request."""
+    return {
+        "id": "batch-id-multi",
+        "referenceId": "batch-ref-multi",
+        "transactions": [
+            {
+                "id": "txn-1",
+                "referenceId": "ref-1",
+                "amount": 2000,
+                "description": "batch payout 1",
+                "toBin": "970422",
+                "toAccountNumber": "0123456789",
+                "toAccountName": "NGUYEN VAN A",
+                "reference": "FT-REF-1",
+                "transactionDatetime": "2025-12-12T09:00:00+07:00",
+                "state": "SUCCEEDED",
+            },
+            {
+                "id": "txn-2",
+                "referenceId": "ref-2",
+                "amount": 3000,
+                "description": "batch payout 2",
+                "toBin": "970422",
+                "toAccountNumber": "9876543210",
+                "toAccountName": "TRAN THI B",
+                "reference": "FT-REF-2",
+                "transactionDatetime": "2025-12-12T09:00:00+07:00",
+                "state": "SUCCEEDED",
+            },
+            {
+                "id": "txn-3",
+                "referenceId": "ref-3",
+                "amount": 1500,
+                "description": "batch payout 3",
+                "toBin": "970422",
+                "toAccountNumber": "1122334455",
+                "toAccountName": "LE VAN C",
+                "reference": "FT-REF-3",
+                "transactionDatetime": "2025-12-12T09:00:00+07:00",
+                "state": "SUCCEEDED",
+            },
+        ],
+        "category": ["salary", "bonus"],
+        "approvalState": "COMPLETED",
+        "createdAt": "2025-12-12T09:00:00+07:00",
+    }
+
+
+@pytest.fixture(scope="session")
+def partial_completed_response_data():
+    """``data`` of the PARTIAL_COMPLETED API response for partial_completed_batch_request."""
+    return {
+        "id": "batch-id-partial",
+        "referenceId": "batch-ref-partial",
+        "transactions": [
+            {
+                "id": "txn-1",
+                "referenceId": "ref-1",
+                "amount": 2000,
+                "description": "batch payout 1",
+                "toBin": "970422",
+                "toAccountNumber": "0123456789",
+                "toAccountName": "NGUYEN VAN A",
+                "reference": "FT-REF-1",
+                "transactionDatetime": "2025-12-12T09:00:00+07:00",
+                "state": "SUCCEEDED",
+            },
+            {
+                "id": "txn-2",
+                "referenceId": "ref-2",
+                "amount": 3000,
+                "description": "batch payout 2",
+                "toBin": "970422",
+                "toAccountNumber": "9999999999",
+                "errorMessage": "error message",
+                "errorCode": "error code",
+                "state": "FAILED",
+            },
+        ],
+        "category": ["salary"],
+        "approvalState": "PARTIAL_COMPLETED",
+        "createdAt": "2025-12-12T09:00:00+07:00",
+    }
@@ -1,870 +1,173 @@
 """Tests for batch payout resource."""
 
+from typing import TYPE_CHECKING, Any
+
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from payos import AsyncPayOS, PayOS
-from payos.types.v1 import Payout, PayoutBatchItem, PayoutBatchRequest, PayoutTransaction
-
-# Constants
-CLIENT_ID = "test-client-id"
-API_KEY = "test-api-key"
-CHECKSUM_KEY = "test-checksum-key"
-BASE_URL = "https://api-test.payos.vn"
-
-
-class TestBatch:
-    """Synchronous tests for Batch."""
-
-    def test_create_batch_single_item(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating batch payout with single item."""
-        batch_request = PayoutBatchRequest(
-            reference_id="batch-ref-1",
-            category=["salary"],
-            validate_destination=True,
-            payouts=[
-                PayoutBatchItem(
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                )
-            ],
-        )
-
-        mock_payout_response = Payout(
-            id="batch-id",
-            reference_id="batch-ref-1",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REFERENCE",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                )
-            ],
-            category=["salary"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/batch",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payouts.batch.create(batch_request)
-
-        assert result.id == "batch-id"
-        assert result.reference_id == "batch-ref-1"
-        assert len(result.transactions) == 1
-        assert result.transactions[0].state == "SUCCEEDED"
-        assert result.approval_state == "COMPLETED"
-        assert result.category == ["salary"]
-
-    def test_create_batch_multiple_items(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating batch payout with multiple items."""
-        batch_request = PayoutBatchRequest(
-            reference_id="batch-ref-multi",
-            category=["salary", "bonus"],
-            validate_destination=True,
-            payouts=[
-                PayoutBatchItem(
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout 1",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                ),
-                PayoutBatchItem(
-                    reference_id="ref-2",
-                    amount=3000,
-                    description="batch payout 2",
-                    to_bin="970422",
-                    to_account_number="9876543210",
-                ),
-                PayoutBatchItem(
-                    reference_id="ref-3",
-                    amount=1500,
-                    description="batch payout 3",
-                    to_bin="970422",
-                    to_account_number="1122334455",
-                ),
-            ],
-        )
-
-        mock_payout_response = Payout(
-            id="batch-id-multi",
-            reference_id="batch-ref-multi",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-1",
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout 1",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REF-1",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                ),
-                PayoutTransaction(
-                    id="txn-2",
-                    reference_id="ref-2",
-                    amount=3000,
-                    description="batch payout 2",
-                    to_bin="970422",
-                    to_account_number="9876543210",
-                    to_account_name="TRAN THI B",
-                    reference="FT-REF-2",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                ),
-                PayoutTransaction(
-                    id="txn-3",
-                    reference_id="ref-3",
-                    amount=1500,
-                    description="batch payout 3",
-                    to_bin="970422",
-                    to_account_number="1122334455",
-                    to_account_name="LE VAN C",
-                    reference="FT-REF-3",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                ),
-            ],
-            category=["salary", "bonus"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/batch",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payouts.batch.create(batch_request)
-
-        assert result.id == "batch-id-multi"
-        assert result.reference_id == "batch-ref-multi"
-        assert len(result.transactions) == 3
-        assert result.category == ["salary", "bonus"]
-        assert result.approval_state == "COMPLETED"
-
-    def test_create_batch_without_category(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating batch payout without category."""
-        batch_request = PayoutBatchRequest(
-            reference_id="batch-ref-no-cat",
-            category=None,
-            validate_destination=False,
-            payouts=[
-                PayoutBatchItem(
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                )
-            ],
-        )
-
-        mock_payout_response = Payout(
-            id="batch-id",
-            reference_id="batch-ref-no-cat",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REFERENCE",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                )
-            ],
-            category=None,
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/batch",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payouts.batch.create(batch_request)
-
-        assert result.id == "batch-id"
-        assert result.reference_id == "batch-ref-no-cat"
-        assert result.category is None
-
-    def test_create_batch_custom_idempotency_key(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating batch payout with custom idempotency key."""
-        custom_idempotency_key = "custom-batch-uuid-12345"
-
-        batch_request = PayoutBatchRequest(
-            reference_id="batch-ref",
-            category=["salary"],
-            validate_destination=True,
-            payouts=[
-                PayoutBatchItem(
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                )
-            ],
-        )
-
-        mock_payout_response = Payout(
-            id="batch-id",
-            reference_id="batch-ref",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REFERENCE",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                )
-            ],
-            category=["salary"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/batch",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payouts.batch.create(batch_request, idempotency_key=custom_idempotency_key)
-
-        assert result.id == "batch-id"
-        assert result.reference_id == "batch-ref"
-
-        request = httpx_mock.get_request()
-        assert request is not None
-        assert request.headers["x-idempotency-key"] == custom_idempotency_key
-
-    def test_create_batch_partial_completed(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating batch payout with PARTIAL_COMPLETED state."""
-        batch_request = PayoutBatchRequest(
-            reference_id="batch-ref-partial",
-            category=["salary"],
-            validate_destination=True,
-            payouts=[
-                PayoutBatchItem(
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout 1",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                ),
-                PayoutBatchItem(
-                    reference_id="ref-2",
-                    amount=3000,
-                    description="batch payout 2",
-                    to_bin="970422",
-                    to_account_number="9999999999",
-                ),
-            ],
-        )
-
-        mock_payout_response = Payout(
-            id="batch-id-partial",
-            reference_id="batch-ref-partial",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-1",
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout 1",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REF-1",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                ),
-                PayoutTransaction(
-                    id="txn-2",
-                    reference_id="ref-2",
-                    amount=3000,
-                    description="batch payout 2",
-                    to_bin="970422",
-                    to_account_number="9999999999",
-                    to_account_name=None,
-                    reference=None,
-                    transaction_datetime=None,
-                    error_message="error message",
-                    error_code="error code",
-                    state="FAILED",
-                ),
-            ],
-            category=["salary"],
-            approval_state="PARTIAL_COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/batch",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payouts.batch.create(batch_request)
-
-        assert result.id == "batch-id-partial"
-        assert result.approval_state == "PARTIAL_COMPLETED"
-        assert result.transactions[0].state == "SUCCEEDED"
-        assert result.transactions[1].state == "FAILED"
-        assert result.transactions[1].error_message == "error message"
-        assert result.transactions[1].error_code == "error code"
-
-
-class TestAsyncBatch:
-    """Asynchronous tests for AsyncBatch."""
-
-    @pytest.mark.asyncio
-    async def test_create_batch_single_item(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating batch payout with single item."""
-        batch_request = PayoutBatchRequest(
-            reference_id="batch-ref-1",
-            category=["salary"],
-            validate_destination=True,
-            payouts=[
-                PayoutBatchItem(
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                )
-            ],
-        )
-
-        mock_payout_response = Payout(
-            id="batch-id",
-            reference_id="batch-ref-1",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REFERENCE",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                )
-            ],
-            category=["salary"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/batch",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payouts.batch.create(batch_request)
-
-        assert result.id == "batch-id"
-        assert result.reference_id == "batch-ref-1"
-        assert len(result.transactions) == 1
-        assert result.transactions[0].state == "SUCCEEDED"
-        assert result.approval_state == "COMPLETED"
-        assert result.category == ["salary"]
-
-    @pytest.mark.asyncio
-    async def test_create_batch_multiple_items(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating batch payout with multiple items."""
-        batch_request = PayoutBatchRequest(
-            reference_id="batch-ref-multi",
-            category=["salary", "bonus"],
-            validate_destination=True,
-            payouts=[
-                PayoutBatchItem(
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout 1",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                ),
-                PayoutBatchItem(
-                    reference_id="ref-2",
-                    amount=3000,
-                    description="batch payout 2",
-                    to_bin="970422",
-                    to_account_number="9876543210",
-                ),
-                PayoutBatchItem(
-                    reference_id="ref-3",
-                    amount=1500,
-                    description="batch payout 3",
-                    to_bin="970422",
-                    to_account_number="1122334455",
-                ),
-            ],
-        )
-
-        mock_payout_response = Payout(
-            id="batch-id-multi",
-            reference_id="batch-ref-multi",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-1",
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout 1",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REF-1",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                ),
-                PayoutTransaction(
-                    id="txn-2",
-                    reference_id="ref-2",
-                    amount=3000,
-                    description="batch payout 2",
-                    to_bin="970422",
-                    to_account_number="9876543210",
-                    to_account_name="TRAN THI B",
-                    reference="FT-REF-2",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                ),
-                PayoutTransaction(
-                    id="txn-3",
-                    reference_id="ref-3",
-                    amount=1500,
-                    description="batch payout 3",
-                    to_bin="970422",
-                    to_account_number="1122334455",
-                    to_account_name="LE VAN C",
-                    reference="FT-REF-3",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                ),
-            ],
-            category=["salary", "bonus"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/batch",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payouts.batch.create(batch_request)
-
-        assert result.id == "batch-id-multi"
-        assert result.reference_id == "batch-ref-multi"
-        assert len(result.transactions) == 3
-        assert result.category == ["salary", "bonus"]
-        assert result.approval_state == "COMPLETED"
+from payos.utils import json_loads
+from tests.conftest import resolve, success_body
 
-    @pytest.mark.asyncio
-    async def test_create_batch_without_category(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating batch payout without category."""
-        batch_request = PayoutBatchRequest(
-            reference_id="batch-ref-no-cat",
-            category=None,
-            validate_destination=False,
-            payouts=[
-                PayoutBatchItem(
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                )
-            ],
-        )
-
-        mock_payout_response = Payout(
-            id="batch-id",
-            reference_id="batch-ref-no-cat",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REFERENCE",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                )
-            ],
-            category=None,
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/batch",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payouts.batch.create(batch_request)
-
-        assert result.id == "batch-id"
-        assert result.reference_id == "batch-ref-no-cat"
-        assert result.category is None
-
-    @pytest.mark.asyncio
-    async def test_create_batch_custom_idempotency_key(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating batch payout with custom idempotency key."""
-        custom_idempotency_key = "custom-batch-uuid-12345"
-
-        batch_request = PayoutBatchRequest(
-            reference_id="batch-ref",
-            category=["salary"],
-            validate_destination=True,
-            payouts=[
-                PayoutBatchItem(
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                )
-            ],
-        )
-
-        mock_payout_response = Payout(
-            id="batch-id",
-            reference_id="batch-ref",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REFERENCE",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                )
-            ],
-            category=["salary"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
+if TYPE_CHECKING:
+    from payos.types.v1 import Payout
 
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/batch",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
+# Only this module uses the session clients and fixtures from the batch conftest.py; keeping it
+# on one xdist worker under --dist loadgroup builds them once
+pytestmark = pytest.mark.xdist_group("batch_payouts")
 
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
+# Constants
+BASE_URL = "https://api-test.payos.vn"
 
-        result = await client.payouts.batch.create(
-            batch_request, idempotency_key=custom_idempotency_key
-        )
+# Batch create scenarios. "request" and "response" name the conftest fixtures the scenario
+# starts from; the optional updates derive a variant without building new models.
+BATCH_CASES: dict[str, dict[str, Any]] = {
+    "single": {
+        "request": "single_item_batch_request",
+        "response": "single_item_response_data",
+        "expected": {
+            "id": "batch-id",
+            "reference_id": "batch-ref-1",
+            "approval_state": "COMPLETED",
+            "category": ["salary"],
+        },
+        "transaction_states": ["SUCCEEDED"],
+    },
+    "multi": {
+        "request": "multi_item_batch_request",
+        "response": "multi_item_response_data",
+        "expected": {
+            "id": "batch-id-multi",
+            "reference_id": "batch-ref-multi",
+            "approval_state": "COMPLETED",
+            "category": ["salary", "bonus"],
+        },
+        "transaction_states": ["SUCCEEDED", "SUCCEEDED", "SUCCEEDED"],
+    },
+    "no_cat": {
+        "request": "single_item_batch_request",
+        "response": "single_item_response_data",
+        "request_update": {
+            "reference_id": "batch-ref-no-cat",
+            "category": None,
+            "validate_destination": False,
+        },
+        "response_update": {"referenceId": "batch-ref-no-cat", "category": None},
+        "expected": {
+            "id": "batch-id",
+            "reference_id": "batch-ref-no-cat",
+            "approval_state": "COMPLETED",
+            "category": None,
+        },
+        "transaction_states": ["SUCCEEDED"],
+    },
+    "idempotency": {
+        "request": "single_item_batch_request",
+        "response": "single_item_response_data",
+        "request_update": {"reference_id": "batch-ref"},
+        "response_update": {"referenceId": "batch-ref"},
+        "idempotency_key": "custom-batch-uuid-12345",
+        "expected": {
+            "id": "batch-id",
+            "reference_id": "batch-ref",
+            "approval_state": "COMPLETED",
+            "category": ["salary"],
+        },
+        "transaction_states": ["SUCCEEDED"],
+    },
+    "partial": {
+        "request": "partial_completed_batch_request",
+        "response": "partial_completed_response_data",
+        "expected": {
+            "id": "batch-id-partial",
+            "reference_id": "batch-ref-partial",
+            "approval_state": "PARTIAL_COMPLETED",
+            "category": ["salary"],
+        },
+        "transaction_states": ["SUCCEEDED", "FAILED"],
+        "transaction_errors": [(None, None), ("error message", "error code")],
+    },
+}
+
+
+def batch_request_for(request: pytest.FixtureRequest, case: dict[str, Any]) -> Any:
+    """Return the batch request model of a scenario."""
+    batch_request = request.getfixturevalue(case["request"])
+    if "request_update" in case:
+        batch_request = batch_request.model_copy(update=case["request_update"])
+    return batch_request
+
+
+@pytest.fixture(scope="session")
+def batch_responses(request: pytest.FixtureRequest) -> dict[str, bytes]:
+    """Serialized API responses of every scenario, keyed by the batch reference id."""
+    responses = {}
+    for case in BATCH_CASES.values():
+        data = request.getfixturevalue(case["response"])
+        if "response_update" in case:
+            data = {**data, **case["response_update"]}
+        responses[batch_request_for(request, case).reference_id] = success_body(data)
+    return responses
+
+
+@pytest.fixture(autouse=True)
+def batch_endpoint(httpx_mock: HTTPXMock, batch_responses: dict[str, bytes]) -> list[str]:
+    """Answer POST /v1/payouts/batch from the response table by the request's reference id.
+
+    Returns the idempotency keys the endpoint received, in order.
+    """
+    idempotency_keys: list[str] = []
+
+    def respond(sent: httpx.Request) -> httpx.Response:
+        idempotency_keys.append(sent.headers["x-idempotency-key"])
+        return httpx.Response(
+            200,
+            content=batch_responses[json_loads(sent.content)["referenceId"]],
+            headers={"content-type": "application/json", "x-signature": "mock-signature"},
+        )
+
+    httpx_mock.add_callback(
+        respond, url=f"{BASE_URL}/v1/payouts/batch", method="POST", is_reusable=True
+    )
+    return idempotency_keys
+
+
+def assert_batch_result(
+    result: "Payout", case: dict[str, Any], idempotency_keys: list[str]
+) -> None:
+    for name, value in case["expected"].items():
+        assert getattr(result, name) == value
+    assert [transaction.state for transaction in result.transactions] == case["transaction_states"]
+    if "transaction_errors" in case:
+        assert [
+            (transaction.error_message, transaction.error_code)
+            for transaction in result.transactions
+        ] == case["transaction_errors"]
+    # Without a custom key the client asks the (mocked) crypto provider for one
+    assert idempotency_keys == [case.get("idempotency_key", "generated-uuid")]
 
-        assert result.id == "batch-id"
-        assert result.reference_id == "batch-ref"
 
-        request = httpx_mock.get_request()
-        assert request is not None
-        assert request.headers["x-idempotency-key"] == custom_idempotency_key
+class TestBatch:
+    """Tests for Batch and AsyncBatch, run against both clients."""
 
     @pytest.mark.asyncio
-    async def test_create_batch_partial_completed(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
+    @pytest.mark.parametrize("case", BATCH_CASES.values(), ids=BATCH_CASES.keys())
+    @pytest.mark.parametrize(
+        "client_fixture", ["payos_client", "async_payos_client"], ids=["sync", "async"]
+    )
+    async def test_create_batch(
+        self,
+        batch_endpoint: list[str],
+        request: pytest.FixtureRequest,
+        client_fixture: str,
+        case: dict[str, Any],
     ):
-        """Test creating batch payout with PARTIAL_COMPLETED state."""
-        batch_request = PayoutBatchRequest(
-            reference_id="batch-ref-partial",
-            category=["salary"],
-            validate_destination=True,
-            payouts=[
-                PayoutBatchItem(
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout 1",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                ),
-                PayoutBatchItem(
-                    reference_id="ref-2",
-                    amount=3000,
-                    description="batch payout 2",
-                    to_bin="970422",
-                    to_account_number="9999999999",
-                ),
-            ],
-        )
-
-        mock_payout_response = Payout(
-            id="batch-id-partial",
-            reference_id="batch-ref-partial",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-1",
-                    reference_id="ref-1",
-                    amount=2000,
-                    description="batch payout 1",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REF-1",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                ),
-                PayoutTransaction(
-                    id="txn-2",
-                    reference_id="ref-2",
-                    amount=3000,
-                    description="batch payout 2",
-                    to_bin="970422",
-                    to_account_number="9999999999",
-                    to_account_name=None,
-                    reference=None,
-                    transaction_datetime=None,
-                    error_message="error message",
-                    error_code="error code",
-                    state="FAILED",
-                ),
-            ],
-            category=["salary"],
-            approval_state="PARTIAL_COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
+        """Test creating batch payouts across the shared scenarios."""
+        batch_request = batch_request_for(request, case)
+        client = request.getfixturevalue(client_fixture)
 
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/batch",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
+        result = await resolve(
+            client.payouts.batch.create(batch_request, idempotency_key=case.get("idempotency_key"))
         )
 
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payouts.batch.create(batch_request)
-
-        assert result.id == "batch-id-partial"
-        assert result.approval_state == "PARTIAL_COMPLETED"
-        assert result.transactions[0].state == "SUCCEEDED"
-        assert result.transactions[1].state == "FAILED"
-        assert result.transactions[1].error_message == "error message"
-        assert result.transactions[1].error_code == "error code"
+        assert_batch_result(result, case, batch_endpoint)
@@ -1,628 +1,182 @@
 """Tests for payouts resource."""
 
-import pytest
-from pytest_httpx import HTTPXMock
-
-from payos import AsyncPayOS, PayOS
-from payos.types.v1 import (
-    EstimateCredit,
-    Payout,
-    PayoutRequest,
-    PayoutTransaction,
-)
-
-# Constants
-CLIENT_ID = "test-client-id"
-API_KEY = "test-api-key"
-CHECKSUM_KEY = "test-checksum-key"
-BASE_URL = "https://api-test.payos.vn"
+from functools import cache
+from typing import Optional
 
+import pytest
 
-class TestPayouts:
-    """Synchronous tests for Payouts."""
+from payos.types.v1 import PayoutRequest
+from tests.conftest import resolve, success_body
 
-    def test_create_with_generated_idempotency_key(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating payout with auto-generated idempotency key."""
-        payout_request = PayoutRequest(
-            reference_id="referenceId",
-            amount=2000,
-            description="payout",
-            to_bin="970422",
-            to_account_number="0123456789",
-            category=["salary"],
-        )
+# Both v1 payouts modules share the mock-transport clients from tests/resources/v1/conftest.py;
+# keeping them on one xdist worker under --dist loadgroup builds those clients once
+pytestmark = pytest.mark.xdist_group("v1_payouts")
 
-        mock_payout_response = Payout(
-            id="payout-id",
-            reference_id="referenceId",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="referenceId",
-                    amount=2000,
-                    description="payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REFERENCE",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                ),
-            ],
-            category=["salary"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
 
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
+# Requests are only read by the client, so the tests share these instances
+PAYOUT_REQUEST = PayoutRequest(
+    reference_id="referenceId",
+    amount=2000,
+    description="payout",
+    to_bin="970422",
+    to_account_number="0123456789",
+    category=["salary"],
+)
+UNCATEGORIZED_PAYOUT_REQUEST = PAYOUT_REQUEST.model_copy(update={"category": None})
+ESTIMATE_REQUEST = PayoutRequest(
+    reference_id="ref-123",
+    amount=5000,
+    description="salary",
+    to_bin="970422",
+    to_account_number="0123456789",
+    category=["salary"],
+)
 
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-        mock_crypto_sync.create_uuid4.return_value = "generated-uuid"
 
-        result = client.payouts.create(payout_request)
+@cache
+def payout_body(
+    payout_id: str,
+    approval_state: str,
+    category: Optional[tuple[str, ...]],
+    transaction: Optional[tuple[str, str]] = None,
+) -> bytes:
+    """Encoded camelCase response of a payout, built once per distinct shape.
+
+    ``transaction`` is the ``(description, state)`` of the payout's single transaction.
+    """
+    transactions = []
+    if transaction is not None:
+        description, state = transaction
+        failed = state == "FAILED"
+        transactions.append(
+            {
+                "id": "txn-id",
+                "referenceId": "referenceId",
+                "amount": 2000,
+                "description": description,
+                "toBin": "970422",
+                "toAccountNumber": "0123456789",
+                "toAccountName": "NGUYEN VAN A",
+                "reference": None if failed else "FT-REFERENCE",
+                "transactionDatetime": None if failed else "2025-12-12T09:00:00+07:00",
+                "errorMessage": "error message" if failed else None,
+                "errorCode": "error code" if failed else None,
+                "state": state,
+            }
+        )
+    return success_body(
+        {
+            "id": payout_id,
+            "referenceId": "referenceId",
+            "transactions": transactions,
+            "category": list(category) if category is not None else None,
+            "approvalState": approval_state,
+            "createdAt": "2025-12-12T09:00:00+07:00",
+        }
+    )
+
+
+@cache
+def estimate_credit_body(estimate_credit: int) -> bytes:
+    """Encoded response of a credit estimate."""
+    return success_body({"estimateCredit": estimate_credit})
+
+
+LIST_BODY = success_body(
+    {
+        "payouts": [
+            {
+                "id": "payout-1",
+                "referenceId": "ref-1",
+                "transactions": [],
+                "category": ["salary"],
+                "approvalState": "COMPLETED",
+                "createdAt": "2025-12-12T09:00:00+07:00",
+            }
+        ],
+        "pagination": {"limit": 10, "offset": 0, "total": 1, "count": 1, "hasMore": False},
+    }
+)
 
-        assert result.id == "payout-id"
-        assert result.approval_state == "COMPLETED"
 
-    def test_create_with_custom_idempotency_key(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
+# One event loop for the whole session, shared with the session-scoped async client
+@pytest.mark.asyncio(loop_scope="session")
+class TestPayouts:
+    """Tests for Payouts and AsyncPayouts, run against both clients."""
+
+    @pytest.mark.parametrize(
+        "payout_request,idempotency_key",
+        [
+            pytest.param(PAYOUT_REQUEST, None, id="generated_idempotency_key"),
+            pytest.param(PAYOUT_REQUEST, "custom-uuid-12345", id="custom_idempotency_key"),
+            pytest.param(UNCATEGORIZED_PAYOUT_REQUEST, None, id="without_category"),
+        ],
+    )
+    async def test_create(
+        self,
+        mock_routes,
+        client,
+        payout_request: PayoutRequest,
+        idempotency_key: Optional[str],
     ):
-        """Test creating payout with custom idempotency key."""
-        payout_request = PayoutRequest(
-            reference_id="referenceId",
-            amount=2000,
-            description="payout",
-            to_bin="970422",
-            to_account_number="0123456789",
-            category=["salary"],
-        )
-
-        custom_idempotency_key = "custom-uuid-12345"
-
-        mock_payout_response = Payout(
-            id="payout-id",
-            reference_id="referenceId",
-            transactions=[],
-            category=["salary"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
+        """Test creating payout across idempotency key and category variants."""
+        category = tuple(payout_request.category) if payout_request.category else None
+        mock_routes.add(
+            "POST",
+            "/v1/payouts",
+            payout_body("payout-id", "COMPLETED", category, ("payout", "SUCCEEDED")),
         )
 
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
+        result = await resolve(
+            client.payouts.create(payout_request, idempotency_key=idempotency_key)
         )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payouts.create(payout_request, idempotency_key=custom_idempotency_key)
 
         assert result.id == "payout-id"
+        assert result.approval_state == "COMPLETED"
+        assert result.category == payout_request.category
 
-    def test_create_without_category(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating payout without category."""
-        payout_request = PayoutRequest(
-            reference_id="referenceId",
-            amount=2000,
-            description="payout",
-            to_bin="970422",
-            to_account_number="0123456789",
-        )
-
-        mock_payout_response = Payout(
-            id="payout-id",
-            reference_id="referenceId",
-            transactions=[],
-            category=None,
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payouts.create(payout_request)
-
-        assert result.category is None
-
-    def test_get_completed_state(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
+    async def test_get_completed_state(self, mock_routes, client):
         """Test getting payout with COMPLETED state."""
         payout_id = "payout-123"
-        mock_payout = Payout(
-            id=payout_id,
-            reference_id="referenceId",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="referenceId",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REFERENCE",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                )
-            ],
-            category=["salary"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/{payout_id}",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
+        mock_routes.add(
+            "GET",
+            f"/v1/payouts/{payout_id}",
+            payout_body(payout_id, "COMPLETED", ("salary",), ("batch payout", "SUCCEEDED")),
         )
 
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payouts.get(payout_id)
+        result = await resolve(client.payouts.get(payout_id))
 
         assert result.approval_state == "COMPLETED"
 
-    def test_get_failed_state(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
+    async def test_get_failed_state(self, mock_routes, client):
         """Test getting payout with FAILED state."""
         payout_id = "payout-failed"
-        mock_failed_payout = Payout(
-            id=payout_id,
-            reference_id="referenceId",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="referenceId",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference=None,
-                    transaction_datetime=None,
-                    error_message="error message",
-                    error_code="error code",
-                    state="FAILED",
-                )
-            ],
-            category=None,
-            approval_state="FAILED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/{payout_id}",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_failed_payout.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
+        mock_routes.add(
+            "GET",
+            f"/v1/payouts/{payout_id}",
+            payout_body(payout_id, "FAILED", None, ("batch payout", "FAILED")),
         )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
 
-        result = client.payouts.get(payout_id)
+        result = await resolve(client.payouts.get(payout_id))
 
         assert result.approval_state == "FAILED"
         assert result.transactions[0].state == "FAILED"
 
-    def test_estimate_credit_single(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
+    async def test_estimate_credit_single(self, mock_routes, client):
         """Test estimating credit for single payout."""
-        payout_request = PayoutRequest(
-            reference_id="ref-123",
-            amount=5000,
-            description="salary",
-            to_bin="970422",
-            to_account_number="0123456789",
-            category=["salary"],
+        mock_routes.add(
+            "POST", "/v1/payouts/estimate-credit", estimate_credit_body(5100), signed=False
         )
 
-        mock_estimate = EstimateCredit(estimate_credit=5100)
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/estimate-credit",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_estimate.model_dump(by_alias=True),
-            },
-            status_code=200,
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payouts.estimate_credit(payout_request)
+        result = await resolve(client.payouts.estimate_credit(ESTIMATE_REQUEST))
 
         assert result.estimate_credit == 5100
 
-    def test_list_default_pagination(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
+    async def test_list_default_pagination(self, mock_routes, client):
         """Test listing payouts with default pagination."""
-        mock_payout = {
-            "id": "payout-1",
-            "referenceId": "ref-1",
-            "transactions": [],
-            "category": ["salary"],
-            "approvalState": "COMPLETED",
-            "createdAt": "2025-12-12T09:00:00+07:00",
-        }
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": {
-                    "payouts": [mock_payout],
-                    "pagination": {
-                        "limit": 10,
-                        "offset": 0,
-                        "total": 1,
-                        "count": 1,
-                        "hasMore": False,
-                    },
-                },
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payouts.list()
-
-        assert len(result.data) == 1
-        assert result.data[0].id == "payout-1"
-
-
-class TestAsyncPayouts:
-    """Asynchronous tests for AsyncPayouts."""
-
-    @pytest.mark.asyncio
-    async def test_create_with_generated_idempotency_key(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating payout with auto-generated idempotency key."""
-        payout_request = PayoutRequest(
-            reference_id="referenceId",
-            amount=2000,
-            description="payout",
-            to_bin="970422",
-            to_account_number="0123456789",
-            category=["salary"],
-        )
-
-        mock_payout_response = Payout(
-            id="payout-id",
-            reference_id="referenceId",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="referenceId",
-                    amount=2000,
-                    description="payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REFERENCE",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                )
-            ],
-            category=["salary"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-        mock_crypto_async.create_uuid4.return_value = "generated-uuid"
-
-        result = await client.payouts.create(payout_request)
-
-        assert result.id == "payout-id"
-        assert result.approval_state == "COMPLETED"
-
-    @pytest.mark.asyncio
-    async def test_create_with_custom_idempotency_key(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test creating payout with custom idempotency key."""
-        payout_request = PayoutRequest(
-            reference_id="referenceId",
-            amount=2000,
-            description="payout",
-            to_bin="970422",
-            to_account_number="0123456789",
-            category=["salary"],
-        )
-
-        custom_idempotency_key = "custom-uuid-12345"
-
-        mock_payout_response = Payout(
-            id="payout-id",
-            reference_id="referenceId",
-            transactions=[],
-            category=["salary"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout_response.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payouts.create(payout_request, idempotency_key=custom_idempotency_key)
-
-        assert result.id == "payout-id"
-
-    @pytest.mark.asyncio
-    async def test_get_completed_state(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test getting payout with COMPLETED state."""
-        payout_id = "payout-123"
-        mock_payout = Payout(
-            id=payout_id,
-            reference_id="referenceId",
-            transactions=[
-                PayoutTransaction(
-                    id="txn-id",
-                    reference_id="referenceId",
-                    amount=2000,
-                    description="batch payout",
-                    to_bin="970422",
-                    to_account_number="0123456789",
-                    to_account_name="NGUYEN VAN A",
-                    reference="FT-REFERENCE",
-                    transaction_datetime="2025-12-12T09:00:00+07:00",
-                    error_message=None,
-                    error_code=None,
-                    state="SUCCEEDED",
-                )
-            ],
-            category=["salary"],
-            approval_state="COMPLETED",
-            created_at="2025-12-12T09:00:00+07:00",
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/{payout_id}",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_payout.model_dump(by_alias=True),
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payouts.get(payout_id)
-
-        assert result.approval_state == "COMPLETED"
-
-    @pytest.mark.asyncio
-    async def test_estimate_credit_single(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test estimating credit for single payout."""
-        payout_request = PayoutRequest(
-            reference_id="ref-123",
-            amount=5000,
-            description="salary",
-            to_bin="970422",
-            to_account_number="0123456789",
-            category=["salary"],
-        )
-
-        mock_estimate = EstimateCredit(estimate_credit=5100)
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts/estimate-credit",
-            method="POST",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_estimate.model_dump(by_alias=True),
-            },
-            status_code=200,
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payouts.estimate_credit(payout_request)
-
-        assert result.estimate_credit == 5100
-
-    @pytest.mark.asyncio
-    async def test_list_default_pagination(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test listing payouts with default pagination."""
-        mock_payout = {
-            "id": "payout-1",
-            "referenceId": "ref-1",
-            "transactions": [],
-            "category": ["salary"],
-            "approvalState": "COMPLETED",
-            "createdAt": "2025-12-12T09:00:00+07:00",
-        }
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v1/payouts",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": {
-                    "payouts": [mock_payout],
-                    "pagination": {
-                        "limit": 10,
-                        "offset": 0,
-                        "total": 1,
-                        "count": 1,
-                        "hasMore": False,
-                    },
-                },
-            },
-            status_code=200,
-            headers={"x-signature": "mock-signature"},
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
+        mock_routes.add("GET", "/v1/payouts", LIST_BODY)
 
-        result = await client.payouts.list()
+        result = await resolve(client.payouts.list())
 
         assert len(result.data) == 1
         assert result.data[0].id == "payout-1"
@@ -0,0 +1,27 @@
+"""Shared fixtures for v2 payment request tests.
+
+The clients get the fixed-value crypto provider at construction, so neither the tests nor the
+response mocks depend on real signatures.
+"""
+
+import asyncio
+
+import pytest
+
+from payos import AsyncPayOS, PayOS
+
+
+@pytest.fixture(scope="session")
+def payos_client(test_credentials, stub_crypto):
+    """Sync client shared by every payment request test."""
+    client = PayOS(**test_credentials, crypto=stub_crypto)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def async_payos_client(test_credentials, stub_crypto):
+    """Async client shared by every payment request test."""
+    client = AsyncPayOS(**test_credentials, crypto=stub_crypto)
+    yield client
+    asyncio.run(client.aclose())
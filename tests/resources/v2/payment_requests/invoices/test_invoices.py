@@ -1,614 +1,185 @@
 """Tests for invoices resource."""
 
+from typing import Any
+
 import pytest
-from payos import AsyncPayOS, PayOS
-from payos.types.v2 import InvoicesInfo, Invoice
 from pytest_httpx import HTTPXMock
 
-# Constants
-CLIENT_ID = "test-client-id"
-API_KEY = "test-api-key"
-CHECKSUM_KEY = "test-checksum-key"
-BASE_URL = "https://api-test.payos.vn"
+from tests.conftest import resolve, success_json
 
+# Both payment request modules share the session clients from
+# tests/resources/v2/payment_requests/conftest.py; keeping them on one xdist worker under
+# --dist loadgroup builds those clients once
+pytestmark = pytest.mark.xdist_group("v2_payment_requests")
 
+# Constants
+BASE_URL = "https://api-test.payos.vn"
+INVOICE_ID = "invoice-id"
+PAYMENT_LINK_ID = "payment-link-id"
+ORDER_CODE = 12345
+
+# Mocked URLs by payment link ID or order code, built once instead of per test
+INVOICES_URLS = {
+    identifier: f"{BASE_URL}/v2/payment-requests/{identifier}/invoices"
+    for identifier in (PAYMENT_LINK_ID, ORDER_CODE)
+}
+DOWNLOAD_URLS = {
+    identifier: f"{url}/{INVOICE_ID}/download" for identifier, url in INVOICES_URLS.items()
+}
+
+
+def mock_json_get(httpx_mock: HTTPXMock, url: str, data: Any) -> None:
+    """Answer ``GET url`` with ``data`` in the success envelope."""
+    httpx_mock.add_response(url=url, method="GET", json=success_json(data), status_code=200)
+
+
+def mock_download(httpx_mock: HTTPXMock, url: str, content: bytes, headers: dict[str, str]) -> None:
+    """Answer ``GET url`` with a raw file download."""
+    httpx_mock.add_response(
+        url=url, method="GET", content=content, status_code=200, headers=headers
+    )
+
+
+# On-wire camelCase invoices
+ISSUED_INVOICE = {
+    "invoiceId": INVOICE_ID,
+    "invoiceNumber": "INV-001",
+    "issuedTimestamp": 1765504800,
+    "issuedDatetime": "2025-12-12T02:00:00.000Z",
+    "transactionId": "txn-id",
+    "reservationCode": "RES-CODE",
+    "codeOfTax": "TAX-CODE",
+}
+UNISSUED_INVOICE = {"invoiceId": INVOICE_ID}
+
+# ``data`` of the get responses
+SINGLE_INVOICE_DATA = {"invoices": (ISSUED_INVOICE,)}
+ORDER_CODE_INVOICE_DATA = {"invoices": ({**ISSUED_INVOICE, "invoiceNumber": "INV-002"},)}
+MULTIPLE_INVOICES_DATA = {"invoices": (ISSUED_INVOICE, UNISSUED_INVOICE)}
+EMPTY_INVOICES_DATA: dict[str, tuple[dict[str, Any], ...]] = {"invoices": ()}
+
+# (identifier, response data, expected invoice numbers)
+GET_CASES = [
+    pytest.param(
+        PAYMENT_LINK_ID, SINGLE_INVOICE_DATA, ("INV-001",), id="by_payment_link_id_single"
+    ),
+    pytest.param(ORDER_CODE, ORDER_CODE_INVOICE_DATA, ("INV-002",), id="by_order_code"),
+    pytest.param(
+        PAYMENT_LINK_ID, MULTIPLE_INVOICES_DATA, ("INV-001", None), id="multiple_invoices"
+    ),
+    pytest.param(PAYMENT_LINK_ID, EMPTY_INVOICES_DATA, (), id="empty_invoices"),
+]
+
+# (identifier, response body, response headers, expected content type, expected filename)
+DOWNLOAD_CASES = [
+    pytest.param(
+        PAYMENT_LINK_ID,
+        b"mock-pdf-data",
+        {
+            "Content-Type": "application/pdf",
+            "Content-Disposition": 'attachment; filename="invoice.pdf"',
+        },
+        "application/pdf",
+        "invoice.pdf",
+        id="by_payment_link_id",
+    ),
+    pytest.param(
+        ORDER_CODE,
+        b"mock-pdf-data",
+        {
+            "Content-Type": "application/pdf",
+            "Content-Disposition": 'attachment; filename="invoice-12345.pdf"',
+        },
+        "application/pdf",
+        "invoice-12345.pdf",
+        id="by_order_code",
+    ),
+    pytest.param(
+        PAYMENT_LINK_ID,
+        b"mock-data",
+        {
+            "Content-Type": "application/octet-stream",
+            "Content-Disposition": 'attachment; filename="document.bin"',
+        },
+        "application/octet-stream",
+        "document.bin",
+        id="different_content_type",
+    ),
+    pytest.param(
+        PAYMENT_LINK_ID,
+        b"mock-pdf-data",
+        {"Content-Type": "application/pdf"},
+        "application/pdf",
+        "download",
+        id="without_filename",
+    ),
+]
+
+
+# One event loop for the whole session, shared with the session-scoped async client
+@pytest.mark.asyncio(loop_scope="session")
 class TestInvoices:
-    """Synchronous tests for Invoices."""
-
-    def test_get_by_payment_link_id_single(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test getting invoices by payment link ID with single invoice."""
-        payment_link_id = "payment-link-id"
-        mock_invoices_info = InvoicesInfo(
-            invoices=[
-                Invoice(
-                    invoice_id="invoice-id",
-                    invoice_number="INV-001",
-                    issued_timestamp=1765504800,
-                    issued_datetime="2025-12-12T02:00:00.000Z",
-                    transaction_id="txn-id",
-                    reservation_code="RES-CODE",
-                    code_of_tax="TAX-CODE",
-                ),
-            ]
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_invoices_info.model_dump(by_alias=True),
-                "signature": "mock-signature",
-            },
-            status_code=200,
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payment_requests.invoices.get(payment_link_id)
-
-        assert len(result.invoices) == 1
-        assert result.invoices[0].invoice_number == "INV-001"
-
-    def test_get_by_order_code(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test getting invoices by order code."""
-        order_code = 12345
-        mock_invoices_info = InvoicesInfo(
-            invoices=[
-                Invoice(
-                    invoice_id="invoice-id",
-                    invoice_number="INV-002",
-                    issued_timestamp=1765504800,
-                    issued_datetime="2025-12-12T02:00:00.000Z",
-                    transaction_id="txn-id",
-                    reservation_code="RES-CODE",
-                    code_of_tax="TAX-CODE",
-                ),
-            ]
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{order_code}/invoices",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_invoices_info.model_dump(by_alias=True),
-                "signature": "mock-signature",
-            },
-            status_code=200,
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payment_requests.invoices.get(order_code)
-
-        assert result.invoices[0].invoice_number == "INV-002"
-
-    def test_get_multiple_invoices(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test getting multiple invoices."""
-        payment_link_id = "payment-link-id"
-        mock_invoices_info = InvoicesInfo(
-            invoices=[
-                Invoice(
-                    invoice_id="invoice-id",
-                    invoice_number="INV-001",
-                    issued_timestamp=1765504800,
-                    issued_datetime="2025-12-12T02:00:00.000Z",
-                    transaction_id="txn-id",
-                    reservation_code="RES-CODE",
-                    code_of_tax="TAX-CODE",
-                ),
-                Invoice(
-                    invoice_id="invoice-id",
-                ),
-            ]
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_invoices_info.model_dump(by_alias=True),
-                "signature": "mock-signature",
-            },
-            status_code=200,
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payment_requests.invoices.get(payment_link_id)
-
-        assert len(result.invoices) == 2
-        assert result.invoices[0].invoice_number == "INV-001"
-        assert result.invoices[1].invoice_number is None
-
-    def test_get_empty_invoices(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test getting empty invoices list."""
-        payment_link_id = "payment-link-id"
-        mock_invoices_info = InvoicesInfo(invoices=[])
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_invoices_info.model_dump(by_alias=True),
-                "signature": "mock-signature",
-            },
-            status_code=200,
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payment_requests.invoices.get(payment_link_id)
-
-        assert len(result.invoices) == 0
-
-    def test_download_by_payment_link_id(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test downloading invoice by payment link ID."""
-        invoice_id = "invoice-id"
-        payment_link_id = "payment-link-id"
-        mock_pdf_data = b"mock-pdf-data"
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices/{invoice_id}/download",
-            method="GET",
-            content=mock_pdf_data,
-            status_code=200,
-            headers={
-                "Content-Type": "application/pdf",
-                "Content-Disposition": 'attachment; filename="invoice.pdf"',
-            },
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payment_requests.invoices.download(invoice_id, payment_link_id)
-
-        assert result.data == mock_pdf_data
-        assert result.content_type == "application/pdf"
-        assert result.filename == "invoice.pdf"
-
-    def test_download_by_order_code(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test downloading invoice by order code."""
-        invoice_id = "invoice-id"
-        order_code = 12345
-        mock_pdf_data = b"mock-pdf-data"
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{order_code}/invoices/{invoice_id}/download",
-            method="GET",
-            content=mock_pdf_data,
-            status_code=200,
-            headers={
-                "Content-Type": "application/pdf",
-                "Content-Disposition": 'attachment; filename="invoice-12345.pdf"',
-            },
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payment_requests.invoices.download(invoice_id, order_code)
-
-        assert result.data == mock_pdf_data
-        assert result.content_type == "application/pdf"
-        assert result.filename == "invoice-12345.pdf"
-
-    def test_download_different_content_type(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test downloading invoice with different content type."""
-        invoice_id = "invoice-id"
-        payment_link_id = "payment-link-id"
-        mock_data = b"mock-data"
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices/{invoice_id}/download",
-            method="GET",
-            content=mock_data,
-            status_code=200,
-            headers={
-                "Content-Type": "application/octet-stream",
-                "Content-Disposition": 'attachment; filename="document.bin"',
-            },
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payment_requests.invoices.download(invoice_id, payment_link_id)
-
-        assert result.content_type == "application/octet-stream"
-        assert result.filename == "document.bin"
-
-    def test_download_without_filename(
-        self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test downloading invoice without filename in header."""
-        invoice_id = "invoice-id"
-        payment_link_id = "payment-link-id"
-        mock_pdf_data = b"mock-pdf-data"
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices/{invoice_id}/download",
-            method="GET",
-            content=mock_pdf_data,
-            status_code=200,
-            headers={"Content-Type": "application/pdf"},
-        )
-
-        client = PayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_sync)
-
-        result = client.payment_requests.invoices.download(invoice_id, payment_link_id)
-
-        assert result.content_type == "application/pdf"
-        assert result.filename == "download"
-
-
-class TestAsyncInvoices:
-    """Asynchronous tests for AsyncInvoices."""
-
-    @pytest.mark.asyncio
-    async def test_get_by_payment_link_id_single(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test getting invoices by payment link ID with single invoice."""
-        payment_link_id = "payment-link-id"
-        mock_invoices_info = InvoicesInfo(
-            invoices=[
-                Invoice(
-                    invoice_id="invoice-id",
-                    invoice_number="INV-001",
-                    issued_timestamp=1765504800,
-                    issued_datetime="2025-12-12T02:00:00.000Z",
-                    transaction_id="txn-id",
-                    reservation_code="RES-CODE",
-                    code_of_tax="TAX-CODE",
-                ),
-            ]
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_invoices_info.model_dump(by_alias=True),
-                "signature": "mock-signature",
-            },
-            status_code=200,
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payment_requests.invoices.get(payment_link_id)
-
-        assert len(result.invoices) == 1
-        assert result.invoices[0].invoice_number == "INV-001"
-
-    @pytest.mark.asyncio
-    async def test_get_by_order_code(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test getting invoices by order code."""
-        order_code = 12345
-        mock_invoices_info = InvoicesInfo(
-            invoices=[
-                Invoice(
-                    invoice_id="invoice-id",
-                    invoice_number="INV-002",
-                    issued_timestamp=1765504800,
-                    issued_datetime="2025-12-12T02:00:00.000Z",
-                    transaction_id="txn-id",
-                    reservation_code="RES-CODE",
-                    code_of_tax="TAX-CODE",
-                ),
-            ]
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{order_code}/invoices",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_invoices_info.model_dump(by_alias=True),
-                "signature": "mock-signature",
-            },
-            status_code=200,
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payment_requests.invoices.get(order_code)
-
-        assert result.invoices[0].invoice_number == "INV-002"
-
-    @pytest.mark.asyncio
-    async def test_get_multiple_invoices(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test getting multiple invoices."""
-        payment_link_id = "payment-link-id"
-        mock_invoices_info = InvoicesInfo(
-            invoices=[
-                Invoice(
-                    invoice_id="invoice-id",
-                    invoice_number="INV-001",
-                    issued_timestamp=1765504800,
-                    issued_datetime="2025-12-12T02:00:00.000Z",
-                    transaction_id="txn-id",
-                    reservation_code="RES-CODE",
-                    code_of_tax="TAX-CODE",
-                ),
-                Invoice(
-                    invoice_id="invoice-id",
-                ),
-            ]
-        )
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_invoices_info.model_dump(by_alias=True),
-                "signature": "mock-signature",
-            },
-            status_code=200,
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payment_requests.invoices.get(payment_link_id)
-
-        assert len(result.invoices) == 2
-        assert result.invoices[0].invoice_number == "INV-001"
-        assert result.invoices[1].invoice_number is None
-
-    @pytest.mark.asyncio
-    async def test_get_empty_invoices(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test getting empty invoices list."""
-        payment_link_id = "payment-link-id"
-        mock_invoices_info = InvoicesInfo(invoices=[])
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices",
-            method="GET",
-            json={
-                "code": "00",
-                "desc": "success",
-                "data": mock_invoices_info.model_dump(by_alias=True),
-                "signature": "mock-signature",
-            },
-            status_code=200,
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payment_requests.invoices.get(payment_link_id)
-
-        assert len(result.invoices) == 0
-
-    @pytest.mark.asyncio
-    async def test_download_by_payment_link_id(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test downloading invoice by payment link ID."""
-        invoice_id = "invoice-id"
-        payment_link_id = "payment-link-id"
+    """Tests for Invoices and AsyncInvoices, run against both clients."""
+
+    @pytest.mark.parametrize("identifier,data,expected_numbers", GET_CASES)
+    async def test_get(
+        self,
+        httpx_mock: HTTPXMock,
+        client,
+        identifier,
+        data,
+        expected_numbers,
+    ):
+        """Test getting invoices by payment link ID or order code."""
+        mock_json_get(httpx_mock, INVOICES_URLS[identifier], data)
+
+        result = await resolve(client.payment_requests.invoices.get(identifier))
+
+        assert tuple(invoice.invoice_number for invoice in result.invoices) == expected_numbers
+
+    @pytest.mark.parametrize(
+        "identifier,content,headers,expected_content_type,expected_filename", DOWNLOAD_CASES
+    )
+    async def test_download(
+        self,
+        httpx_mock: HTTPXMock,
+        client,
+        identifier,
+        content,
+        headers,
+        expected_content_type,
+        expected_filename,
+    ):
+        """Test downloading invoice by payment link ID or order code."""
+        mock_download(httpx_mock, DOWNLOAD_URLS[identifier], content, headers)
+
+        result = await resolve(client.payment_requests.invoices.download(INVOICE_ID, identifier))
+
+        assert (result.data, result.content_type, result.filename) == (
+            content,
+            expected_content_type,
+            expected_filename,
+        )
+
+    async def test_stream_download(self, httpx_mock: HTTPXMock, client, tmp_path):
+        """Test streaming invoice download to a directory."""
         mock_pdf_data = b"mock-pdf-data"
 
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices/{invoice_id}/download",
-            method="GET",
-            content=mock_pdf_data,
-            status_code=200,
-            headers={
+        mock_download(
+            httpx_mock,
+            DOWNLOAD_URLS[PAYMENT_LINK_ID],
+            mock_pdf_data,
+            {
                 "Content-Type": "application/pdf",
                 "Content-Disposition": 'attachment; filename="invoice.pdf"',
             },
         )
 
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payment_requests.invoices.download(invoice_id, payment_link_id)
-
-        assert result.data == mock_pdf_data
-        assert result.content_type == "application/pdf"
-        assert result.filename == "invoice.pdf"
-
-    @pytest.mark.asyncio
-    async def test_download_by_order_code(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test downloading invoice by order code."""
-        invoice_id = "invoice-id"
-        order_code = 12345
-        mock_pdf_data = b"mock-pdf-data"
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{order_code}/invoices/{invoice_id}/download",
-            method="GET",
-            content=mock_pdf_data,
-            status_code=200,
-            headers={
-                "Content-Type": "application/pdf",
-                "Content-Disposition": 'attachment; filename="invoice-12345.pdf"',
-            },
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
+        result = await resolve(
+            client.payment_requests.invoices.stream_download(
+                INVOICE_ID, PAYMENT_LINK_ID, str(tmp_path)
+            )
         )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payment_requests.invoices.download(invoice_id, order_code)
-
-        assert result.data == mock_pdf_data
-        assert result.content_type == "application/pdf"
-        assert result.filename == "invoice-12345.pdf"
-
-    @pytest.mark.asyncio
-    async def test_download_different_content_type(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test downloading invoice with different content type."""
-        invoice_id = "invoice-id"
-        payment_link_id = "payment-link-id"
-        mock_data = b"mock-data"
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices/{invoice_id}/download",
-            method="GET",
-            content=mock_data,
-            status_code=200,
-            headers={
-                "Content-Type": "application/octet-stream",
-                "Content-Disposition": 'attachment; filename="document.bin"',
-            },
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payment_requests.invoices.download(invoice_id, payment_link_id)
-
-        assert result.content_type == "application/octet-stream"
-        assert result.filename == "document.bin"
-
-    @pytest.mark.asyncio
-    async def test_download_without_filename(
-        self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
-    ):
-        """Test downloading invoice without filename in header."""
-        invoice_id = "invoice-id"
-        payment_link_id = "payment-link-id"
-        mock_pdf_data = b"mock-pdf-data"
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v2/payment-requests/{payment_link_id}/invoices/{invoice_id}/download",
-            method="GET",
-            content=mock_pdf_data,
-            status_code=200,
-            headers={"Content-Type": "application/pdf"},
-        )
-
-        client = AsyncPayOS(
-            client_id=CLIENT_ID,
-            api_key=API_KEY,
-            checksum_key=CHECKSUM_KEY,
-            base_url=BASE_URL,
-        )
-        monkeypatch.setattr(client, "crypto", mock_crypto_async)
-
-        result = await client.payment_requests.invoices.download(invoice_id, payment_link_id)
 
-        assert result.content_type == "application/pdf"
-        assert result.filename == "download"
+        assert result == str(tmp_path / "invoice.pdf")
+        assert (tmp_path / "invoice.pdf").read_bytes() == mock_pdf_data
@@ -201,6 +201,45 @@ class TestWebhooks:
         with pytest.raises(WebhookError, match="Data not integrity"):
             client.webhooks.verify(webhook)
 
+    def test_verify_non_ascii_signature(self):
+        """Test webhook verification fails cleanly when the signature is not ASCII."""
+        valid_webhook_data = WebhookData(
+            account_number="0123456789",
+            amount=20000,
+            description="thanh toan",
+            reference="FT-REFERENCE",
+            transaction_date_time="2025-12-12 09:00:00",
+            virtual_account_number="",
+            counter_account_bank_id="01202001",
+            counter_account_bank_name="",
+            counter_account_name="NGUYEN VAN A",
+            counter_account_number="9876543210",
+            virtual_account_name="",
+            currency="VND",
+            order_code=0,
+            payment_link_id="payment-link-id",
+            code="00",
+            desc="success",
+        )
+
+        webhook = Webhook(
+            code="00",
+            desc="success",
+            success=True,
+            data=valid_webhook_data,
+            signature="é" * 64,
+        )
+
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+        )
+
+        with pytest.raises(WebhookError, match="Data not integrity"):
+            client.webhooks.verify(webhook)
+
     def test_confirm_webhook_url(
         self, httpx_mock: HTTPXMock, mock_crypto_sync, monkeypatch: pytest.MonkeyPatch
     ):
@@ -694,6 +733,46 @@ class TestAsyncWebhooks:
         with pytest.raises(WebhookError, match="Data not integrity"):
             await client.webhooks.verify(webhook)
 
+    @pytest.mark.asyncio
+    async def test_verify_non_ascii_signature(self):
+        """Test webhook verification fails cleanly when the signature is not ASCII."""
+        valid_webhook_data = WebhookData(
+            account_number="0123456789",
+            amount=20000,
+            description="thanh toan",
+            reference="FT-REFERENCE",
+            transaction_date_time="2025-12-12 09:00:00",
+            virtual_account_number="",
+            counter_account_bank_id="01202001",
+            counter_account_bank_name="",
+            counter_account_name="NGUYEN VAN A",
+            counter_account_number="9876543210",
+            virtual_account_name="",
+            currency="VND",
+            order_code=0,
+            payment_link_id="payment-link-id",
+            code="00",
+            desc="success",
+        )
+
+        webhook = Webhook(
+            code="00",
+            desc="success",
+            success=True,
+            data=valid_webhook_data,
+            signature="é" * 64,
+        )
+
+        client = AsyncPayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+        )
+
+        with pytest.raises(WebhookError, match="Data not integrity"):
+            await client.webhooks.verify(webhook)
+
     @pytest.mark.asyncio
     async def test_confirm_webhook_url(
         self, httpx_mock: HTTPXMock, mock_crypto_async, monkeypatch: pytest.MonkeyPatch
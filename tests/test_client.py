@@ -1,19 +1,23 @@
 """Tests for synchronous PayOS client."""
 
+import json
+import sys
+
+import httpx
 import pytest
-from pytest_httpx import HTTPXMock
+from pytest_httpx import HTTPXMock, IteratorStream
 
 from payos import (
-    PayOS,
-    PayOSError,
     APIError,
     BadRequestError,
-    UnauthorizedError,
-    NotFoundError,
     InternalServerError,
     InvalidSignatureError,
+    NotFoundError,
+    PayOS,
+    PayOSError,
+    UnauthorizedError,
 )
-from payos._client import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, DEFAULT_MAX_RETRIES
+from payos._client import DEFAULT_BASE_URL, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT
 
 # Constants
 CLIENT_ID = "test-client-id"
@@ -23,6 +27,20 @@ BASE_URL = "https://api-test.payos.vn"
 PARTNER_CODE = "test-partner-code"
 
 
+class TrackedByteStream(httpx.SyncByteStream):
+    """Response body stream that records whether it was closed."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self.closed = False
+
+    def __iter__(self):
+        yield self.content
+
+    def close(self) -> None:
+        self.closed = True
+
+
 class TestPayOSInitialization:
     """Test PayOS client initialization."""
 
@@ -152,6 +170,54 @@ class TestPayOSInitialization:
         ) as client:
             assert client is not None
 
+    def test_http_limits_applied_to_default_http_client(self):
+        """Test http_limits configures the connection pool of the default http client."""
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            http_limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+
+        pool = client._http_client._transport._pool
+        assert pool._max_connections == 100
+        assert pool._max_keepalive_connections == 50
+
+    def test_crypto_provider_can_be_injected(self, mock_crypto_sync):
+        """Test a crypto provider passed to the constructor replaces the default one."""
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            crypto=mock_crypto_sync,
+        )
+
+        assert client.crypto is mock_crypto_sync
+
+    def test_http2_without_h2_package_raises_error(self, monkeypatch: pytest.MonkeyPatch):
+        """Test http2=True fails early with an install hint when h2 is missing."""
+        monkeypatch.setitem(sys.modules, "h2", None)
+
+        with pytest.raises(PayOSError, match="payos\\[http2\\]"):
+            PayOS(
+                client_id=CLIENT_ID,
+                api_key=API_KEY,
+                checksum_key=CHECKSUM_KEY,
+                http2=True,
+            )
+
+    def test_http2_enabled_on_default_http_client(self):
+        """Test http2=True makes the default http client negotiate HTTP/2."""
+        pytest.importorskip("h2")
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            http2=True,
+        )
+
+        assert client._http_client._transport._pool._http2 is True
+
 
 class TestPayOSHeaders:
     """Test header building."""
@@ -655,6 +721,263 @@ class TestPayOSHttpMethods:
         assert result.content_type == "text/plain"
         assert result.size == len(file_content)
 
+    def test_stream_download_to_directory(self, httpx_mock: HTTPXMock, tmp_path):
+        """Test streaming download into a directory uses the response filename."""
+        file_content = b"test file content" * 10000
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{BASE_URL}/files/test.txt",
+            content=file_content,
+            headers={
+                "content-type": "text/plain",
+                "content-disposition": 'attachment; filename="report.txt"',
+            },
+        )
+
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+        )
+
+        result = client.stream_download("/files/test.txt", str(tmp_path), chunk_size=1024)
+
+        assert result == str(tmp_path / "report.txt")
+        assert (tmp_path / "report.txt").read_bytes() == file_content
+
+    def test_stream_download_to_file_path(self, httpx_mock: HTTPXMock, tmp_path):
+        """Test streaming download to an explicit file path."""
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{BASE_URL}/files/test.txt",
+            content=b"test file content",
+        )
+
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+        )
+
+        filepath = tmp_path / "nested" / "out.txt"
+        result = client.stream_download("/files/test.txt", str(filepath))
+
+        assert result == str(filepath)
+        assert filepath.read_bytes() == b"test file content"
+
+    def test_stream_download_keeps_server_filename_inside_directory(
+        self, httpx_mock: HTTPXMock, tmp_path
+    ):
+        """Test a Content-Disposition filename with parent references cannot leave the directory."""
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{BASE_URL}/files/test.txt",
+            content=b"test file content",
+            headers={"content-disposition": 'attachment; filename="../../escaped.txt"'},
+        )
+        destination = tmp_path / "downloads"
+        destination.mkdir()
+
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+        )
+
+        result = client.stream_download("/files/test.txt", str(destination))
+
+        assert result == str(destination / "escaped.txt")
+        assert (destination / "escaped.txt").read_bytes() == b"test file content"
+        assert [path.name for path in tmp_path.iterdir()] == ["downloads"]
+
+    def test_stream_download_rejects_parent_directory_filename(
+        self, httpx_mock: HTTPXMock, tmp_path
+    ):
+        """Test a Content-Disposition filename of ``..`` is rejected before anything is written."""
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{BASE_URL}/files/test.txt",
+            content=b"test file content",
+            headers={"content-disposition": 'attachment; filename=".."'},
+        )
+
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+        )
+
+        with pytest.raises(ValueError, match="No filename available"):
+            client.stream_download("/files/test.txt", str(tmp_path))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_stream_download_interrupted_leaves_no_file(self, httpx_mock: HTTPXMock, tmp_path):
+        """Test a download that fails mid-stream neither creates nor truncates the file."""
+
+        def interrupted_stream():
+            yield b"first chunk"
+            raise httpx.ReadError("connection lost")
+
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{BASE_URL}/files/test.txt",
+            stream=IteratorStream(interrupted_stream()),
+        )
+        filepath = tmp_path / "out.txt"
+        filepath.write_bytes(b"previous download")
+
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+        )
+
+        with pytest.raises(httpx.ReadError):
+            client.stream_download("/files/test.txt", str(filepath))
+
+        assert filepath.read_bytes() == b"previous download"
+        assert [path.name for path in tmp_path.iterdir()] == ["out.txt"]
+
+    def test_stream_download_error_does_not_write_file(self, httpx_mock: HTTPXMock, tmp_path):
+        """Test streaming download raises APIError and writes nothing on failure."""
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{BASE_URL}/files/test.txt",
+            status_code=404,
+            json={"code": "404", "desc": "Not found"},
+        )
+
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+        )
+
+        with pytest.raises(NotFoundError):
+            client.stream_download("/files/test.txt", str(tmp_path / "out.txt"))
+
+        assert not (tmp_path / "out.txt").exists()
+
+    @pytest.mark.parametrize(
+        ("status_code", "payload"),
+        [
+            (200, {"code": "00", "desc": "success", "data": {"id": "123"}}),
+            (400, {"code": "20", "desc": "Invalid request"}),
+        ],
+    )
+    def test_response_stream_closed_after_request(self, status_code, payload):
+        """Test the response body is drained and closed so the connection returns to the pool."""
+        streams: list[TrackedByteStream] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            stream = TrackedByteStream(json.dumps(payload).encode())
+            streams.append(stream)
+            return httpx.Response(
+                status_code, headers={"content-type": "application/json"}, stream=stream
+            )
+
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+
+        if status_code == 200:
+            assert client.post("/test", cast_to=dict, body={"field": "value"}) == {"id": "123"}
+        else:
+            with pytest.raises(BadRequestError):
+                client.post("/test", cast_to=dict, body={"field": "value"})
+
+        assert len(streams) == 1
+        assert streams[0].closed
+
+    def test_non_get_request_invalidates_response_cache(self, httpx_mock: HTTPXMock):
+        """Test a write request clears cached responses for the same collection."""
+        from payos._core import FinalRequestOptions
+
+        httpx_mock.add_response(
+            method="POST",
+            url=f"{BASE_URL}/v1/payouts/batch",
+            json={"code": "00", "desc": "success", "data": {"id": "123"}},
+        )
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+            response_cache=True,
+        )
+        cached_options = FinalRequestOptions(method="GET", path="/v1/payouts", query={"limit": 2})
+        client._response_cache.set(cached_options, dict, {"payouts": []})
+
+        client.post("/v1/payouts/batch", cast_to=dict, body={"field": "value"})
+
+        assert client._response_cache.get(cached_options, dict) is None
+
+    def test_non_get_request_with_base_url_override_invalidates_response_cache(
+        self, httpx_mock: HTTPXMock
+    ):
+        """Test a write sent to an overridden base URL clears what was cached under it."""
+        from payos._core import FinalRequestOptions
+
+        other_url = "https://other.payos.vn/"
+        httpx_mock.add_response(
+            method="POST",
+            url=f"{other_url}v1/payouts/batch",
+            json={"code": "00", "desc": "success", "data": {"id": "123"}},
+        )
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+            response_cache=True,
+        )
+        overridden_options = FinalRequestOptions(
+            method="GET", url=other_url, path="/v1/payouts", query={"limit": 2}
+        )
+        balance_options = FinalRequestOptions(
+            method="GET", url=other_url, path="/v1/payouts-account/balance"
+        )
+        default_options = FinalRequestOptions(method="GET", path="/v1/payouts", query={"limit": 2})
+        client._response_cache.set(overridden_options, dict, {"payouts": ["other"]})
+        client._response_cache.set(balance_options, dict, {"balance": 1})
+        client._response_cache.set(default_options, dict, {"payouts": []})
+
+        client.post("/v1/payouts/batch", cast_to=dict, body={"field": "value"}, url=other_url)
+
+        assert client._response_cache.get(overridden_options, dict) is None
+        assert client._response_cache.get(balance_options, dict) == {"balance": 1}
+        assert client._response_cache.get(default_options, dict) == {"payouts": []}
+
+    def test_response_cache_disabled_by_default(self):
+        """Test clients do not cache responses unless asked to."""
+        client = PayOS(client_id=CLIENT_ID, api_key=API_KEY, checksum_key=CHECKSUM_KEY)
+
+        assert client._response_cache is None
+
+    def test_response_cache_ttl_is_configurable(self):
+        """Test response_cache_ttl sets how long cached responses stay valid."""
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            response_cache=True,
+            response_cache_ttl=5,
+        )
+
+        assert client._response_cache is not None
+        assert client._response_cache.ttl == 5
+
 
 class TestPayOSRetryAndTimeout:
     """Test retry and timeout logic."""
@@ -844,6 +1167,27 @@ class TestPayOSRetryAndTimeout:
         # Should only attempt once (no retries)
         assert len(httpx_mock.get_requests()) == 1
 
+    def test_request_level_max_retries_overrides_client(self, httpx_mock: HTTPXMock):
+        """Test request-level max_retries overrides client setting for status retries."""
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{BASE_URL}/test",
+            status_code=500,
+        )
+
+        client = PayOS(
+            client_id=CLIENT_ID,
+            api_key=API_KEY,
+            checksum_key=CHECKSUM_KEY,
+            base_url=BASE_URL,
+            max_retries=2,
+        )
+
+        with pytest.raises(InternalServerError):
+            client.get("/test", cast_to=dict, max_retries=0)
+
+        assert len(httpx_mock.get_requests()) == 1
+
 
 class TestPayOSSignature:
     """Test signature verification."""
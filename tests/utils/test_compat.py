@@ -0,0 +1,62 @@
+"""Tests for legacy v0.x compatibility utilities."""
+
+import hashlib
+import hmac
+
+from payos.utils._compat import (
+    _convert_obj_to_query_str,
+    _convert_obj_to_sorted_query_str,
+    _create_signature_from_obj,
+    _sort_obj_data_by_key,
+)
+
+CHECKSUM_KEY = "test_checksum_key"
+
+
+class TestConvertObjToSortedQueryStr:
+    """Test the fused sort + stringify helper."""
+
+    def test_matches_sort_then_convert(self):
+        """Test single-pass output equals sorting then converting."""
+        data = {
+            "orderCode": 123,
+            "amount": 1000,
+            "success": True,
+            "counterAccountName": None,
+            "items": [{"quantity": 1, "name": "Mi tom"}],
+        }
+
+        expected = _convert_obj_to_query_str(_sort_obj_data_by_key(data))
+
+        assert _convert_obj_to_sorted_query_str(data) == expected
+
+
+class TestCreateSignatureFromObj:
+    """Test _create_signature_from_obj."""
+
+    def test_signature_matches_hmac_of_sorted_query(self):
+        """Test the signature is the HMAC of the key-sorted query string."""
+        data = {"orderCode": 123, "amount": 1000, "description": "VQRIO123"}
+        expected = hmac.new(
+            CHECKSUM_KEY.encode("utf-8"),
+            msg=b"amount=1000&description=VQRIO123&orderCode=123",
+            digestmod=hashlib.sha256,
+        ).hexdigest()
+
+        assert _create_signature_from_obj(data, CHECKSUM_KEY) == expected
+
+    def test_key_order_does_not_change_signature(self):
+        """Test payloads differing only in key order get the same signature."""
+        first = _create_signature_from_obj({"a": 1, "b": 2}, CHECKSUM_KEY)
+        second = _create_signature_from_obj({"b": 2, "a": 1}, CHECKSUM_KEY)
+
+        assert first == second
+
+    def test_different_checksum_key_changes_signature(self):
+        """Test rotating the checksum key produces a new signature."""
+        data = {"amount": 1000}
+
+        first = _create_signature_from_obj(data, CHECKSUM_KEY)
+        second = _create_signature_from_obj(data, "rotated_checksum_key")
+
+        assert first != second
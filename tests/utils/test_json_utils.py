@@ -5,8 +5,11 @@ import json
 import httpx
 import pytest
 
+from payos.utils import json_utils
 from payos.utils.json_utils import (
     build_query_string,
+    json_dumps,
+    json_loads,
     request_to_dict,
     response_to_dict,
     safe_json_parse,
@@ -51,6 +54,41 @@ class TestSafeJsonParse:
         result = safe_json_parse('{"message": "Hello\\nWorld"}')
         assert result == {"message": "Hello\nWorld"}
 
+    def test_parses_bytes(self):
+        """Test parsing raw UTF-8 bytes without decoding first."""
+        result = safe_json_parse('{"desc": "Thành công"}'.encode())
+        assert result == {"desc": "Thành công"}
+
+    def test_returns_none_for_invalid_utf8_bytes(self):
+        """Test that undecodable bytes return None."""
+        result = safe_json_parse(b'{"a": "\xff"}')
+        assert result is None
+
+
+class TestJsonDumpsLoads:
+    """Test json_dumps and json_loads functions."""
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_round_trip(self, monkeypatch: pytest.MonkeyPatch, has_orjson: bool):
+        """Test values survive a dumps/loads round trip with either backend."""
+        if has_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(json_utils, "HAS_ORJSON", has_orjson)
+        data = {"orderCode": 123, "amount": 1000, "items": [{"name": "Mì tôm"}], "ok": True}
+
+        assert json_loads(json_dumps(data)) == data
+
+    def test_stdlib_fallback_matches_json_dumps(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that without orjson the output equals json.dumps."""
+        monkeypatch.setattr(json_utils, "HAS_ORJSON", False)
+        data = {"amount": 1000, "description": "VQRIO123"}
+
+        assert json_dumps(data) == json.dumps(data)
+
+    def test_non_string_keys_fall_back_to_stdlib(self):
+        """Test payloads orjson rejects are still serialized."""
+        assert json_loads(json_dumps({1: "a"})) == {"1": "a"}
+
 
 class TestBuildQueryString:
     """Test build_query_string function."""